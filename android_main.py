@@ -1,6 +1,5 @@
 import orjson
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from src.localize_creater.android_xml_writer import android_xml_string, write_android_xml
 from src.sdk.sdk import sdk_list
 from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
 import os
@@ -23,21 +22,19 @@ def create_android():
     os.makedirs(android_output_dir, exist_ok=True)
 
     # Generate base language (default) strings.xml
-    with open(f"./sample_data/sample_{localize_creater.base_language_code}.json", "r") as f:
+    with open(f"./sample_data/sample_{localize_creater.base_language_code}.json", "rb") as f:
         data_base = orjson.loads(f.read())
-        xml_content = create_android_xml(data_base, localize_creater.base_language_code)
-        with open(f"{android_output_dir}/strings.xml", "w", encoding="utf-8") as g:
-            g.write(xml_content)
+        with open(f"{android_output_dir}/strings.xml", "wb") as g:
+            write_android_xml(g, data_base)
 
     # Generate localized strings.xml files for each target language
     for target_language_code in localize_creater.target_language_code_list:
-        with open(f"./sample_data/sample_{target_language_code}.json", "r") as f:
-            data_target = orjson.loads(f.read())            
-            xml_content = create_android_xml(data_target, target_language_code)
+        with open(f"./sample_data/sample_{target_language_code}.json", "rb") as f:
+            data_target = orjson.loads(f.read())
             lang_dir = f"{android_output_dir}/values-{target_language_code}"
             os.makedirs(lang_dir, exist_ok=True)
-            with open(f"{lang_dir}/strings.xml", "w", encoding="utf-8") as g:
-                g.write(xml_content)
+            with open(f"{lang_dir}/strings.xml", "wb") as g:
+                write_android_xml(g, data_target)
     print("Android XML localization files generated successfully!")
     print(f"Files created in: {android_output_dir}")
     print("- strings.xml (default/base language)")
@@ -56,11 +53,4 @@ def create_android_xml(data, language_code):
     Returns:
         str: Formatted XML string for Android string resources
     """
-    root = ET.Element("resources")
-    for key, value in data.items():
-        string_elem = ET.SubElement(root, "string")
-        string_elem.set("name", key)
-        string_elem.text = value
-    rough_string = ET.tostring(root, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="    ")
\ No newline at end of file
+    return android_xml_string(data)
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Generate synthetic unified catalogs for benchmarking
+
+Usage: python -m benchmark.catalog_generator OUTPUT_DIR [--keys 1000] [--languages 4] ...
+"""
+import argparse
+import os
+import random
+import sys
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.locale_code.code_list import code_list
+
+LETTERS = "abcdefghijklmnopqrstuvwxyzäöüéèçñあいうえおカキクケコ日本語مرحبا"
+PARAMETER_FORMATS = ["%{index}$s", "%{index}$d", "%{index}$.2f"]
+
+
+def pick_language_codes(languages, base_language_code="en"):
+    """
+    Pick valid language codes for a synthetic catalog set
+
+    Args:
+        languages (int): Total number of languages including the base language
+        base_language_code (str): Base language code
+
+    Returns:
+        list: Language codes, base language first
+    """
+    others = [code for code in code_list if code != base_language_code]
+    return [base_language_code] + others[:languages - 1]
+
+
+def generate_value(rng, value_length, placeholder_density):
+    """
+    Generate one unified string value
+
+    Args:
+        rng (random.Random): Random generator
+        value_length (int): Approximate number of characters
+        placeholder_density (float): Probability (0.0 - 1.0) that the value contains parameters
+
+    Returns:
+        str: Synthetic value with Android-style parameters
+    """
+    words = []
+    length = 0
+    while length < value_length:
+        word = "".join(rng.choice(LETTERS) for _ in range(rng.randint(2, 8)))
+        words.append(word)
+        length += len(word) + 1
+    if rng.random() < placeholder_density:
+        for index in range(1, rng.randint(1, 3) + 1):
+            parameter = rng.choice(PARAMETER_FORMATS).format(index=index)
+            words.insert(rng.randint(0, len(words)), parameter)
+    return " ".join(words)
+
+
+def generate_catalog(keys, value_length=20, placeholder_density=0.2, seed=0):
+    """
+    Generate one synthetic catalog
+
+    Args:
+        keys (int): Number of keys
+        value_length (int): Approximate number of characters per value
+        placeholder_density (float): Share of values with parameters (0.0 - 1.0)
+        seed (int): Random seed
+
+    Returns:
+        dict: Synthetic catalog
+    """
+    rng = random.Random(seed)
+    return {f"key_{i}": generate_value(rng, value_length, placeholder_density) for i in range(keys)}
+
+
+def generate_catalogs(output_dir, keys, languages, value_length=20, placeholder_density=0.2, seed=0):
+    """
+    Write a synthetic sample_{lang}.json set
+
+    Args:
+        output_dir (str): Directory to write the catalogs to
+        keys (int): Number of keys per language
+        languages (int): Total number of languages including the base language
+        value_length (int): Approximate number of characters per value
+        placeholder_density (float): Share of values with parameters (0.0 - 1.0)
+        seed (int): Random seed
+
+    Returns:
+        list: Generated language codes, base language first
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    language_codes = pick_language_codes(languages)
+    for position, lang_code in enumerate(language_codes):
+        catalog = generate_catalog(keys, value_length, placeholder_density, seed + position)
+        with open(f"{output_dir}/sample_{lang_code}.json", "wb") as f:
+            f.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2))
+    return language_codes
+
+
+def add_catalog_arguments(parser):
+    parser.add_argument("--keys", type=int, default=1000, help="Keys per language (default: 1000)")
+    parser.add_argument("--languages", type=int, default=4, help="Languages including the base (default: 4)")
+    parser.add_argument("--value-length", type=int, default=20, help="Characters per value (default: 20)")
+    parser.add_argument("--placeholder-density", type=float, default=0.2,
+                        help="Share of values with parameters, 0.0 - 1.0 (default: 0.2)")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_dir")
+    add_catalog_arguments(parser)
+    args = parser.parse_args()
+    language_codes = generate_catalogs(args.output_dir, args.keys, args.languages,
+                                       args.value_length, args.placeholder_density, args.seed)
+    print(f"Generated {len(language_codes)} catalogs with {args.keys} keys in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure the placeholder-free fast path of the parameter converters
+
+Usage: python -m benchmark.fast_path_benchmark [--keys 50000] [--literal-ratio 0.85]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmark.catalog_generator import generate_catalog
+from src.localize_creater.parameter_converter import clear_conversion_cache, get_converter
+from src.localize_creater.parameter_tokenizer import placeholders, tokenize
+
+PLATFORMS = ['flutter', 'xcode', 'react']
+
+
+def convert_fast(catalog):
+    for platform in PLATFORMS:
+        convert = get_converter(platform).convert
+        for value in catalog.values():
+            convert(value)
+    for value in catalog.values():
+        placeholders(value)
+
+
+def convert_full(catalog):
+    # The same work without the '%' pre-check: every value is tokenized and rendered
+    for platform in PLATFORMS:
+        render = get_converter(platform).render
+        for value in catalog.values():
+            render(tokenize(value))
+    for value in catalog.values():
+        tokenize(value)
+
+
+def clear_caches():
+    # Both the token cache and the conversion LRU would otherwise serve warm hits after the first run
+    tokenize.cache_clear()
+    clear_conversion_cache()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keys", type=int, default=50000)
+    parser.add_argument("--literal-ratio", type=float, default=0.85)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    catalog = generate_catalog(args.keys, placeholder_density=1.0 - args.literal_ratio)
+    # Start every run with cold caches
+    full = min(timeit.repeat(lambda: convert_full(catalog), setup=clear_caches,
+                             number=1, repeat=args.repeat))
+    fast = min(timeit.repeat(lambda: convert_fast(catalog), setup=clear_caches,
+                             number=1, repeat=args.repeat))
+    print(f"keys: {args.keys}, literal ratio: {args.literal_ratio}")
+    print(f"full pipeline: {full * 1000:.1f} ms")
+    print(f"fast path:     {fast * 1000:.1f} ms ({full / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Time every emitter and the parameter converter on a synthetic catalog set
+
+Usage: python -m benchmark.run_benchmark [--keys 1000] [--languages 4] [--report report.json]
+"""
+import argparse
+import contextlib
+import io
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import orjson
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmark.catalog_generator import add_catalog_arguments, generate_catalogs
+from src.localize_creater.localize_creater import PLATFORM_LIST
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+from src.localize_creater.parameter_converter import clear_conversion_cache
+from src.localize_creater.parameter_tokenizer import tokenize
+
+
+def _summarize(timings):
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "runs": len(timings),
+    }
+
+
+def _clear_caches():
+    # Every run starts with a cold token cache and a cold conversion LRU
+    tokenize.cache_clear()
+    clear_conversion_cache()
+
+
+def _time_runs(func, repeat, setup=None):
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return _summarize(timings)
+
+
+def benchmark_emitters(localize_creater, repeat):
+    """
+    Time each create_* emitter on its own, including loading its catalogs
+
+    Args:
+        localize_creater (LocalizeCreater): Configured creater
+        repeat (int): Runs per emitter
+
+    Returns:
+        dict: Timing summary keyed by platform
+    """
+    emitters = {
+        "android": lambda: localize_creater.create_android(use_unified=False),
+        "flutter": localize_creater.create_flutter,
+        "xcode": lambda: localize_creater.create_xcode(use_unified=False),
+        "react": localize_creater.create_react,
+    }
+    results = {}
+    for platform_name, emitter in emitters.items():
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                emitter()
+        results[platform_name] = _time_runs(run, repeat, setup=_clear_caches)
+    return results
+
+
+def benchmark_converter(localize_creater, repeat):
+    """
+    Time convert_parameters_for_platform over every value of every catalog
+
+    Args:
+        localize_creater (LocalizeCreater): Configured creater
+        repeat (int): Runs per platform
+
+    Returns:
+        dict: Timing summary keyed by platform
+    """
+    catalogs = localize_creater.load_catalogs()
+    values = [value for catalog in catalogs.values() for value in catalog.values()]
+    convert = localize_creater.convert_parameters_for_platform
+    results = {}
+    for platform_name in PLATFORM_LIST:
+        def run():
+            for value in values:
+                convert(value, platform_name)
+        results[platform_name] = _time_runs(run, repeat, setup=_clear_caches)
+    return results
+
+
+def benchmark_catalog_converter(localize_creater, repeat):
+    """
+    Time convert_catalog over every catalog
+
+    Args:
+        localize_creater (LocalizeCreater): Configured creater
+        repeat (int): Runs per platform
+
+    Returns:
+        dict: Timing summary keyed by platform
+    """
+    catalogs = list(localize_creater.load_catalogs().values())
+    results = {}
+    for platform_name in PLATFORM_LIST:
+        def run():
+            for catalog in catalogs:
+                localize_creater.convert_catalog(catalog, platform_name)
+        results[platform_name] = _time_runs(run, repeat, setup=_clear_caches)
+    return results
+
+
+def run_benchmark(args):
+    """
+    Generate the catalogs, run all benchmarks and build the report
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        dict: JSON-serializable report
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_dir = f"{work_dir}/sample_data"
+        language_codes = generate_catalogs(input_dir, args.keys, args.languages,
+                                           args.value_length, args.placeholder_density, args.seed)
+        localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(language_codes[1:])
+            .set_base_language_code(language_codes[0])
+            .set_input_dir(input_dir)
+            .set_output_dir(f"{work_dir}/sample_output")
+            .set_jobs(args.jobs)
+            .build()
+        )
+        input_bytes = sum(entry.stat().st_size for entry in os.scandir(input_dir))
+        return {
+            "parameters": {
+                "keys": args.keys,
+                "languages": len(language_codes),
+                "value_length": args.value_length,
+                "placeholder_density": args.placeholder_density,
+                "seed": args.seed,
+                "jobs": args.jobs,
+                "repeat": args.repeat,
+                "input_bytes": input_bytes,
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "cpu_count": os.cpu_count(),
+            },
+            "emitters": benchmark_emitters(localize_creater, args.repeat),
+            "convert_parameters_for_platform": benchmark_converter(localize_creater, args.repeat),
+            "convert_catalog": benchmark_catalog_converter(localize_creater, args.repeat),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_catalog_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (default: 3)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes for the emitters (default: 1)")
+    parser.add_argument("--report", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = orjson.dumps(run_benchmark(args), option=orjson.OPT_INDENT_2)
+    if args.report:
+        with open(args.report, "wb") as f:
+            f.write(report)
+    else:
+        sys.stdout.write(report.decode("utf-8") + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+# CLI Module
+from .cli import main
+
+__all__ = ['main']
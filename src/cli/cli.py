@@ -0,0 +1,201 @@
+import argparse
+import sys
+from src.localize_creater.artifact_server import serve_artifacts
+from src.localize_creater.localize_creater import PLATFORM_LIST
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+from src.localize_creater.packed_catalog import unpack_catalog_file
+from src.sdk import sdk_list
+
+# Sub-command run when the command line starts with an option or is empty
+DEFAULT_COMMAND = "build"
+
+
+def _add_catalog_arguments(parser):
+    parser.add_argument("--base", default="en", help="Base language code (default: en)")
+    parser.add_argument("--languages", nargs="+", default=["ja", "ar", "de"],
+                        help="Target language codes (default: ja ar de)")
+    parser.add_argument("--input-dir", default="./sample_data", help="Directory with sample_{lang}.json files")
+    parser.add_argument("--output-dir", default="./sample_output", help="Directory for generated files")
+    parser.add_argument("--sdk", default="xcode", choices=sdk_list,
+                        help="SDK the files are generated for (default: xcode)")
+
+
+def _build_localize_creater(args):
+    localize_creater_builder = LocalizeCreaterBuilder()
+    localize_creater_builder.set_language_code_list(args.languages)
+    localize_creater_builder.set_base_language_code(args.base)
+    localize_creater_builder.set_input_dir(args.input_dir)
+    localize_creater_builder.set_output_dir(args.output_dir)
+    localize_creater_builder.set_sdk(args.sdk)
+    if getattr(args, "jobs", None) is not None:
+        localize_creater_builder.set_jobs(args.jobs)
+    if getattr(args, "incremental", False):
+        localize_creater_builder.set_incremental(True)
+    if getattr(args, "stats", None):
+        localize_creater_builder.set_stats_path(args.stats)
+    if getattr(args, "compiled", None):
+        localize_creater_builder.set_compiled_catalog_path(args.compiled)
+    if getattr(args, "packed", None):
+        localize_creater_builder.set_packed_catalog_path(args.packed)
+    if getattr(args, "fallback", False):
+        localize_creater_builder.set_fallback(True)
+    return localize_creater_builder.build()
+
+
+def _run_build(args):
+    localize_creater = _build_localize_creater(args)
+    localize_creater.create_all(args.platform or PLATFORM_LIST)
+    return 0
+
+
+def _run_compile(args):
+    localize_creater = _build_localize_creater(args)
+    localize_creater.compile_catalogs(args.output)
+    return 0
+
+
+def _run_watch(args):
+    localize_creater = _build_localize_creater(args)
+    try:
+        localize_creater.watch(args.platform or PLATFORM_LIST, interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_serve(args):
+    localize_creater = _build_localize_creater(args)
+    try:
+        serve_artifacts(localize_creater, args.host, args.port, args.platform or PLATFORM_LIST, interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_delta(args):
+    localize_creater = _build_localize_creater(args)
+    report = localize_creater.create_delta(args.previous, platform=args.delta_platform, output_dir=args.delta_dir)
+    for lang_code, delta in report["languages"].items():
+        if delta["added"] or delta["removed"] or delta["changed"]:
+            print(f"{lang_code}: +{len(delta['added'])} -{len(delta['removed'])} ~{len(delta['changed'])}")
+    return 0
+
+
+def _run_pack(args):
+    localize_creater = _build_localize_creater(args)
+    localize_creater.pack_catalogs(args.output)
+    return 0
+
+
+def _run_unpack(args):
+    for path in unpack_catalog_file(args.packed_catalog, args.output_dir):
+        print(f"Unpacked: {path}")
+    return 0
+
+
+def create_parser():
+    """
+    Create the argument parser of the localize kitchen command line
+
+    Returns:
+        argparse.ArgumentParser: Parser with one sub-command per action
+    """
+    parser = argparse.ArgumentParser(
+        prog="localize_kitchen",
+        description="Generate platform-specific localization files from unified JSON sources",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Generate localization files")
+    _add_catalog_arguments(build_parser)
+    build_parser.add_argument("--platform", action="append", choices=PLATFORM_LIST,
+                              help="Platform to generate, may be repeated (default: all)")
+    build_parser.add_argument("-j", "--jobs", type=int, default=1,
+                              help="Number of worker processes for per-language generation (default: 1)")
+    build_parser.add_argument("--incremental", action="store_true",
+                              help="Skip outputs whose inputs and options did not change since the last build")
+    build_parser.add_argument("--stats", metavar="PATH",
+                              help="Write per-stage timings and counters of the build as JSON")
+    sources = build_parser.add_mutually_exclusive_group()
+    sources.add_argument("--compiled", metavar="PATH",
+                         help="Read the catalogs from a compiled .lkc file instead of the JSON files")
+    sources.add_argument("--packed", metavar="PATH",
+                         help="Read the catalogs from a packed .jsonl file instead of the JSON files")
+    build_parser.add_argument("--fallback", action="store_true",
+                              help="Fill in missing strings from the parent locales and the base language")
+    build_parser.set_defaults(func=_run_build)
+
+    watch_parser = subparsers.add_parser("watch", help="Regenerate localization files whenever a catalog changes")
+    _add_catalog_arguments(watch_parser)
+    watch_parser.add_argument("--platform", action="append", choices=PLATFORM_LIST,
+                              help="Platform to generate, may be repeated (default: all)")
+    watch_parser.add_argument("--interval", type=float, default=0.1,
+                              help="Seconds between polls of the input directory (default: 0.1)")
+    watch_parser.set_defaults(func=_run_watch)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve the generated files over HTTP from memory")
+    _add_catalog_arguments(serve_parser)
+    serve_parser.add_argument("--platform", action="append", choices=PLATFORM_LIST,
+                              help="Platform to serve, may be repeated (default: all)")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    serve_parser.add_argument("--interval", type=float, default=0.5,
+                              help="Seconds between polls of the input directory (default: 0.5)")
+    serve_parser.set_defaults(func=_run_serve)
+
+    compile_parser = subparsers.add_parser("compile", help="Compile the JSON catalogs into a binary .lkc file")
+    _add_catalog_arguments(compile_parser)
+    compile_parser.add_argument("-o", "--output", metavar="PATH",
+                                help="Compiled catalog path (default: OUTPUT_DIR/catalog.lkc)")
+    compile_parser.set_defaults(func=_run_compile)
+
+    delta_parser = subparsers.add_parser("delta", help="Write a patch with only the strings changed since a previous version")
+    _add_catalog_arguments(delta_parser)
+    delta_parser.add_argument("previous",
+                              help="Previous version: key_index.json of an earlier delta, a catalog directory, .jsonl or .lkc")
+    delta_parser.add_argument("--platform", dest="delta_platform", choices=PLATFORM_LIST,
+                              help="Convert the patched strings to this platform's parameter format")
+    delta_parser.add_argument("--delta-dir", metavar="PATH",
+                              help="Directory for the delta files (default: OUTPUT_DIR/delta)")
+    sources = delta_parser.add_mutually_exclusive_group()
+    sources.add_argument("--compiled", metavar="PATH",
+                         help="Read the current catalogs from a compiled .lkc file instead of the JSON files")
+    sources.add_argument("--packed", metavar="PATH",
+                         help="Read the current catalogs from a packed .jsonl file instead of the JSON files")
+    delta_parser.add_argument("--fallback", action="store_true",
+                              help="Compare the catalogs with strings filled in from the parent locales")
+    delta_parser.set_defaults(func=_run_delta)
+
+    pack_parser = subparsers.add_parser("pack", help="Pack the JSON catalogs into one multi-language .jsonl file")
+    _add_catalog_arguments(pack_parser)
+    pack_parser.add_argument("-o", "--output", metavar="PATH",
+                             help="Packed catalog path (default: INPUT_DIR/catalogs.jsonl)")
+    pack_parser.set_defaults(func=_run_pack)
+
+    unpack_parser = subparsers.add_parser("unpack", help="Split a packed .jsonl catalog into sample_{lang}.json files")
+    unpack_parser.add_argument("packed_catalog", help="Packed catalog path")
+    unpack_parser.add_argument("--output-dir", default="./sample_data", help="Directory for the JSON files")
+    unpack_parser.set_defaults(func=_run_unpack)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the localize kitchen command line
+
+    Without a sub-command ("python main.py" or "python main.py --platform android")
+    the arguments are passed to build.
+
+    Args:
+        argv (list): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit code
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv = [DEFAULT_COMMAND] + list(argv)
+    args = create_parser().parse_args(argv)
+    return args.func(args)
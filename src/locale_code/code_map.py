@@ -0,0 +1,52 @@
+from types import MappingProxyType
+from src.locale_code.code_list import code_list
+
+# Every supported code, for constant-time membership checks
+code_set = frozenset(code_list)
+
+
+def _lookup_key(language_code):
+    return language_code.replace("_", "-").lower()
+
+
+# Canonical code keyed by its lower-case, hyphen-separated spelling ("en-us" -> "en-US")
+code_map = MappingProxyType({_lookup_key(code): code for code in code_list})
+
+
+def canonicalize(language_code):
+    """
+    Get the canonical spelling of a language code
+
+    Matching ignores case and accepts "_" as well as "-" between subtags,
+    so "EN_us" and "en-us" both give "en-US".
+
+    Args:
+        language_code (str): Language code as written by the user
+
+    Returns:
+        str: Canonical code from code_list, or None if the code is not supported
+    """
+    return code_map.get(_lookup_key(language_code))
+
+
+def filter_language_codes(language_codes):
+    """
+    Canonicalize language codes, dropping unsupported codes and duplicates
+
+    Args:
+        language_codes (list): Language codes as written by the user
+
+    Returns:
+        tuple: (canonical codes in the given order, unsupported codes as given)
+    """
+    valid = []
+    invalid = []
+    seen = set()
+    for language_code in language_codes:
+        canonical = canonicalize(language_code)
+        if canonical is None:
+            invalid.append(language_code)
+        elif canonical not in seen:
+            seen.add(canonical)
+            valid.append(canonical)
+    return valid, invalid
@@ -0,0 +1,70 @@
+from types import MappingProxyType
+from src.locale_code.code_list import code_list
+from src.locale_code.code_map import code_set
+
+# Subset of CLDR parentLocales: regional variants that inherit from a
+# macro-region instead of the bare language (en-AU -> en-001, not en)
+PARENT_LOCALES = {
+    "en-001": (
+        "en-150", "en-AG", "en-AI", "en-AU", "en-BB", "en-BM", "en-BS", "en-BW", "en-BZ", "en-CA", "en-CC",
+        "en-CK", "en-CM", "en-CX", "en-CY", "en-DG", "en-DM", "en-ER", "en-FJ", "en-FK", "en-FM", "en-GB",
+        "en-GD", "en-GG", "en-GH", "en-GI", "en-GM", "en-GY", "en-HK", "en-IE", "en-IL", "en-IM", "en-IN",
+        "en-IO", "en-JE", "en-JM", "en-KE", "en-KI", "en-KN", "en-KY", "en-LC", "en-LR", "en-LS", "en-MG",
+        "en-MO", "en-MS", "en-MT", "en-MU", "en-MW", "en-MY", "en-NA", "en-NF", "en-NG", "en-NR", "en-NU",
+        "en-NZ", "en-PG", "en-PH", "en-PK", "en-PN", "en-PW", "en-RW", "en-SB", "en-SC", "en-SD", "en-SG",
+        "en-SH", "en-SL", "en-SS", "en-SX", "en-SZ", "en-TC", "en-TK", "en-TO", "en-TT", "en-TV", "en-TZ",
+        "en-UG", "en-VC", "en-VG", "en-VU", "en-WS", "en-ZA", "en-ZM", "en-ZW",
+    ),
+    "en-150": ("en-AT", "en-BE", "en-CH", "en-DE", "en-DK", "en-FI", "en-NL", "en-SE", "en-SI"),
+    "es-419": (
+        "es-AR", "es-BO", "es-BR", "es-BZ", "es-CL", "es-CO", "es-CR", "es-CU", "es-DO", "es-EC", "es-GT",
+        "es-HN", "es-MX", "es-NI", "es-PA", "es-PE", "es-PR", "es-PY", "es-SV", "es-US", "es-UY", "es-VE",
+    ),
+    "pt-PT": ("pt-AO", "pt-CH", "pt-CV", "pt-GQ", "pt-GW", "pt-LU", "pt-MO", "pt-MZ", "pt-ST", "pt-TL"),
+}
+
+_explicit_parents = {child: parent for parent, children in PARENT_LOCALES.items() for child in children}
+
+
+def _parent(language_code):
+    parent = _explicit_parents.get(language_code)
+    if parent is not None:
+        return parent
+    # Drop subtags until a supported code is left (az-Latn-AZ -> az-Latn -> az)
+    while "-" in language_code:
+        language_code = language_code.rsplit("-", 1)[0]
+        if language_code in code_set:
+            return language_code
+    return None
+
+
+def _chain(language_code):
+    chain = []
+    while language_code is not None:
+        chain.append(language_code)
+        language_code = parent_map[language_code]
+    return tuple(chain)
+
+
+# Parent of every supported code, None for root languages
+parent_map = MappingProxyType({code: _parent(code) for code in code_list})
+
+# Every supported code followed by its ancestors up to the root language
+fallback_chains = MappingProxyType({code: _chain(code) for code in code_list})
+
+
+def fallback_chain(language_code, base_language_code=None):
+    """
+    Get the languages a language falls back to, most specific first
+
+    Args:
+        language_code (str): Canonical language code
+        base_language_code (str): Language every chain ends with, e.g. the base language of a build
+
+    Returns:
+        tuple: The language, its ancestors and then the base language if it is not already in the chain
+    """
+    chain = fallback_chains.get(language_code, (language_code,))
+    if base_language_code is not None and base_language_code not in chain:
+        chain += (base_language_code,)
+    return chain
@@ -0,0 +1,109 @@
+import io
+import re
+
+XML_DECLARATION = b'<?xml version="1.0" ?>\n'
+INDENT = "    "
+
+# Characters that need escaping in text content and attribute values
+_TEXT_SPECIAL_PATTERN = re.compile('[&<>"\r]')
+_ATTRIBUTE_SPECIAL_PATTERN = re.compile('[&<>"]')
+# Characters that are not allowed in XML 1.0 documents
+_INVALID_XML_CHAR_PATTERN = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+
+def _check_xml_chars(text):
+    match = _INVALID_XML_CHAR_PATTERN.search(text)
+    if match is not None:
+        raise ValueError(f"Invalid XML character {match.group(0)!r} in {text!r}")
+
+
+def escape_text(text):
+    """
+    Escape text content the way the ElementTree + minidom round-trip did
+
+    Args:
+        text (str): Raw string value
+
+    Returns:
+        str: Escaped text. Line breaks are normalized to \\n like an XML parser does.
+    """
+    if _TEXT_SPECIAL_PATTERN.search(text) is None:
+        return text
+    return (text.replace("\r\n", "\n").replace("\r", "\n")
+            .replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;"))
+
+
+def escape_attribute(value):
+    """
+    Escape an attribute value the way the ElementTree + minidom round-trip did
+
+    Args:
+        value (str): Raw attribute value
+
+    Returns:
+        str: Escaped attribute value
+    """
+    if _ATTRIBUTE_SPECIAL_PATTERN.search(value) is None:
+        return value
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+def _iter_string_elements(data):
+    for key, value in data.items():
+        _check_xml_chars(key)
+        _check_xml_chars(value)
+        if value:
+            yield f'{INDENT}<string name="{escape_attribute(key)}">{escape_text(value)}</string>\n'.encode("utf-8")
+        else:
+            yield f'{INDENT}<string name="{escape_attribute(key)}"/>\n'.encode("utf-8")
+
+
+def write_android_xml(stream, data):
+    """
+    Stream Android string resources to a binary stream
+
+    Each <string> element is escaped, encoded once and handed to
+    writelines() as soon as it is produced, so no document tree is built.
+    The output is the UTF-8 encoding of minidom's toprettyxml(indent="    ")
+    of the same resources.
+
+    Args:
+        stream (io.BufferedIOBase): Writable binary stream
+        data (dict): Dictionary containing key-value pairs for localization
+    """
+    write = stream.write
+    write(XML_DECLARATION)
+    if not data:
+        write(b"<resources/>\n")
+        return
+    write(b"<resources>\n")
+    stream.writelines(_iter_string_elements(data))
+    write(b"</resources>\n")
+
+
+def android_xml_bytes(data):
+    """
+    Render Android string resources to UTF-8 bytes
+
+    Args:
+        data (dict): Dictionary containing key-value pairs for localization
+
+    Returns:
+        bytes: Formatted XML for Android string resources
+    """
+    stream = io.BytesIO()
+    write_android_xml(stream, data)
+    return stream.getvalue()
+
+
+def android_xml_string(data):
+    """
+    Render Android string resources to a string
+
+    Args:
+        data (dict): Dictionary containing key-value pairs for localization
+
+    Returns:
+        str: Formatted XML string for Android string resources
+    """
+    return android_xml_bytes(data).decode("utf-8")
@@ -0,0 +1,275 @@
+from collections import namedtuple
+import hashlib
+import io
+import os
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+import orjson
+from src.localize_creater.build_stats import BuildStats
+from src.localize_creater.localize_creater import PLATFORM_LIST, LazyCatalogs
+from src.localize_creater.source_watcher import SourceWatcher
+
+XCODE_ARTIFACT_PATH = "xcode/Localizable.xcstrings"
+REACT_ARTIFACT_PATH = "javascript/LocalizedStrings.js"
+CONTENT_TYPES = {
+    ".xml": "application/xml; charset=utf-8",
+    ".arb": "application/json; charset=utf-8",
+    ".xcstrings": "application/json; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+
+Artifact = namedtuple("Artifact", ["content", "etag", "content_type"])
+
+
+def make_artifact(path, content):
+    """
+    Wrap rendered content with its strong ETag and content type
+
+    Args:
+        path (str): Artifact path, e.g. "android/values-ja/strings.xml"
+        content (bytes): Rendered content
+
+    Returns:
+        Artifact: (content, etag, content_type)
+    """
+    etag = '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+    content_type = CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream")
+    return Artifact(content, etag, content_type)
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Check an If-None-Match header against an ETag
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match.
+
+    Args:
+        if_none_match (str): Header value, None if the header is missing
+        etag (str): Current ETag of the artifact
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ArtifactStore:
+    """
+    Rendered artifacts of every platform, kept in memory
+
+    The parsed catalogs and the rendered bytes stay in memory, so serving
+    an artifact never touches disk. refresh() polls the source files and
+    re-renders only what a changed language affects: its own strings.xml
+    and ARB file, plus the xcstrings and JavaScript files that combine all
+    languages. The artifact table is replaced as a whole, so request
+    threads always see a consistent set without taking a lock.
+    """
+
+    def __init__(self, localize_creater, platforms=None):
+        if platforms is None:
+            platforms = PLATFORM_LIST
+        for platform in platforms:
+            if platform not in PLATFORM_LIST:
+                raise ValueError(f"Invalid platform: {platform}")
+        if localize_creater.compiled_catalog_path or localize_creater.packed_catalog_path:
+            raise ValueError("The artifact server reads the per-language JSON files, not a compiled or packed catalog")
+        if localize_creater.fallback:
+            raise ValueError("The artifact server does not support fallback chains")
+        self.platforms = platforms
+        self._localize_creater = localize_creater
+        self._catalogs = LazyCatalogs(localize_creater)
+        self._watcher = SourceWatcher(localize_creater.input_dir,
+                                      [localize_creater.base_language_code] + localize_creater.target_language_code_list)
+        self._artifacts = {}
+        self._refresh_lock = threading.Lock()
+
+    def get(self, path):
+        """
+        Get a rendered artifact
+
+        Args:
+            path (str): Artifact path, e.g. "dart/app_ja.arb"
+
+        Returns:
+            Artifact: The artifact, or None if there is none with this path
+        """
+        return self._artifacts.get(path)
+
+    def etags(self):
+        """
+        Get the ETag of every artifact
+
+        Returns:
+            dict: ETags keyed by artifact path
+        """
+        return {path: artifact.etag for path, artifact in sorted(self._artifacts.items())}
+
+    def refresh(self):
+        """
+        Reload changed source files and re-render the artifacts they affect
+
+        Returns:
+            list: Languages that were (re)loaded, empty if nothing changed
+        """
+        with self._refresh_lock:
+            changed = self._watcher.poll()
+            if not changed:
+                return []
+            if self._artifacts:
+                changed = self._localize_creater.reload_catalogs(self._catalogs, changed)
+                if not changed:
+                    return []
+            artifacts = dict(self._artifacts)
+            artifacts.update(self._render(changed))
+            self._artifacts = artifacts
+            return changed
+
+    def _relative_path(self, output_path):
+        return os.path.relpath(output_path, self._localize_creater.output_dir).replace(os.sep, "/")
+
+    def _render(self, language_codes):
+        localize_creater = self._localize_creater
+        catalogs = self._catalogs
+        stats = BuildStats()
+        artifacts = {}
+        if "android" in self.platforms:
+            for output_path, lang_code in localize_creater._android_output_languages(language_codes).items():
+                path = self._relative_path(output_path)
+                content = localize_creater.render_android_language(lang_code, catalogs[lang_code], stats)
+                artifacts[path] = make_artifact(path, content)
+        if "flutter" in self.platforms:
+            for output_path, lang_code in localize_creater._flutter_output_languages(language_codes).items():
+                path = self._relative_path(output_path)
+                content = localize_creater.render_flutter_language(lang_code, catalogs[lang_code], stats)
+                artifacts[path] = make_artifact(path, content)
+        if "xcode" in self.platforms:
+            stream = io.BytesIO()
+            localize_creater.render_xcode(catalogs, stream, stats)
+            artifacts[XCODE_ARTIFACT_PATH] = make_artifact(XCODE_ARTIFACT_PATH, stream.getvalue())
+        if "react" in self.platforms:
+            stream = io.BytesIO()
+            localize_creater.render_react(catalogs, stream, stats)
+            artifacts[REACT_ARTIFACT_PATH] = make_artifact(REACT_ARTIFACT_PATH, stream.getvalue())
+        return artifacts
+
+
+class ArtifactRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve artifacts from the ArtifactStore of the server
+
+    GET / lists the artifact paths with their ETags. Responses carry a
+    strong ETag and "Cache-Control: no-cache", so clients revalidate with
+    If-None-Match and get 304 Not Modified while their copy is current.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalizeKitchen"
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        path = urlsplit(self.path).path.lstrip("/")
+        store = self.server.store
+        if path == "":
+            content = orjson.dumps(store.etags(), option=orjson.OPT_INDENT_2)
+            artifact = Artifact(content, None, "application/json; charset=utf-8")
+        else:
+            artifact = store.get(path)
+            if artifact is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            if etag_matches(self.headers.get("If-None-Match"), artifact.etag):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", artifact.etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", artifact.content_type)
+        self.send_header("Content-Length", str(len(artifact.content)))
+        if artifact.etag is not None:
+            self.send_header("ETag", artifact.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(artifact.content)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ArtifactServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for an ArtifactStore
+
+    Every connection gets its own thread; the listen backlog is raised
+    so bursts of hundreds of app start-ups are queued instead of refused.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, server_address, store, verbose=True):
+        super().__init__(server_address, ArtifactRequestHandler)
+        self.store = store
+        self.verbose = verbose
+
+
+def serve_artifacts(localize_creater, host="127.0.0.1", port=8000, platforms=None, interval=0.5, stop_event=None):
+    """
+    Render all artifacts into memory and serve them until stopped
+
+    A background thread polls the source files every interval seconds and
+    re-renders what changed.
+
+    Args:
+        localize_creater (LocalizeCreater): Configured creater
+        host (str): Address to listen on
+        port (int): Port to listen on (0 picks a free port)
+        platforms (list): Platforms to serve. Defaults to all of them.
+        interval (float): Seconds between polls of the input directory
+        stop_event (threading.Event): Stops the server when set. Serves until interrupted when omitted.
+    """
+    store = ArtifactStore(localize_creater, platforms)
+    store.refresh()
+    if stop_event is None:
+        stop_event = threading.Event()
+    server = ArtifactServer((host, port), store, verbose=localize_creater.verbose)
+
+    def refresh_until_stopped():
+        while not stop_event.wait(interval):
+            try:
+                changed = store.refresh()
+            except Exception as e:
+                localize_creater._log(f"Could not re-render artifacts: {e}")
+                continue
+            if changed:
+                localize_creater._log(f"Re-rendered artifacts of {', '.join(changed)}")
+        server.shutdown()
+
+    refresher = threading.Thread(target=refresh_until_stopped, daemon=True)
+    refresher.start()
+    address, bound_port = server.server_address[:2]
+    localize_creater._log(f"Serving {len(store.etags())} artifacts on http://{address}:{bound_port}/")
+    try:
+        server.serve_forever()
+    finally:
+        stop_event.set()
+        server.server_close()
@@ -0,0 +1,105 @@
+import hashlib
+import orjson
+import os
+from src.localize_creater.output_writer import write_if_changed
+from src.localize_creater.parameter_converter import CONVERTER_VERSION
+
+MANIFEST_FILE_NAME = ".localize_manifest.json"
+MANIFEST_VERSION = 1
+
+
+class BuildManifest:
+    """
+    Record what every generated file was built from
+
+    For each output the manifest stores the content hash of its input
+    files, the converter version and the emitter options. An output is up
+    to date when all three match the current run and the file still exists.
+    Input hashes are cached together with the file size and mtime, so an
+    unchanged input costs a single os.stat() instead of being re-read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._outputs = {}
+        self._file_hashes = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as f:
+                manifest = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return
+        if manifest.get("version") != MANIFEST_VERSION:
+            return
+        self._outputs = manifest.get("outputs", {})
+        self._file_hashes = manifest.get("files", {})
+
+    def file_hash(self, path):
+        """
+        Get the SHA-256 of a file, reusing the cached hash when size and mtime are unchanged
+
+        Args:
+            path (str): Input file path
+
+        Returns:
+            str: Hex digest of the file content
+        """
+        stat = os.stat(path)
+        cached = self._file_hashes.get(path)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self._file_hashes[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def _fingerprint(self, input_paths, options):
+        return {
+            "inputs": {path: self.file_hash(path) for path in input_paths},
+            "converter_version": CONVERTER_VERSION,
+            "options": options,
+        }
+
+    def is_up_to_date(self, output_path, input_paths, options):
+        """
+        Check whether an output can be skipped
+
+        Args:
+            output_path (str): Generated file path
+            input_paths (list): Source files the output is generated from
+            options (dict): Emitter options that affect the output
+
+        Returns:
+            bool: True if the output exists and was built from the same inputs and options
+        """
+        recorded = self._outputs.get(output_path)
+        if recorded is None or not os.path.exists(output_path):
+            return False
+        try:
+            return recorded == self._fingerprint(input_paths, options)
+        except FileNotFoundError:
+            return False
+
+    def record(self, output_path, input_paths, options):
+        """
+        Record the inputs and options a generated file was built from
+
+        Args:
+            output_path (str): Generated file path
+            input_paths (list): Source files the output was generated from
+            options (dict): Emitter options that affect the output
+        """
+        self._outputs[output_path] = self._fingerprint(input_paths, options)
+
+    def save(self):
+        """
+        Write the manifest next to the generated files
+        """
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "outputs": self._outputs,
+            "files": self._file_hashes,
+        }
+        write_if_changed(self.path, orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
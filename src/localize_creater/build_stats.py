@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+import orjson
+import time
+from src.localize_creater.parameter_converter import conversion_cache_info
+
+STAGE_LIST = ["load", "parse", "convert", "serialize", "write"]
+COUNTER_LIST = ["strings", "placeholders", "bytes_written", "unchanged_outputs", "duplicate_values", "saved_bytes"]
+
+# Platform name used for reading and parsing the source catalogs, which all platforms share
+SOURCE_PLATFORM = "source"
+# Language name used for outputs that combine every language (xcstrings, React JS)
+ALL_LANGUAGES = "*"
+
+
+class BuildStats:
+    """
+    Per-stage wall time and counters of a build
+
+    Times and counters are kept per (platform, language). Source catalogs
+    are read and parsed once for all platforms, so their load/parse times
+    are recorded under the "source" platform. Emitters that stream
+    (Android XML, xcstrings) serialize while writing; for them "serialize"
+    covers producing and buffering the output and "write" only the final
+    flush to disk. The xcstrings emitter converts lazily while serializing,
+    so its convert time is included in "serialize".
+
+    cache_hits / cache_misses count lookups of the (text, platform)
+    conversion cache made during the build, including worker processes.
+    """
+
+    def __init__(self):
+        self.wall_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._entries = {}
+        self._started = time.perf_counter()
+        self._cache_counters_at_start = self._cache_counters()
+
+    def _entry(self, platform, language):
+        entry = self._entries.get((platform, language))
+        if entry is None:
+            entry = dict.fromkeys(STAGE_LIST, 0.0)
+            entry.update(dict.fromkeys(COUNTER_LIST, 0))
+            self._entries[(platform, language)] = entry
+        return entry
+
+    def add_time(self, platform, language, stage, seconds):
+        """
+        Add wall time to a stage
+
+        Args:
+            platform (str): Platform name, or "source" for catalog loading
+            language (str): Language code, or "*" for combined outputs
+            stage (str): One of STAGE_LIST
+            seconds (float): Elapsed wall time
+        """
+        self._entry(platform, language)[stage] += seconds
+
+    @contextmanager
+    def measure(self, platform, language, stage):
+        """
+        Measure the wall time of a block
+
+        Args:
+            platform (str): Platform name, or "source" for catalog loading
+            language (str): Language code, or "*" for combined outputs
+            stage (str): One of STAGE_LIST
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(platform, language, stage, time.perf_counter() - start)
+
+    def count(self, platform, language, strings=0, placeholders=0, bytes_written=0, unchanged_outputs=0,
+              duplicate_values=0, saved_bytes=0):
+        """
+        Add to the counters
+
+        Args:
+            platform (str): Platform name, or "source" for catalog loading
+            language (str): Language code, or "*" for combined outputs
+            strings (int): Number of strings processed
+            placeholders (int): Number of parameters in those strings
+            bytes_written (int): Number of bytes written to output files
+            unchanged_outputs (int): Number of output files left untouched because their content did not change
+            duplicate_values (int): Number of loaded values that were deduplicated against another language
+            saved_bytes (int): Bytes of string objects released by deduplication
+        """
+        entry = self._entry(platform, language)
+        entry["strings"] += strings
+        entry["placeholders"] += placeholders
+        entry["bytes_written"] += bytes_written
+        entry["unchanged_outputs"] += unchanged_outputs
+        entry["duplicate_values"] += duplicate_values
+        entry["saved_bytes"] += saved_bytes
+
+    def merge(self, other):
+        """
+        Add the times and counters of another BuildStats (e.g. from a worker process)
+
+        Args:
+            other (BuildStats): Stats to merge into this one
+        """
+        for key, other_entry in other._entries.items():
+            entry = self._entry(*key)
+            for name, value in other_entry.items():
+                entry[name] += value
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+
+    def finish(self):
+        """
+        Stop the wall clock of the build and collect the conversion cache counters
+
+        Returns:
+            BuildStats: self
+        """
+        self.wall_time = time.perf_counter() - self._started
+        hits, misses = self._cache_counters()
+        self.cache_hits += hits - self._cache_counters_at_start[0]
+        self.cache_misses += misses - self._cache_counters_at_start[1]
+        self._cache_counters_at_start = (hits, misses)
+        return self
+
+    @staticmethod
+    def _cache_counters():
+        # Plain tuple, so BuildStats stays picklable for worker processes
+        cache_info = conversion_cache_info()
+        return cache_info.hits, cache_info.misses
+
+    @property
+    def cache_hit_rate(self):
+        """
+        Share of conversion cache lookups that were hits
+
+        Returns:
+            float: Hit rate between 0.0 and 1.0 (0.0 without lookups)
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def get(self, platform, language):
+        """
+        Get the times and counters of one platform and language
+
+        Args:
+            platform (str): Platform name
+            language (str): Language code
+
+        Returns:
+            dict: Stage times and counters (all zero if nothing was recorded)
+        """
+        return dict(self._entry(platform, language))
+
+    def totals(self, platform=None):
+        """
+        Sum stages and counters over all languages
+
+        Args:
+            platform (str): Only sum this platform. Sums every platform when omitted,
+                in which case source strings and emitted strings are both counted.
+
+        Returns:
+            dict: Stage times and counters
+        """
+        totals = dict.fromkeys(STAGE_LIST, 0.0)
+        totals.update(dict.fromkeys(COUNTER_LIST, 0))
+        for (entry_platform, _), entry in self._entries.items():
+            if platform is not None and entry_platform != platform:
+                continue
+            for name, value in entry.items():
+                totals[name] += value
+        return totals
+
+    def to_dict(self):
+        """
+        Convert the stats to a JSON-serializable dict
+
+        Returns:
+            dict: {"wall_time", "totals": {platform: totals}, "platforms": {platform: {language: entry}}}
+        """
+        platforms = {}
+        for (platform, language), entry in self._entries.items():
+            platforms.setdefault(platform, {})[language] = dict(entry)
+        return {
+            "wall_time": self.wall_time,
+            "conversion_cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": self.cache_hit_rate,
+            },
+            "totals": {platform: self.totals(platform) for platform in platforms},
+            "platforms": platforms,
+        }
+
+    def write_json(self, path):
+        """
+        Write the stats as JSON
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
@@ -0,0 +1,275 @@
+from array import array
+from collections.abc import ItemsView, Mapping, ValuesView
+import sys
+
+
+class Catalog(Mapping):
+    """
+    Columnar in-memory store of the catalogs of several languages
+
+    All languages share one index of interned keys. Each language keeps a
+    single list of values aligned with that index (None where the language
+    lacks the key), so an additional language costs one list slot per key
+    instead of a hash table entry. A language whose source file lists its
+    keys in a different order than the shared index also keeps that order
+    as an array of key positions, so every emitter still reproduces the
+    key order of each source file.
+
+    Values are deduplicated through a StringPool, so a regional variant
+    that repeats its parent locale's strings (de / de-AT / de-CH) holds
+    references to the same string objects instead of its own copies.
+
+    The Catalog maps language codes to read-only CatalogLanguage views,
+    which behave like the plain {key: value} dicts they replace.
+
+    Usage:
+        catalog = Catalog()
+        catalog.add_language("en", {"title": "Hello"})
+        catalog["en"]["title"]
+    """
+
+    __slots__ = ("_keys", "_key_index", "_languages", "pool")
+
+    def __init__(self, pool=None):
+        self._keys = []
+        self._key_index = {}
+        self._languages = {}
+        self.pool = StringPool() if pool is None else pool
+
+    def add_language(self, language_code, mapping):
+        """
+        Add the strings of a language, replacing the language if it was already added
+
+        Args:
+            language_code (str): Language code
+            mapping (dict): Key-value pairs of the language
+
+        Returns:
+            CatalogLanguage: View of the added language
+        """
+        keys = self._keys
+        key_index = self._key_index
+        intern_value = self.pool.intern
+        values = [None] * len(keys)
+        positions = array("I")
+        in_order = True
+        previous = -1
+        for key, value in mapping.items():
+            position = key_index.get(key)
+            if position is None:
+                position = len(keys)
+                key = sys.intern(key)
+                keys.append(key)
+                key_index[key] = position
+                values.append(None)
+            values[position] = intern_value(value)
+            positions.append(position)
+            if position <= previous:
+                in_order = False
+            previous = position
+        # Keys in index order need no order array, walking the values skips the gaps
+        language = CatalogLanguage(language_code, keys, key_index, values,
+                                   None if in_order else positions, len(positions))
+        self._languages[language_code] = language
+        return language
+
+    def add_rows(self, language_codes, rows, orders=None):
+        """
+        Add several languages at once from rows of one key and one value per language
+
+        Rows are consumed one at a time, so a multi-language source can be
+        streamed into the catalog without holding a dict per language.
+        Languages follow the row order unless orders gives their own.
+
+        Args:
+            language_codes (list): Languages of the value columns
+            rows (iterable): (key, value, ...) sequences with one value per language, None where missing
+            orders (dict): Key order of a language as a list of row numbers (from 0), keyed by language code
+
+        Returns:
+            list: CatalogLanguage views of the added languages
+        """
+        keys = self._keys
+        key_index = self._key_index
+        intern_value = self.pool.intern
+        columns = [[None] * len(keys) for _ in language_codes]
+        positions = array("I")
+        seen = set()
+        in_order = True
+        previous = -1
+        for row in rows:
+            key = row[0]
+            position = key_index.get(key)
+            if position is None:
+                position = len(keys)
+                key = sys.intern(key)
+                keys.append(key)
+                key_index[key] = position
+                for column in columns:
+                    column.append(None)
+            elif position in seen:
+                raise ValueError(f"Duplicate key: {key}")
+            seen.add(position)
+            for column, value in zip(columns, row[1:]):
+                if value is not None:
+                    column[position] = intern_value(value)
+            positions.append(position)
+            if position <= previous:
+                in_order = False
+            previous = position
+
+        languages = []
+        for language_code, values in zip(language_codes, columns):
+            size = sum(value is not None for value in values)
+            row_order = orders.get(language_code) if orders else None
+            if row_order is not None:
+                order = self._row_order(language_code, row_order, positions, values, size)
+            elif in_order:
+                order = None
+            else:
+                order = array("I", [position for position in positions if values[position] is not None])
+            language = CatalogLanguage(language_code, keys, key_index, values, order, size)
+            self._languages[language_code] = language
+            languages.append(language)
+        return languages
+
+    @staticmethod
+    def _row_order(language_code, row_order, positions, values, size):
+        # Must name every row the language has a value in, each exactly once
+        try:
+            order = array("I", [positions[row] for row in array("I", row_order)])
+        except (IndexError, OverflowError, TypeError):
+            raise ValueError(f"Invalid key order for {language_code}") from None
+        if len(order) != size or len(set(order)) != size or any(values[position] is None for position in order):
+            raise ValueError(f"Invalid key order for {language_code}")
+        return order
+
+    @property
+    def key_count(self):
+        """
+        Number of distinct keys over all languages
+
+        Returns:
+            int: Size of the shared key index
+        """
+        return len(self._keys)
+
+    def __getitem__(self, language_code):
+        return self._languages[language_code]
+
+    def __contains__(self, language_code):
+        return language_code in self._languages
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self):
+        return len(self._languages)
+
+
+class StringPool:
+    """
+    Intern table that deduplicates identical string values across languages
+
+    intern() returns the first string object seen with the same content,
+    so duplicates parsed from later files can be released. The pool counts
+    how many values were duplicates and how many bytes of string objects
+    that freed; the table itself is not subtracted.
+    """
+
+    __slots__ = ("_strings", "duplicate_values", "saved_bytes")
+
+    def __init__(self):
+        self._strings = {}
+        self.duplicate_values = 0
+        self.saved_bytes = 0
+
+    def intern(self, value):
+        """
+        Get the pooled string equal to a value, adding the value when it is new
+
+        Args:
+            value (str): String value
+
+        Returns:
+            str: Pooled string with the same content
+        """
+        pooled = self._strings.setdefault(value, value)
+        if pooled is not value:
+            self.duplicate_values += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return pooled
+
+    def __contains__(self, value):
+        return value in self._strings
+
+    def __len__(self):
+        return len(self._strings)
+
+
+class CatalogLanguage(Mapping):
+    """
+    Read-only {key: value} view of one language of a Catalog
+
+    Iterates in the key order of the language's source file. Pickles as a
+    plain dict, so it can be handed to worker processes.
+    """
+
+    __slots__ = ("language_code", "_keys", "_key_index", "_values", "_order", "_size")
+
+    def __init__(self, language_code, keys, key_index, values, order, size):
+        self.language_code = language_code
+        self._keys = keys
+        self._key_index = key_index
+        self._values = values
+        self._order = order
+        self._size = size
+
+    def __getitem__(self, key):
+        position = self._key_index[key]
+        if position < len(self._values):
+            value = self._values[position]
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        position = self._key_index.get(key)
+        return position is not None and position < len(self._values) and self._values[position] is not None
+
+    def __iter__(self):
+        return (key for key, _ in self._iter_items())
+
+    def __len__(self):
+        return self._size
+
+    def items(self):
+        return _CatalogItemsView(self)
+
+    def values(self):
+        return _CatalogValuesView(self)
+
+    def _iter_items(self):
+        keys = self._keys
+        values = self._values
+        if self._order is None:
+            # The shared index may have grown since this language was added, zip stops at its own values
+            return ((key, value) for key, value in zip(keys, values) if value is not None)
+        return ((keys[position], values[position]) for position in self._order)
+
+    def __reduce__(self):
+        return dict, (list(self._iter_items()),)
+
+
+class _CatalogItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class _CatalogValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return (value for _, value in self._mapping._iter_items())
@@ -0,0 +1,227 @@
+from collections import namedtuple
+import hashlib
+import os
+import orjson
+from src.locale_code.fallback import fallback_chain
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.catalog_loader import load_catalog_files
+from src.localize_creater.compiled_catalog import CompiledCatalog
+from src.localize_creater.fallback_catalog import FallbackCatalogs
+from src.localize_creater.output_writer import write_if_changed
+from src.localize_creater.packed_catalog import load_packed_catalog
+from src.localize_creater.parameter_converter import convert_catalog
+
+KEY_INDEX_FILE_NAME = "key_index.json"
+PATCH_FILE_NAME = "patch.json"
+REPORT_FILE_NAME = "changed_keys.json"
+KEY_INDEX_FORMAT = "localize-kitchen-key-index"
+PATCH_FORMAT = "localize-kitchen-patch"
+DELTA_VERSION = 1
+VALUE_DIGEST_SIZE = 8
+
+LanguageDelta = namedtuple("LanguageDelta", ["added", "removed", "changed"])
+
+
+def value_digest(value):
+    """
+    Hash a string value for a key index
+
+    Args:
+        value (str): String value
+
+    Returns:
+        str: Hex digest of the UTF-8 bytes
+    """
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=VALUE_DIGEST_SIZE).hexdigest()
+
+
+def build_key_index(catalogs, language_codes=None):
+    """
+    Index the values of catalogs by key, storing a short hash instead of each value
+
+    Languages missing from catalogs are left out, except with
+    FallbackCatalogs, where every language inherits from its fallback chain.
+
+    Args:
+        catalogs (Mapping): Catalogs keyed by language code
+        language_codes (list): Languages to index. Defaults to every language.
+
+    Returns:
+        dict: {language code: {key: value digest}}, keys in source order
+    """
+    if language_codes is None:
+        language_codes = list(catalogs)
+    inherits = isinstance(catalogs, FallbackCatalogs)
+    return {
+        lang_code: {key: value_digest(value) for key, value in catalogs[lang_code].items()}
+        for lang_code in language_codes if inherits or lang_code in catalogs
+    }
+
+
+def key_index_digest(index):
+    """
+    Hash a whole key index, identifying one catalog version
+
+    Args:
+        index (dict): Key index from build_key_index()
+
+    Returns:
+        str: Hex digest, independent of language and key order
+    """
+    return hashlib.blake2b(orjson.dumps(index, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def write_key_index(path, index):
+    """
+    Write a key index as JSON
+
+    Args:
+        path (str): Output file path
+        index (dict): Key index from build_key_index()
+    """
+    write_if_changed(path, orjson.dumps({
+        "format": KEY_INDEX_FORMAT,
+        "version": DELTA_VERSION,
+        "languages": index,
+    }))
+
+
+def load_key_index(path, language_codes=None, file_suffix="", base_language_code=None):
+    """
+    Get the key index of a catalog snapshot
+
+    A snapshot is a key index written by write_key_index(), a directory of
+    sample_{lang}.json files, a packed .jsonl catalog or a compiled .lkc catalog.
+    With base_language_code, catalog snapshots are indexed with the strings
+    every language inherits along its fallback chain, like the key index of
+    a fallback build.
+
+    Args:
+        path (str): Snapshot path
+        language_codes (list): Languages to index. Defaults to every language of the snapshot.
+        file_suffix (str): Suffix of the JSON file names (e.g. "_unified")
+        base_language_code (str): Base language the fallback chains end with. No fallback when omitted.
+
+    Returns:
+        dict: {language code: {key: value digest}}
+    """
+    def index(catalogs):
+        if base_language_code is not None:
+            catalogs = FallbackCatalogs(catalogs, base_language_code)
+        return build_key_index(catalogs, language_codes)
+
+    if os.path.isdir(path):
+        catalogs = Catalog()
+        file_languages = language_codes
+        if base_language_code is not None and language_codes is not None:
+            # Languages also inherit from files that are not in language_codes (e.g. en-001)
+            file_languages = list(dict.fromkeys(chain_lang_code for lang_code in language_codes
+                                                for chain_lang_code in fallback_chain(lang_code, base_language_code)))
+        for lang_code, catalog in load_catalog_files(path, file_languages, file_suffix).items():
+            catalogs.add_language(lang_code, catalog)
+        return index(catalogs)
+    if path.endswith(".lkc"):
+        with CompiledCatalog(path) as catalogs:
+            catalogs.decode_keys()
+            return index(catalogs)
+    if path.endswith(".jsonl"):
+        return index(load_packed_catalog(path))
+
+    with open(path, "rb") as f:
+        content = orjson.loads(f.read())
+    if (not isinstance(content, dict) or content.get("format") != KEY_INDEX_FORMAT
+            or content.get("version") != DELTA_VERSION):
+        raise ValueError(f"Not a key index (version {DELTA_VERSION}): {path}")
+    index = content["languages"]
+    if language_codes is not None:
+        index = {lang_code: index[lang_code] for lang_code in language_codes if lang_code in index}
+    return index
+
+
+def diff_key_indexes(old_index, new_index):
+    """
+    Compare two key indexes language by language
+
+    A language missing from the old index has all its keys added; one
+    missing from the new index is left out.
+
+    Args:
+        old_index (dict): Key index of the previous version
+        new_index (dict): Key index of the new version
+
+    Returns:
+        dict: LanguageDelta(added, removed, changed) keyed by language code, in the order of new_index.
+            Added and changed keys follow the new key order, removed keys the old one.
+    """
+    deltas = {}
+    for lang_code, new_keys in new_index.items():
+        old_keys = old_index.get(lang_code, {})
+        added = []
+        changed = []
+        for key, digest in new_keys.items():
+            old_digest = old_keys.get(key)
+            if old_digest is None:
+                added.append(key)
+            elif old_digest != digest:
+                changed.append(key)
+        removed = [key for key in old_keys if key not in new_keys]
+        deltas[lang_code] = LanguageDelta(added, removed, changed)
+    return deltas
+
+
+def build_patch(catalogs, deltas, old_index, new_index, platform=None):
+    """
+    Build the patch that turns the previous version into the new one
+
+    Only languages with changes are listed. "from" and "to" identify the
+    versions, so a client can check that the patch applies to its strings.
+
+    Args:
+        catalogs (Mapping): New catalogs keyed by language code
+        deltas (dict): LanguageDelta keyed by language code from diff_key_indexes()
+        old_index (dict): Key index of the previous version
+        new_index (dict): Key index of the new version
+        platform (str): Convert the values to this platform's parameter format. Kept as written when omitted.
+
+    Returns:
+        dict: {"format", "version", "platform", "from", "to", "languages": {lang: {"set": {...}, "remove": [...]}}}
+    """
+    languages = {}
+    for lang_code, delta in deltas.items():
+        if not (delta.added or delta.removed or delta.changed):
+            continue
+        language = catalogs[lang_code]
+        # Keep the new key order for the keys that are set
+        set_keys = set(delta.added)
+        set_keys.update(delta.changed)
+        values = {key: language[key] for key in new_index[lang_code] if key in set_keys}
+        if platform is not None:
+            values = convert_catalog(values, platform)
+        languages[lang_code] = {"set": values, "remove": delta.removed}
+    return {
+        "format": PATCH_FORMAT,
+        "version": DELTA_VERSION,
+        "platform": platform,
+        "from": key_index_digest(old_index),
+        "to": key_index_digest(new_index),
+        "languages": languages,
+    }
+
+
+def build_report(deltas):
+    """
+    Summarize the changed keys of every language
+
+    Args:
+        deltas (dict): LanguageDelta keyed by language code from diff_key_indexes()
+
+    Returns:
+        dict: {"totals": {"added", "removed", "changed"}, "languages": {lang: {"added", "removed", "changed"}}}
+    """
+    totals = {"added": 0, "removed": 0, "changed": 0}
+    languages = {}
+    for lang_code, delta in deltas.items():
+        languages[lang_code] = delta._asdict()
+        for name in totals:
+            totals[name] += len(getattr(delta, name))
+    return {"totals": totals, "languages": languages}
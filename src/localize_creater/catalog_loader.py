@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+import orjson
+from src.localize_creater.build_stats import SOURCE_PLATFORM
+
+CATALOG_FILE_PREFIX = "sample_"
+CATALOG_FILE_EXTENSION = ".json"
+LOADER_THREADS = 8
+
+
+def discover_catalog_files(input_dir, file_suffix=""):
+    """
+    Find every sample_{lang}{file_suffix}.json of a directory with a single os.scandir()
+
+    Args:
+        input_dir (str): Directory with the catalog files
+        file_suffix (str): Suffix of the file names (e.g. "_unified")
+
+    Returns:
+        dict: File paths keyed by language code, in directory order
+    """
+    name_suffix = file_suffix + CATALOG_FILE_EXTENSION
+    paths = {}
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if (name.startswith(CATALOG_FILE_PREFIX) and name.endswith(name_suffix)
+                    and len(name) > len(CATALOG_FILE_PREFIX) + len(name_suffix) and entry.is_file()):
+                paths[name[len(CATALOG_FILE_PREFIX):-len(name_suffix)]] = entry.path
+    return paths
+
+
+def _read_file(path):
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        content = f.read()
+    return content, time.perf_counter() - start
+
+
+def read_catalog_files(paths, stats=None, max_workers=LOADER_THREADS):
+    """
+    Read catalog files concurrently on a thread pool
+
+    File reads release the GIL, so per-file latency (e.g. on network
+    mounts) overlaps. The content is returned as bytes for orjson to parse
+    directly, without a text-mode decode.
+
+    Args:
+        paths (dict): File paths keyed by language code
+        stats (BuildStats): Receives the read time of every file as its "load" time when given
+        max_workers (int): Maximum number of reader threads
+
+    Returns:
+        dict: File contents (bytes) keyed by language code, in the order of paths
+    """
+    if not paths:
+        return {}
+    language_codes = list(paths)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(language_codes))) as executor:
+        results = list(executor.map(_read_file, [paths[lang_code] for lang_code in language_codes]))
+    contents = {}
+    for lang_code, (content, seconds) in zip(language_codes, results):
+        if stats is not None:
+            # BuildStats is not thread-safe, so times are recorded here rather than in the threads
+            stats.add_time(SOURCE_PLATFORM, lang_code, "load", seconds)
+        contents[lang_code] = content
+    return contents
+
+
+def load_catalog_files(input_dir, language_codes=None, file_suffix="", max_workers=LOADER_THREADS):
+    """
+    Discover, read and parse catalog files
+
+    Args:
+        input_dir (str): Directory with the catalog files
+        language_codes (list): Languages to load. Loads every discovered catalog when omitted.
+        file_suffix (str): Suffix of the file names (e.g. "_unified")
+        max_workers (int): Maximum number of reader threads
+
+    Returns:
+        dict: Parsed catalogs keyed by language code. Languages without a file are left out.
+    """
+    paths = discover_catalog_files(input_dir, file_suffix)
+    if language_codes is not None:
+        paths = {lang_code: paths[lang_code] for lang_code in language_codes if lang_code in paths}
+    contents = read_catalog_files(paths, max_workers=max_workers)
+    return {lang_code: orjson.loads(content) for lang_code, content in contents.items()}
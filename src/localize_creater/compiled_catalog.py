@@ -0,0 +1,326 @@
+from array import array
+from collections.abc import Mapping
+import mmap
+import struct
+import sys
+from src.localize_creater.catalog import _CatalogItemsView, _CatalogValuesView
+from src.localize_creater.output_writer import write_if_changed
+
+COMPILED_CATALOG_FILE_NAME = "catalog.lkc"
+COMPILED_CATALOG_MAGIC = b"LKC1"
+COMPILED_CATALOG_VERSION = 1
+
+# magic, version, reserved, language count, key count, blob offset
+_HEADER = struct.Struct("<4sHHIII")
+# code offset, code length, value table offset, order table offset, string count
+_LANGUAGE_ENTRY = struct.Struct("<IIIII")
+# Value table offset of a key the language does not have
+_MISSING = 0xFFFFFFFF
+
+
+def _table_bytes(table):
+    if sys.byteorder != "little":
+        table = array("I", table)
+        table.byteswap()
+    return table.tobytes()
+
+
+def compile_catalog(path, catalogs):
+    """
+    Compile parsed catalogs into a binary .lkc file
+
+    Layout (all integers are little-endian u32):
+        header     "LKC1", version (u16), reserved (u16), language count, key count, blob offset
+        languages  per language: code offset, code length, value table offset, order table offset, string count
+        keys       per key, sorted by UTF-8 bytes: offset and length of the key in the blob
+        values     per language, per key: offset and length of the value in the blob (0xFFFFFFFF if missing)
+        orders     per language: key indexes in the key order of the source file
+        blob       UTF-8 strings, each distinct string stored once
+
+    String offsets are relative to the blob, table offsets to the file start.
+
+    Args:
+        path (str): Output .lkc file path
+        catalogs (Catalog): Parsed catalogs keyed by language code, base language first
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    language_codes = list(catalogs)
+    keys = sorted({key for lang_code in language_codes for key in catalogs[lang_code]},
+                  key=lambda key: key.encode("utf-8"))
+    key_positions = {key: position for position, key in enumerate(keys)}
+
+    blob = bytearray()
+    string_offsets = {}
+
+    def add_string(text):
+        entry = string_offsets.get(text)
+        if entry is None:
+            data = text.encode("utf-8")
+            entry = (len(blob), len(data))
+            blob.extend(data)
+            string_offsets[text] = entry
+        return entry
+
+    key_table = array("I")
+    for key in keys:
+        key_table.extend(add_string(key))
+
+    language_entries = []
+    value_tables = []
+    order_tables = []
+    table_offset = _HEADER.size + _LANGUAGE_ENTRY.size * len(language_codes) + len(key_table) * 4
+    order_offset = table_offset + len(language_codes) * len(keys) * 8
+    for lang_code in language_codes:
+        value_table = array("I", [_MISSING, 0]) * len(keys)
+        order_table = array("I")
+        for key, value in catalogs[lang_code].items():
+            position = key_positions[key]
+            value_table[2 * position], value_table[2 * position + 1] = add_string(value)
+            order_table.append(position)
+        code_offset, code_length = add_string(lang_code)
+        language_entries.append(_LANGUAGE_ENTRY.pack(code_offset, code_length, table_offset,
+                                                     order_offset, len(order_table)))
+        value_tables.append(value_table)
+        order_tables.append(order_table)
+        table_offset += len(value_table) * 4
+        order_offset += len(order_table) * 4
+
+    blob_offset = order_offset
+    if blob_offset + len(blob) >= _MISSING:
+        raise ValueError("Compiled catalog exceeds the 4 GiB limit of the .lkc format")
+    content = b"".join([
+        _HEADER.pack(COMPILED_CATALOG_MAGIC, COMPILED_CATALOG_VERSION, 0,
+                     len(language_codes), len(keys), blob_offset),
+        *language_entries,
+        _table_bytes(key_table),
+        *[_table_bytes(table) for table in value_tables],
+        *[_table_bytes(table) for table in order_tables],
+        blob,
+    ])
+    return write_if_changed(path, content)
+
+
+class CompiledCatalog(Mapping):
+    """
+    Read-only catalog backed by a memory-mapped .lkc file
+
+    Opening only reads the header and the language table; tables are
+    memoryview casts of the mapping and values are decoded from blob
+    slices on access, so opening costs the same for any catalog size.
+    Key lookups binary-search the sorted key table. The catalog maps
+    language codes to CompiledLanguage views that behave like the
+    CatalogLanguage views of a Catalog, so every emitter can consume it.
+
+    Usage:
+        with CompiledCatalog("sample_output/catalog.lkc") as catalogs:
+            catalogs["ja"]["greeting"]
+    """
+
+    __slots__ = ("path", "_mmap", "_view", "_blob", "_key_table", "_keys", "_key_positions", "_languages")
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        try:
+            magic, version, _, language_count, key_count, blob_offset = _HEADER.unpack_from(self._view)
+        except struct.error:
+            magic = version = None
+        if magic != COMPILED_CATALOG_MAGIC or version != COMPILED_CATALOG_VERSION:
+            self.close()
+            raise ValueError(f"Not a compiled catalog (version {COMPILED_CATALOG_VERSION}): {path}")
+
+        self._blob = self._view[blob_offset:]
+        key_table_offset = _HEADER.size + _LANGUAGE_ENTRY.size * language_count
+        self._key_table = self._table(key_table_offset, 2 * key_count)
+        self._keys = None
+        self._key_positions = None
+        self._languages = {}
+        for index in range(language_count):
+            code_offset, code_length, value_offset, order_offset, count = _LANGUAGE_ENTRY.unpack_from(
+                self._view, _HEADER.size + _LANGUAGE_ENTRY.size * index)
+            lang_code = str(self._blob[code_offset:code_offset + code_length], "utf-8")
+            self._languages[lang_code] = CompiledLanguage(
+                self, lang_code, self._table(value_offset, 2 * key_count), self._table(order_offset, count))
+
+    def _table(self, offset, count):
+        table = self._view[offset:offset + 4 * count]
+        if sys.byteorder == "little":
+            return table.cast("I")
+        # Big-endian hosts get a swapped copy instead of a zero-copy cast
+        table = array("I", table.tobytes())
+        table.byteswap()
+        return table
+
+    @property
+    def key_count(self):
+        """
+        Number of distinct keys over all languages
+
+        Returns:
+            int: Size of the key table
+        """
+        return len(self._key_table) // 2
+
+    def key(self, position):
+        """
+        Get a key by its position in the sorted key table
+
+        Args:
+            position (int): Key index
+
+        Returns:
+            str: Key
+        """
+        if self._keys is not None:
+            return self._keys[position]
+        offset = self._key_table[2 * position]
+        return str(self._blob[offset:offset + self._key_table[2 * position + 1]], "utf-8")
+
+    def key_position(self, key):
+        """
+        Find the position of a key in the sorted key table
+
+        Args:
+            key (str): Key
+
+        Returns:
+            int: Key index, or -1 if no language has the key
+        """
+        if self._key_positions is not None:
+            return self._key_positions.get(key, -1)
+        target = key.encode("utf-8")
+        key_table = self._key_table
+        blob = self._blob
+        low, high = 0, len(key_table) // 2
+        while low < high:
+            middle = (low + high) // 2
+            offset = key_table[2 * middle]
+            candidate = blob[offset:offset + key_table[2 * middle + 1]].tobytes()
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def decode_keys(self):
+        """
+        Decode every key once and switch lookups from binary search to a dict
+
+        Worth it before walking whole languages (as the emitters do); single
+        lookups are faster without it.
+        """
+        if self._keys is None:
+            self._keys = [sys.intern(self.key(position)) for position in range(self.key_count)]
+            self._key_positions = {key: position for position, key in enumerate(self._keys)}
+
+    def close(self):
+        """
+        Release the memory mapping
+
+        Values returned by CompiledLanguage.lookup_bytes() must be released first.
+        """
+        for language in getattr(self, "_languages", {}).values():
+            language._release()
+        for name in ("_key_table", "_blob", "_view"):
+            table = getattr(self, name, None)
+            if isinstance(table, memoryview):
+                table.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def __getitem__(self, language_code):
+        return self._languages[language_code]
+
+    def __contains__(self, language_code):
+        return language_code in self._languages
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self):
+        return len(self._languages)
+
+
+class CompiledLanguage(Mapping):
+    """
+    Read-only {key: value} view of one language of a CompiledCatalog
+
+    Iterates in the key order of the language's source file. Pickles as a
+    plain dict, so it can be handed to worker processes.
+    """
+
+    __slots__ = ("language_code", "_catalog", "_values", "_order")
+
+    def __init__(self, catalog, language_code, values, order):
+        self.language_code = language_code
+        self._catalog = catalog
+        self._values = values
+        self._order = order
+
+    def lookup_bytes(self, key):
+        """
+        Get the UTF-8 bytes of a value without copying them out of the mapping
+
+        Args:
+            key (str): Key
+
+        Returns:
+            memoryview: Value bytes, or None if the language does not have the key
+        """
+        position = self._catalog.key_position(key)
+        if position < 0:
+            return None
+        offset = self._values[2 * position]
+        if offset == _MISSING:
+            return None
+        return self._catalog._blob[offset:offset + self._values[2 * position + 1]]
+
+    def __getitem__(self, key):
+        value = self.lookup_bytes(key)
+        if value is None:
+            raise KeyError(key)
+        return str(value, "utf-8")
+
+    def __contains__(self, key):
+        position = self._catalog.key_position(key)
+        return position >= 0 and self._values[2 * position] != _MISSING
+
+    def __iter__(self):
+        return (key for key, _ in self._iter_items())
+
+    def __len__(self):
+        return len(self._order)
+
+    def items(self):
+        return _CatalogItemsView(self)
+
+    def values(self):
+        return _CatalogValuesView(self)
+
+    def _iter_items(self):
+        key = self._catalog.key
+        values = self._values
+        blob = self._catalog._blob
+        for position in self._order:
+            offset = values[2 * position]
+            yield key(position), str(blob[offset:offset + values[2 * position + 1]], "utf-8")
+
+    def _release(self):
+        for table in (self._values, self._order):
+            if isinstance(table, memoryview):
+                table.release()
+
+    def __reduce__(self):
+        return dict, (list(self._iter_items()),)
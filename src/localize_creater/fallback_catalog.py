@@ -0,0 +1,91 @@
+from collections.abc import Mapping
+from src.locale_code.fallback import fallback_chain
+from src.localize_creater.catalog import Catalog
+
+
+class FallbackCatalogs(Mapping):
+    """
+    Catalogs whose languages are materialized from sparse regional overrides
+
+    A language's source only needs the strings that differ from its parent;
+    everything else is inherited along the fallback chain (en-AU -> en-001
+    -> en) and finally from the base language. The merged catalog of every
+    node is built once and cached, so siblings such as en-AU, en-NZ and
+    en-GB all start from the same merged en-001 instead of merging the
+    whole chain again. A node without a source of its own shares its
+    parent's merged catalog.
+
+    Merged languages follow the key order of their parent, with keys only
+    the override has appended in its own order. The base language is used
+    as it is. source_languages names the languages that have a source
+    (e.g. the discovered JSON files when catalogs loads on access) and
+    defaults to the languages in catalogs.
+
+    Usage:
+        catalogs = FallbackCatalogs(load_packed_catalog(path), "en")
+        catalogs["en-AU"]["color"]
+    """
+
+    def __init__(self, catalogs, base_language_code, source_languages=None):
+        self.catalogs = catalogs
+        self.base_language_code = base_language_code
+        # Ordered like a list, looked up like a set
+        self._source_languages = dict.fromkeys(catalogs if source_languages is None else source_languages)
+        self._merged = Catalog(pool=getattr(catalogs, "pool", None))
+        self._languages = {}
+
+    def chain_sources(self, language_code):
+        """
+        Get the languages whose sources a merged language is built from
+
+        Args:
+            language_code (str): Language code
+
+        Returns:
+            list: Languages with a source, most specific first
+        """
+        if language_code == self.base_language_code:
+            return [language_code]
+        return [lang_code for lang_code in fallback_chain(language_code, self.base_language_code)
+                if lang_code in self._source_languages]
+
+    def prefetch(self, language_codes):
+        """
+        Read ahead the sources of several languages and of everything they inherit from
+
+        Args:
+            language_codes (list): Languages that are about to be accessed
+        """
+        prefetch = getattr(self.catalogs, "prefetch", None)
+        if prefetch is not None:
+            sources = {}
+            for lang_code in language_codes:
+                sources.update(dict.fromkeys(self.chain_sources(lang_code)))
+            prefetch(list(sources))
+
+    def __getitem__(self, language_code):
+        language = self._languages.get(language_code)
+        if language is not None:
+            return language
+        if language_code == self.base_language_code:
+            language = self.catalogs[language_code]
+        else:
+            chain = fallback_chain(language_code, self.base_language_code)
+            parent = self[chain[1]]
+            if language_code not in self._source_languages:
+                language = parent
+            else:
+                merged = dict(parent.items())
+                merged.update(self.catalogs[language_code].items())
+                language = self._merged.add_language(language_code, merged)
+        self._languages[language_code] = language
+        return language
+
+    def __contains__(self, language_code):
+        return language_code == self.base_language_code or language_code in self._source_languages
+
+    def __iter__(self):
+        return iter(self._source_languages)
+
+    def __len__(self):
+        return len(self._source_languages)
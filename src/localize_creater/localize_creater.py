@@ -1,7 +1,33 @@
+import asyncio
+import functools
+import io
 import orjson
 import os
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from src.locale_code.fallback import fallback_chain
+from src.localize_creater.android_xml_writer import android_xml_bytes, android_xml_string, write_android_xml
+from src.localize_creater.build_manifest import BuildManifest, MANIFEST_FILE_NAME
+from src.localize_creater.build_stats import ALL_LANGUAGES, BuildStats, SOURCE_PLATFORM
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.catalog_delta import KEY_INDEX_FILE_NAME, PATCH_FILE_NAME, REPORT_FILE_NAME
+from src.localize_creater.catalog_delta import build_key_index, build_patch, build_report, diff_key_indexes
+from src.localize_creater.catalog_delta import load_key_index, write_key_index
+from src.localize_creater.catalog_loader import discover_catalog_files, read_catalog_files
+from src.localize_creater.compiled_catalog import COMPILED_CATALOG_FILE_NAME, CompiledCatalog, compile_catalog
+from src.localize_creater.fallback_catalog import FallbackCatalogs
+from src.localize_creater.output_writer import AtomicOutput, write_if_changed
+from src.localize_creater.packed_catalog import PACKED_CATALOG_FILE_NAME, load_packed_catalog, pack_catalog_files
+from src.localize_creater.parameter_converter import convert_catalog, get_converter
+from src.localize_creater.parameter_tokenizer import placeholders
+from src.localize_creater.react_js_writer import write_react_js
+from src.localize_creater.source_watcher import SourceWatcher
+from src.localize_creater.xcstrings_writer import iter_xcstrings_entries, write_xcstrings
+
+
+PLATFORM_LIST = ["android", "flutter", "xcode", "react"]
 
 
 class LocalizeCreater:
@@ -9,75 +35,800 @@ class LocalizeCreater:
         self.target_language_code_list = []
         self.base_language_code = None
         self.sdk = None
+        self.input_dir = "./sample_data"
+        self.output_dir = "./sample_output"
+        self.jobs = 1
+        self.incremental = False
+        self.stats_path = None
+        self.compiled_catalog_path = None
+        self.packed_catalog_path = None
+        self.fallback = False
+        self.verbose = True
+        self._manifest = None
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    def _input_path(self, language_code, file_suffix=""):
+        return f"{self.input_dir}/sample_{language_code}{file_suffix}.json"
+
+    def _source_path(self, language_code, file_suffix=""):
+        # File an output is generated from, for the build manifest
+        if self.compiled_catalog_path:
+            return self.compiled_catalog_path
+        if self.packed_catalog_path:
+            return self.packed_catalog_path
+        return self._input_path(language_code, file_suffix)
+
+    def _source_paths(self, language_codes, file_suffix=""):
+        """
+        Get the files outputs of some languages are generated from, for the build manifest
+
+        Args:
+            language_codes (list): Languages of the outputs
+            file_suffix (str): Suffix appended to the JSON file names (e.g. "_unified")
+
+        Returns:
+            list: Source file paths without duplicates. With fallback, every existing file along the chains.
+        """
+        if not self.fallback or self.compiled_catalog_path or self.packed_catalog_path:
+            return list(dict.fromkeys(self._source_path(lang_code, file_suffix) for lang_code in language_codes))
+        paths = {}
+        for lang_code in language_codes:
+            if lang_code == self.base_language_code:
+                chain = (lang_code,)
+            else:
+                chain = fallback_chain(lang_code, self.base_language_code)
+            for chain_lang_code in chain:
+                path = self._input_path(chain_lang_code, file_suffix)
+                if chain_lang_code == self.base_language_code or os.path.exists(path):
+                    paths[path] = None
+        return list(paths)
+
+    def _open_catalogs(self, file_suffix, stats):
+        """
+        Open the source catalogs of a build
+
+        Args:
+            file_suffix (str): Suffix appended to the JSON file names (e.g. "_unified")
+            stats (BuildStats): Receives the load/parse times and string counts
+
+        Returns:
+            Catalog: The compiled or packed catalog if one is set, otherwise JSON catalogs parsed on first access.
+                Wrapped in FallbackCatalogs when fallback is enabled.
+        """
+        if self.compiled_catalog_path:
+            source_path = self.compiled_catalog_path
+            with stats.measure(SOURCE_PLATFORM, ALL_LANGUAGES, "load"):
+                catalogs = CompiledCatalog(source_path)
+                catalogs.decode_keys()
+        elif self.packed_catalog_path:
+            source_path = self.packed_catalog_path
+            # Rows are read and parsed together while streaming
+            with stats.measure(SOURCE_PLATFORM, ALL_LANGUAGES, "parse"):
+                catalogs = load_packed_catalog(source_path)
+        else:
+            catalogs = LazyCatalogs(self, file_suffix, stats)
+            if self.fallback:
+                return FallbackCatalogs(catalogs, self.base_language_code,
+                                        discover_catalog_files(self.input_dir, file_suffix))
+            return catalogs
+        # With fallback, regional languages may be left out and inherit everything
+        required_languages = [self.base_language_code]
+        if not self.fallback:
+            required_languages += self.target_language_code_list
+        for lang_code in required_languages:
+            if lang_code not in catalogs:
+                if isinstance(catalogs, CompiledCatalog):
+                    catalogs.close()
+                raise ValueError(f"Language {lang_code} is not in catalog: {source_path}")
+        for lang_code in [self.base_language_code] + self.target_language_code_list:
+            if lang_code in catalogs:
+                self._count_source(lang_code, catalogs[lang_code], stats)
+        if self.fallback:
+            return FallbackCatalogs(catalogs, self.base_language_code)
+        return catalogs
+
+    def _close_catalogs(self, catalogs):
+        """
+        Release the memory mapping of a compiled catalog returned by _open_catalogs()
+
+        Args:
+            catalogs (Catalog): Catalogs returned by _open_catalogs(). Nothing is done unless they are compiled.
+        """
+        source_catalogs = catalogs.catalogs if isinstance(catalogs, FallbackCatalogs) else catalogs
+        if isinstance(source_catalogs, CompiledCatalog):
+            source_catalogs.close()
+
+    def load_catalog(self, language_code, file_suffix="", stats=None, content=None):
+        """
+        Load a single unified source catalog
+
+        Args:
+            language_code (str): Language code of the catalog to load
+            file_suffix (str): Suffix appended to the file name (e.g. "_unified")
+            stats (BuildStats): Receives the load/parse times and string counts when given
+            content (bytes): Already read file content (e.g. from read_catalog_files()). Read from disk when omitted.
+
+        Returns:
+            dict: Parsed key-value pairs of the catalog
+        """
+        if stats is None:
+            stats = BuildStats()
+        if content is None:
+            with stats.measure(SOURCE_PLATFORM, language_code, "load"):
+                # orjson parses the UTF-8 bytes directly, without a text-mode decode first
+                with open(self._input_path(language_code, file_suffix), "rb") as f:
+                    content = f.read()
+        with stats.measure(SOURCE_PLATFORM, language_code, "parse"):
+            catalog = orjson.loads(content)
+        self._count_source(language_code, catalog, stats)
+        return catalog
+
+    def _count_source(self, language_code, catalog, stats):
+        # Same counters for every source type (JSON, compiled and packed)
+        stats.count(
+            SOURCE_PLATFORM, language_code,
+            strings=len(catalog),
+            placeholders=sum(len(placeholders(value)) for value in catalog.values()),
+        )
+
+    def load_catalogs(self, file_suffix=""):
+        """
+        Load the base and target catalogs, reading the files concurrently and parsing each exactly once
+
+        Args:
+            file_suffix (str): Suffix appended to the file names (e.g. "_unified")
+
+        Returns:
+            Catalog: Parsed catalogs keyed by language code, base language first
+        """
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        catalogs = LazyCatalogs(self, file_suffix)
+        catalogs.prefetch(all_languages)
+        for lang_code in all_languages:
+            catalogs[lang_code]
+        return catalogs
+
+    def _prefetch(self, catalogs, language_codes):
+        # Only JSON catalogs that are parsed on first access have anything to read ahead
+        if isinstance(catalogs, (LazyCatalogs, FallbackCatalogs)):
+            catalogs.prefetch(language_codes)
+
+    def compile_catalogs(self, output_path=None):
+        """
+        Compile the base and target catalogs into a binary .lkc file
+
+        Later builds (set_compiled_catalog_path()) and lookups can memory-map
+        it instead of parsing the JSON files of every language.
+
+        Args:
+            output_path (str): Output file path. Defaults to catalog.lkc in the output directory.
+
+        Returns:
+            str: Path of the compiled catalog
+        """
+        if output_path is None:
+            output_path = f"{self.output_dir}/{COMPILED_CATALOG_FILE_NAME}"
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        compile_catalog(output_path, self.load_catalogs())
+        self._log(f"Compiled catalog generated successfully: {output_path}")
+        return output_path
+
+    def pack_catalogs(self, output_path=None, file_suffix=""):
+        """
+        Pack the base and target catalogs into one multi-language JSON Lines file
+
+        Args:
+            output_path (str): Output file path. Defaults to catalogs.jsonl in the input directory.
+            file_suffix (str): Suffix appended to the file names (e.g. "_unified")
+
+        Returns:
+            str: Path of the packed catalog
+        """
+        if output_path is None:
+            output_path = f"{self.input_dir}/{PACKED_CATALOG_FILE_NAME}"
+        pack_catalog_files(self.input_dir, output_path,
+                           [self.base_language_code] + self.target_language_code_list, file_suffix)
+        self._log(f"Packed catalog generated successfully: {output_path}")
+        return output_path
+
+    def create_delta(self, previous, platform=None, output_dir=None):
+        """
+        Write only what changed since a previous catalog version
+
+        The current catalogs are indexed by key with a short hash per value
+        and compared with the key index of the previous version, so added,
+        removed and changed keys are found with hash lookups instead of
+        comparing whole files. Writes the patch for over-the-air updates,
+        the changed-keys report and the key index of the current version,
+        which can be passed as previous to the next delta.
+
+        Args:
+            previous (str): Previous version: a key_index.json, a directory of JSON catalogs,
+                a packed .jsonl or a compiled .lkc catalog
+            platform (str): Convert the patched values to this platform's parameter format
+            output_dir (str): Directory for the delta files. Defaults to delta/ in the output directory.
+
+        Returns:
+            dict: Changed-keys report
+        """
+        if platform is not None and platform not in PLATFORM_LIST:
+            raise ValueError(f"Invalid platform: {platform}")
+        if output_dir is None:
+            output_dir = f"{self.output_dir}/delta"
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        old_index = load_key_index(previous, all_languages,
+                                   base_language_code=self.base_language_code if self.fallback else None)
+        catalogs = self._open_catalogs("", BuildStats())
+        try:
+            self._prefetch(catalogs, all_languages)
+            new_index = build_key_index(catalogs, all_languages)
+            deltas = diff_key_indexes(old_index, new_index)
+            patch = build_patch(catalogs, deltas, old_index, new_index, platform)
+        finally:
+            self._close_catalogs(catalogs)
+        report = build_report(deltas)
+
+        os.makedirs(output_dir, exist_ok=True)
+        write_if_changed(f"{output_dir}/{PATCH_FILE_NAME}", orjson.dumps(patch, option=orjson.OPT_INDENT_2))
+        write_if_changed(f"{output_dir}/{REPORT_FILE_NAME}", orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        write_key_index(f"{output_dir}/{KEY_INDEX_FILE_NAME}", new_index)
+        totals = report["totals"]
+        self._log(f"Delta generated successfully: {output_dir} "
+                  f"({totals['added']} added, {totals['removed']} removed, {totals['changed']} changed)")
+        return report
+
+    def _finish_stats(self, stats):
+        stats.finish()
+        if self.stats_path:
+            stats.write_json(self.stats_path)
+        return stats
+
+    def _count_output(self, platform, language_code, stats, changed, size):
+        if changed:
+            stats.count(platform, language_code, bytes_written=size)
+        else:
+            stats.count(platform, language_code, unchanged_outputs=1)
+
+    def _write_output(self, output_path, content, platform, language_code, stats):
+        """
+        Write a rendered output file if its content changed and record the write time and size
+
+        Args:
+            output_path (str): Output file path
+            content (bytes): Rendered file content
+            platform (str): Platform name for the stats
+            language_code (str): Language code for the stats ("*" for combined outputs)
+            stats (BuildStats): Build stats to record into
+        """
+        with stats.measure(platform, language_code, "write"):
+            changed = write_if_changed(output_path, content)
+        self._count_output(platform, language_code, stats, changed, len(content))
+
+    @contextmanager
+    def _stream_output(self, output_path, platform, language_code, stats):
+        """
+        Stream an output file that replaces the target only if its content changed
+
+        Opening and committing the file are recorded as the "write" stage, then
+        the written size (or an unchanged output). On error the target is left untouched.
+
+        Args:
+            output_path (str): Output file path
+            platform (str): Platform name for the stats
+            language_code (str): Language code for the stats ("*" for combined outputs)
+            stats (BuildStats): Build stats to record into
+
+        Yields:
+            file: Binary stream to write the content to
+        """
+        output = AtomicOutput(output_path)
+        start = time.perf_counter()
+        with output as f:
+            stats.add_time(platform, language_code, "write", time.perf_counter() - start)
+            yield f
+            start = time.perf_counter()
+        stats.add_time(platform, language_code, "write", time.perf_counter() - start)
+        self._count_output(platform, language_code, stats, output.changed, output.size)
+
+    def _get_manifest(self):
+        manifest_path = f"{self.output_dir}/{MANIFEST_FILE_NAME}"
+        if self._manifest is None or self._manifest.path != manifest_path:
+            self._manifest = BuildManifest(manifest_path)
+        return self._manifest
+
+    def _select_stale_outputs(self, output_inputs, options):
+        """
+        Drop outputs that are up to date when building incrementally
+
+        Args:
+            output_inputs (dict): Input file paths keyed by output file path
+            options (dict): Emitter options that affect the outputs
+
+        Returns:
+            list: Output paths that have to be generated
+        """
+        if not self.incremental:
+            return list(output_inputs)
+        manifest = self._get_manifest()
+        stale_outputs = []
+        for output_path, input_paths in output_inputs.items():
+            if manifest.is_up_to_date(output_path, input_paths, options):
+                self._log(f"Up to date, skipped: {output_path}")
+            else:
+                stale_outputs.append(output_path)
+        return stale_outputs
+
+    def _record_outputs(self, output_inputs, options):
+        """
+        Record generated outputs in the build manifest when building incrementally
+
+        Args:
+            output_inputs (dict): Input file paths keyed by generated output file path
+            options (dict): Emitter options the outputs were generated with
+        """
+        if not self.incremental or not output_inputs:
+            return
+        manifest = self._get_manifest()
+        for output_path, input_paths in output_inputs.items():
+            manifest.record(output_path, input_paths, options)
+        manifest.save()
+
+    def create_all(self, platforms=None, use_unified=False):
+        """
+        Create localization files for several platforms from a single load
+
+        Every catalog is parsed at most once and the parsed data is shared
+        by all selected emitters. Catalogs only needed by up-to-date outputs
+        are not parsed at all in incremental mode.
+
+        Args:
+            platforms (list): Platforms to generate ('android', 'flutter', 'xcode', 'react').
+                Defaults to all of them.
+            use_unified (bool): If True, use the unified JSON files with Android-style parameters
+
+        Returns:
+            BuildStats: Per-stage times and counters of the whole build
+        """
+        if platforms is None:
+            platforms = PLATFORM_LIST
+        for platform in platforms:
+            if platform not in PLATFORM_LIST:
+                raise ValueError(f"Invalid platform: {platform}")
+
+        stats = BuildStats()
+        file_suffix = "_unified" if use_unified else ""
+        catalogs = self._open_catalogs(file_suffix, stats)
+        try:
+            self._build_platforms(platforms, use_unified, catalogs, stats)
+        finally:
+            self._close_catalogs(catalogs)
+        return self._finish_stats(stats)
+
+    def _build_platforms(self, platforms, use_unified, catalogs, stats, language_codes=None):
+        """
+        Run the selected emitters on shared catalogs
+
+        Args:
+            platforms (list): Platforms to generate
+            use_unified (bool): If True, use the unified JSON files with Android-style parameters
+            catalogs (Catalog): Catalogs shared by all emitters
+            stats (BuildStats): Stats to record into
+            language_codes (list): Only generate the per-language files of these languages.
+                Files that combine all languages are always generated.
+        """
+        if "android" in platforms:
+            self.create_android(use_unified, catalogs=catalogs, stats=stats, language_codes=language_codes)
+        if "flutter" in platforms:
+            self.create_flutter(catalogs=catalogs, stats=stats, language_codes=language_codes)
+        if "xcode" in platforms:
+            self.create_xcode(use_unified, catalogs=catalogs, stats=stats)
+        if "react" in platforms:
+            self.create_react(catalogs=catalogs, stats=stats)
+
+    def watch(self, platforms=None, interval=0.1, stop_event=None, on_build=None):
+        """
+        Build once, then rebuild whenever a source catalog changes
+
+        The catalogs stay in memory between builds. When a catalog file
+        changes, only that file is parsed again and only that language's
+        Android and Flutter files are regenerated. The Xcode and React files,
+        which combine all languages, are re-serialized from the in-memory
+        catalogs and only rewritten if their content changed. A file that
+        cannot be parsed (e.g. saved half-way) is reported and the
+        previous strings are kept until the next change.
+
+        Args:
+            platforms (list): Platforms to generate. Defaults to all of them.
+            interval (float): Seconds between polls of the input directory
+            stop_event (threading.Event): Stops watching when set. Watches until interrupted when omitted.
+            on_build (function): Called with (changed language codes, BuildStats) after every build
+        """
+        if platforms is None:
+            platforms = PLATFORM_LIST
+        for platform in platforms:
+            if platform not in PLATFORM_LIST:
+                raise ValueError(f"Invalid platform: {platform}")
+        if self.compiled_catalog_path or self.packed_catalog_path:
+            raise ValueError("Watch mode reads the per-language JSON files, not a compiled or packed catalog")
+        if self.fallback:
+            raise ValueError("Watch mode does not support fallback chains")
+        if stop_event is None:
+            stop_event = threading.Event()
+
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        watcher = SourceWatcher(self.input_dir, all_languages)
+        watcher.poll()
+        stats = BuildStats()
+        catalogs = LazyCatalogs(self, stats=stats)
+        changed = all_languages
+        language_codes = None
+        while True:
+            self._build_platforms(platforms, False, catalogs, stats, language_codes)
+            self._finish_stats(stats)
+            self._log(f"Built {', '.join(changed)} in {stats.wall_time * 1000:.0f} ms, watching {self.input_dir}")
+            if on_build is not None:
+                on_build(changed, stats)
+
+            changed = []
+            while not changed:
+                if stop_event.wait(interval):
+                    return
+                # The reload is part of the next build, so it records into that build's stats
+                stats = BuildStats()
+                changed = self.reload_catalogs(catalogs, watcher.poll(), stats)
+            language_codes = changed
+
+    def reload_catalogs(self, catalogs, changed_languages, stats=None):
+        """
+        Parse changed catalog files again, skipping files that cannot be parsed
+
+        Args:
+            catalogs (LazyCatalogs): Catalogs kept in memory between builds
+            changed_languages (list): Languages whose files changed
+            stats (BuildStats): Receives the load/parse times and string counts when given.
+                Defaults to the stats the catalogs were created with.
+
+        Returns:
+            list: Languages that were reloaded
+        """
+        reloaded = []
+        for lang_code in changed_languages:
+            try:
+                catalogs._load(lang_code, stats=stats)
+            except (OSError, orjson.JSONDecodeError) as e:
+                self._log(f"Could not load {self._input_path(lang_code)}, keeping the previous strings: {e}")
+                continue
+            reloaded.append(lang_code)
+        return reloaded
+
+    async def create_all_async(self, platforms=None, use_unified=False, max_in_flight=4, executor=None):
+        """
+        Create localization files for several platforms without blocking the event loop
+
+        Per-language outputs (Android, Flutter) are pipelined: every language
+        is loaded, rendered and written on its own, with up to max_in_flight
+        languages in progress at a time, so one language can be written
+        while the next is being parsed. All blocking work runs in the
+        executor. Outputs that combine all languages (Xcode, React) are
+        generated afterwards from the same catalogs. The output is identical
+        to create_all().
+
+        Args:
+            platforms (list): Platforms to generate ('android', 'flutter', 'xcode', 'react').
+                Defaults to all of them.
+            use_unified (bool): If True, use the unified JSON files with Android-style parameters
+            max_in_flight (int): Maximum number of languages loaded and rendered at the same time
+            executor (concurrent.futures.Executor): Executor for the blocking work.
+                The event loop's default executor when omitted.
+
+        Returns:
+            BuildStats: Per-stage times and counters of the whole build
+        """
+        if platforms is None:
+            platforms = PLATFORM_LIST
+        for platform in platforms:
+            if platform not in PLATFORM_LIST:
+                raise ValueError(f"Invalid platform: {platform}")
+        if max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight: {max_in_flight}")
+
+        loop = asyncio.get_running_loop()
+
+        def run(func, *args):
+            return loop.run_in_executor(executor, func, *args)
+
+        stats = BuildStats()
+        file_suffix = "_unified" if use_unified else ""
+        catalogs = await run(self._open_catalogs, file_suffix, stats)
+        try:
+            # (platform, output languages, input paths, options, render method) of the per-language outputs
+            per_language_outputs = []
+            if "android" in platforms:
+                output_languages = self._android_output_languages()
+                output_inputs = {path: self._source_paths([lang_code], file_suffix)
+                                 for path, lang_code in output_languages.items()}
+                options = {"platform": "android", "fallback": self.fallback}
+                per_language_outputs.append(("android", output_languages, output_inputs, options,
+                                             self.render_android_language))
+            if "flutter" in platforms:
+                output_languages = self._flutter_output_languages()
+                output_inputs = {path: self._source_paths([lang_code]) for path, lang_code in output_languages.items()}
+                options = {"platform": "flutter", "fallback": self.fallback}
+                per_language_outputs.append(("flutter", output_languages, output_inputs, options,
+                                             self.render_flutter_language))
+
+            # Outputs to generate for each language, in language order
+            language_jobs = {lang_code: [] for lang_code in [self.base_language_code] + self.target_language_code_list}
+            stale_output_inputs = []
+            for platform, output_languages, output_inputs, options, render in per_language_outputs:
+                stale_outputs = await run(self._select_stale_outputs, output_inputs, options)
+                for output_path in stale_outputs:
+                    language_jobs[output_languages[output_path]].append((platform, output_path, render))
+                stale_output_inputs.append(({path: output_inputs[path] for path in stale_outputs}, options))
+
+            semaphore = asyncio.Semaphore(max_in_flight)
+            catalog_lock = threading.Lock()
+            source_catalogs = catalogs.catalogs if isinstance(catalogs, FallbackCatalogs) else catalogs
+            loads = {}
+
+            def load(lang_code, language_stats):
+                # A source on the chain of several languages (e.g. the base language) is loaded once
+                if lang_code not in loads:
+                    loads[lang_code] = run(self._load_language, source_catalogs, lang_code, file_suffix,
+                                           language_stats, catalog_lock)
+                return loads[lang_code]
+
+            async def build_language(lang_code, jobs):
+                async with semaphore:
+                    # Every language records into its own stats, so executor threads never share one
+                    language_stats = BuildStats()
+                    if isinstance(source_catalogs, LazyCatalogs):
+                        if isinstance(catalogs, FallbackCatalogs):
+                            source_languages = catalogs.chain_sources(lang_code)
+                        else:
+                            source_languages = [lang_code]
+                        for source_lang_code in source_languages:
+                            await load(source_lang_code, language_stats)
+                    data = await run(self._resolve_language, catalogs, lang_code, catalog_lock)
+                    for platform, output_path, render in jobs:
+                        content = await run(render, lang_code, data, language_stats)
+                        await run(self._write_output, output_path, content, platform, lang_code, language_stats)
+                stats.merge(language_stats)
+
+            # Let every language finish before failing, so no executor job still reads the catalogs once they close
+            results = await asyncio.gather(*(build_language(lang_code, jobs)
+                                             for lang_code, jobs in language_jobs.items() if jobs),
+                                           return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+            for output_inputs, options in stale_output_inputs:
+                await run(self._record_outputs, output_inputs, options)
+
+            # Combined outputs need every language, so they run once the pipeline is done
+            if "xcode" in platforms:
+                await run(functools.partial(self.create_xcode, use_unified, catalogs=catalogs, stats=stats))
+            if "react" in platforms:
+                await run(functools.partial(self.create_react, catalogs=catalogs, stats=stats))
+        finally:
+            self._close_catalogs(catalogs)
+        return await run(self._finish_stats, stats)
+
+    async def create_android_async(self, use_unified=False, max_in_flight=4, executor=None):
+        """
+        Async variant of create_android(), see create_all_async()
+
+        Returns:
+            BuildStats: Per-stage times and counters
+        """
+        return await self.create_all_async(["android"], use_unified, max_in_flight, executor)
+
+    async def create_flutter_async(self, max_in_flight=4, executor=None):
+        """
+        Async variant of create_flutter(), see create_all_async()
+
+        Returns:
+            BuildStats: Per-stage times and counters
+        """
+        return await self.create_all_async(["flutter"], False, max_in_flight, executor)
+
+    async def create_xcode_async(self, use_unified=False, executor=None):
+        """
+        Async variant of create_xcode(), see create_all_async()
+
+        Returns:
+            BuildStats: Per-stage times and counters
+        """
+        return await self.create_all_async(["xcode"], use_unified, executor=executor)
+
+    async def create_react_async(self, executor=None):
+        """
+        Async variant of create_react(), see create_all_async()
+
+        Returns:
+            BuildStats: Per-stage times and counters
+        """
+        return await self.create_all_async(["react"], executor=executor)
+
+    def _load_language(self, catalogs, language_code, file_suffix, stats, catalog_lock):
+        """
+        Load one language into shared catalogs from an executor thread
+
+        Reading and parsing run unlocked; only adding to the shared key
+        index and string pool of the catalogs holds the lock.
+
+        Args:
+            catalogs (LazyCatalogs): Catalogs shared by all languages of the build
+            language_code (str): Language to load
+            file_suffix (str): Suffix appended to the file name (e.g. "_unified")
+            stats (BuildStats): Stats of this language only
+            catalog_lock (threading.Lock): Lock guarding the catalogs
+        """
+        if language_code in catalogs:
+            return
+        catalog = self.load_catalog(language_code, file_suffix, stats)
+        with catalog_lock:
+            catalogs._add_parsed(language_code, catalog, stats)
+
+    def _resolve_language(self, catalogs, language_code, catalog_lock):
+        """
+        Get one language of shared catalogs from an executor thread
+
+        Its sources must already be loaded. Merging a fallback chain adds
+        to the cache and string pool shared by all languages, so it holds the lock.
+
+        Args:
+            catalogs (Catalog): Catalogs shared by all languages of the build
+            language_code (str): Language to get
+            catalog_lock (threading.Lock): Lock guarding the catalogs
+
+        Returns:
+            Mapping: Strings of the language
+        """
+        if isinstance(catalogs, FallbackCatalogs):
+            with catalog_lock:
+                return catalogs[language_code]
+        return catalogs[language_code]
 
-    def create_flutter(self):
-        print(f"Target language code list: {self.target_language_code_list}")
-        print(f"Base language code: {self.base_language_code}.json")
-        print(f"SDK: {self.sdk}")
-        with open(f"./sample_data/sample_{self.base_language_code}.json", "r") as f:
-            data_base = orjson.loads(f.read())
+    def create_flutter(self, catalogs=None, stats=None, language_codes=None):
+        """
+        Create Flutter ARB localization files with unified parameter handling
+
+        Args:
+            catalogs (Catalog): Already parsed catalogs keyed by language code. Loaded from disk when omitted.
+            stats (BuildStats): Stats of an enclosing build to record into. A new one is created when omitted.
+            language_codes (list): Only generate the files of these languages. Defaults to all languages.
+
+        Returns:
+            BuildStats: Per-stage times and counters
+        """
+        self._log(f"Target language code list: {self.target_language_code_list}")
+        self._log(f"Base language code: {self.base_language_code}.json")
+        self._log(f"SDK: {self.sdk}")
+        standalone = stats is None
+        if standalone:
+            stats = BuildStats()
+        opened = catalogs is None
+        if opened:
+            catalogs = self._open_catalogs("", stats)
+        try:
+            flutter_output_dir = f"{self.output_dir}/dart"
+            os.makedirs(flutter_output_dir, exist_ok=True)
+
+            output_languages = self._flutter_output_languages(language_codes)
+            output_inputs = {path: self._source_paths([lang_code]) for path, lang_code in output_languages.items()}
+            options = {"platform": "flutter", "fallback": self.fallback}
+            stale_outputs = self._select_stale_outputs(output_inputs, options)
+
+            languages = [output_languages[path] for path in stale_outputs]
+            self._prefetch(catalogs, languages)
+            arb_contents = self._map_languages(self.render_flutter_language, languages, catalogs, stats)
+            for output_path, lang_code, arb_content in zip(stale_outputs, languages, arb_contents):
+                self._write_output(output_path, arb_content, 'flutter', lang_code, stats)
+            self._record_outputs({path: output_inputs[path] for path in stale_outputs}, options)
+
+            self._log("Flutter ARB files with unified parameters generated successfully!")
+            self._log(f"Files created in: {flutter_output_dir}/")
+            self._log("- app_en.arb (base language)")
+            for lang in self.target_language_code_list:
+                self._log(f"- app_{lang}.arb")
+        finally:
+            if opened:
+                self._close_catalogs(catalogs)
+        return self._finish_stats(stats) if standalone else stats
+
+    def _flutter_output_languages(self, language_codes=None):
+        # ARB file path of every language, or of the given languages only
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        return {f"{self.output_dir}/dart/app_{lang_code}.arb": lang_code for lang_code in all_languages
+                if language_codes is None or lang_code in language_codes}
+
+    def render_flutter_language(self, language_code, data, stats=None):
+        """
+        Render the Flutter ARB content of a single language
+
+        Args:
+            language_code (str): Language code for the localization
+            data (CatalogLanguage): Unified source strings of the language
+            stats (BuildStats): Receives the convert/serialize times when given
+
+        Returns:
+            bytes: ARB file content (UTF-8)
+        """
+        if stats is None:
+            stats = BuildStats()
+        with stats.measure('flutter', language_code, "convert"):
             new_data = {}
-            new_data["@@locale"] = self.base_language_code
-            converted_data = {}
-            for key, value in data_base.items():
-                converted_data[key] = self.convert_parameters_for_platform(value, 'flutter')            
+            new_data["@@locale"] = language_code
+
+            # Convert parameters for Flutter platform
+            converted_data = self.convert_catalog(data, 'flutter')
+
             new_data = { **new_data, **converted_data }
-            new_data = self._add_flutter_parameter_placeholders(new_data)
-            with open(f"./sample_output/dart/app_{self.base_language_code}.arb", "w") as g:
-                g.write(orjson.dumps(new_data, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        for target_language_code in self.target_language_code_list:
-            with open(f"./sample_data/sample_{target_language_code}.json", "r") as f:
-                data_base = orjson.loads(f.read())
-                new_data = {}
-                new_data["@@locale"] = target_language_code
-                
-                # Convert parameters for Flutter platform
-                converted_data = {}
-                for key, value in data_base.items():
-                    converted_data[key] = self.convert_parameters_for_platform(value, 'flutter')
-                
-                new_data = { **new_data, **converted_data }
-                
-                # Add parameter placeholders for Flutter ARB format
-                new_data = self._add_flutter_parameter_placeholders(new_data)
-                
-                with open(f"./sample_output/dart/app_{target_language_code}.arb", "w") as g:
-                    g.write(orjson.dumps(new_data, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        
-        print("Flutter ARB files with unified parameters generated successfully!")
-        print("Files created in: ./sample_output/dart/")
-        print("- app_en.arb (base language)")
-        for lang in self.target_language_code_list:
-            print(f"- app_{lang}.arb")
 
-    def _add_flutter_parameter_placeholders(self, data):
+            # Add parameter placeholders for Flutter ARB format
+            new_data = self._add_flutter_parameter_placeholders(new_data, data)
+        with stats.measure('flutter', language_code, "serialize"):
+            arb_content = orjson.dumps(new_data, option=orjson.OPT_INDENT_2)
+        stats.count('flutter', language_code, strings=len(data))
+        return arb_content
+
+    def _map_languages(self, render, language_codes, catalogs, stats):
+        """
+        Render every language, fanning out over worker processes when jobs > 1
+
+        Args:
+            render (method): Bound render_*_language method taking (language_code, data, stats)
+            language_codes (list): Languages to render
+            catalogs (Catalog): Parsed catalogs keyed by language code
+            stats (BuildStats): Receives the render times, including those measured in workers
+
+        Returns:
+            list: Rendered contents in the order of language_codes
+        """
+        if self.jobs <= 1 or len(language_codes) <= 1:
+            return [render(lang_code, catalogs[lang_code], stats) for lang_code in language_codes]
+        max_workers = min(self.jobs, len(language_codes))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map keeps the input order, so outputs are written deterministically
+            results = list(executor.map(
+                _render_language_job,
+                [render.__name__] * len(language_codes),
+                language_codes,
+                [catalogs[lang_code] for lang_code in language_codes],
+            ))
+        contents = []
+        for content, worker_stats in results:
+            stats.merge(worker_stats)
+            contents.append(content)
+        return contents
+
+    def _add_flutter_parameter_placeholders(self, data, source_data):
         """
         Add Flutter ARB parameter placeholders for strings with parameters
+
+        Parameters are taken from the tokenized unified strings, so the
+        converted Flutter text does not have to be scanned again.
         
         Args:
             data (dict): Dictionary containing localization data
+            source_data (dict): Unified source strings the data was converted from
             
         Returns:
             dict: Updated dictionary with parameter placeholders
         """
-        import re
-        
-        # Create a copy of items to avoid changing dict during iteration
-        items_to_process = list(data.items())
-        
-        for key, value in items_to_process:
-            if key == "@@locale":
-                continue
-                
-            # Find all {parameter} patterns in the string
-            param_pattern = r'\{(\w+)\}'
-            params = re.findall(param_pattern, str(value))
-            
+        for key, value in source_data.items():
+            params = placeholders(value)
+
             if params:
                 # Create parameter placeholders for Flutter ARB format
                 param_placeholders = {}
                 for param in params:
-                    param_placeholders[f"{param}"] = f"String{param.capitalize()}"
+                    param_placeholders[f"param{param.index}"] = f"StringParam{param.index}"
                 
                 # Add the parameter placeholders to the data
                 data[f"{key}@parameter"] = param_placeholders
@@ -90,77 +841,25 @@ class LocalizeCreater:
         
         Args:
             text (str): Text with Android-style parameters (%1$s, %2$d, etc.)
-            platform (str): Target platform ('android', 'flutter', 'xcode')
+            platform (str): Target platform ('android', 'flutter', 'xcode', 'react')
             
         Returns:
             str: Text with platform-specific parameters
         """
-        import re
-        
-        if platform == 'android':
-            # Android format - no conversion needed
-            return text
-        elif platform == 'flutter':
-            # Convert Android format to Flutter format
-            # %1$s, %2$s, %3$s -> {param1}, {param2}, {param3}
-            # %1$d, %2$d, %3$d -> {param1}, {param2}, {param3}
-            # %1$.2f, %2$.3f -> {param1}, {param2}
-            
-            # Find all Android-style parameters
-            android_pattern = r'%(\d+)\$[sd]'
-            android_float_pattern = r'%(\d+)\$\.\d+[f]'
-            
-            # Replace integer/string parameters
-            def replace_int_string(match):
-                param_num = match.group(1)
-                return f"{{param{param_num}}}"
-            
-            # Replace float parameters
-            def replace_float(match):
-                param_num = match.group(1)
-                return f"{{param{param_num}}}"
-            
-            # Apply replacements
-            text = re.sub(android_pattern, replace_int_string, text)
-            text = re.sub(android_float_pattern, replace_float, text)
-            
-            return text
-        elif platform == 'xcode':
-            # Convert Android format to Xcode format
-            # %1$s, %2$s, %3$s -> %@, %@, %@
-            # %1$d, %2$d, %3$d -> %@, %@, %@
-            # %1$.2f, %2$.3f -> %@, %@
-            
-            # Find all Android-style parameters
-            android_pattern = r'%(\d+)\$[sd]'
-            android_float_pattern = r'%(\d+)\$\.\d+[f]'
-            
-            # Replace with Xcode format
-            text = re.sub(android_pattern, '%@', text)
-            text = re.sub(android_float_pattern, '%@', text)
-            
-            return text
-        elif platform == 'react':
-            # Convert Android format to React Native format
-            # %1$s, %2$s, %3$s -> {0}, {1}, {2}
-            # %1$d, %2$d, %3$d -> {0}, {1}, {2}
-            # %1$.2f, %2$.3f -> {0}, {1}
-            
-            # Find all Android-style parameters
-            android_pattern = r'%(\d+)\$[sd]'
-            android_float_pattern = r'%(\d+)\$\.\d+[f]'
-            
-            # Replace with React Native format (convert to 0-based index)
-            def replace_react(match):
-                param_num = int(match.group(1)) - 1  # Convert to 0-based index
-                return f"{{{param_num}}}"
-            
-            text = re.sub(android_pattern, replace_react, text)
-            text = re.sub(android_float_pattern, replace_react, text)
-            
-            return text
-        else:
-            return text
+        return get_converter(platform).convert(text)
+
+    def convert_catalog(self, mapping, platform):
+        """
+        Convert Android-style parameters of a whole catalog to platform-specific format
+
+        Args:
+            mapping (dict): Key-value pairs with Android-style parameters
+            platform (str): Target platform ('android', 'flutter', 'xcode', 'react')
+
+        Returns:
+            dict: Key-value pairs with platform-specific parameters
+        """
+        return convert_catalog(mapping, platform)
 
     def create_android_xml(self, data, language_code):
         """
@@ -173,156 +872,251 @@ class LocalizeCreater:
         Returns:
             str: Formatted XML string for Android string resources
         """
-        root = ET.Element("resources")
-        for key, value in data.items():
-            string_elem = ET.SubElement(root, "string")
-            string_elem.set("name", key)
-            string_elem.text = value
-        rough_string = ET.tostring(root, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="    ")
+        return android_xml_string(data)
+
+    def _android_output_languages(self, language_codes=None):
+        # strings.xml path of every language, or of the given languages only
+        android_output_dir = f"{self.output_dir}/android"
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        output_languages = {}
+        for lang_code in all_languages:
+            if language_codes is not None and lang_code not in language_codes:
+                continue
+            if lang_code == self.base_language_code:
+                # Base language goes to the default strings.xml
+                output_languages[f"{android_output_dir}/strings.xml"] = lang_code
+            else:
+                output_languages[f"{android_output_dir}/values-{lang_code}/strings.xml"] = lang_code
+        return output_languages
 
-    def create_android(self, use_unified=True):
+    def render_android_language(self, language_code, data, stats=None):
+        """
+        Render the Android strings.xml content of a single language
+
+        Args:
+            language_code (str): Language code for the localization
+            data (CatalogLanguage): Unified source strings of the language
+            stats (BuildStats): Receives the convert/serialize times when given
+
+        Returns:
+            bytes: Formatted XML for Android string resources (UTF-8)
+        """
+        if stats is None:
+            stats = BuildStats()
+        with stats.measure('android', language_code, "convert"):
+            converted_data = self._convert_android_language(data)
+        with stats.measure('android', language_code, "serialize"):
+            xml_content = android_xml_bytes(converted_data)
+        stats.count('android', language_code, strings=len(data))
+        return xml_content
+
+    def _convert_android_language(self, data):
+        # Convert parameters for Android platform (no conversion needed, but for consistency)
+        return self.convert_catalog(data, 'android')
+
+    def create_android(self, use_unified=True, catalogs=None, stats=None, language_codes=None):
         """
         Create Android XML string resources files with unified parameter handling
         
         Args:
             use_unified (bool): If True, use the unified JSON files with Android-style parameters
+            catalogs (Catalog): Already parsed catalogs keyed by language code. Loaded from disk when omitted.
+            stats (BuildStats): Stats of an enclosing build to record into. A new one is created when omitted.
+            language_codes (list): Only generate the files of these languages. Defaults to all languages.
+
+        Returns:
+            BuildStats: Per-stage times and counters
         """
-        print(f"Target language code list: {self.target_language_code_list}")
-        print(f"Base language code: {self.base_language_code}")
-        print(f"SDK: {self.sdk}")
+        self._log(f"Target language code list: {self.target_language_code_list}")
+        self._log(f"Base language code: {self.base_language_code}")
+        self._log(f"SDK: {self.sdk}")
         
+        standalone = stats is None
+        if standalone:
+            stats = BuildStats()
         file_suffix = "_unified" if use_unified else ""
-        android_output_dir = "./sample_output/android"
-        os.makedirs(android_output_dir, exist_ok=True)
-
-        # Generate base language (default) strings.xml
-        with open(f"./sample_data/sample_{self.base_language_code}{file_suffix}.json", "r") as f:
-            data_base = orjson.loads(f.read())
-            # Convert parameters for Android platform (no conversion needed, but for consistency)
-            converted_data = {}
-            for key, value in data_base.items():
-                converted_data[key] = self.convert_parameters_for_platform(value, 'android')
-            
-            xml_content = self.create_android_xml(converted_data, self.base_language_code)
-            with open(f"{android_output_dir}/strings.xml", "w", encoding="utf-8") as g:
-                g.write(xml_content)
-
-        # Generate localized strings.xml files for each target language
-        for target_language_code in self.target_language_code_list:
-            with open(f"./sample_data/sample_{target_language_code}{file_suffix}.json", "r") as f:
-                data_target = orjson.loads(f.read())
-                # Convert parameters for Android platform (no conversion needed, but for consistency)
-                converted_data = {}
-                for key, value in data_target.items():
-                    converted_data[key] = self.convert_parameters_for_platform(value, 'android')
-                
-                xml_content = self.create_android_xml(converted_data, target_language_code)
-                lang_dir = f"{android_output_dir}/values-{target_language_code}"
-                os.makedirs(lang_dir, exist_ok=True)
-                with open(f"{lang_dir}/strings.xml", "w", encoding="utf-8") as g:
-                    g.write(xml_content)
-        
-        print("Android XML localization files with unified parameters generated successfully!")
-        print(f"Files created in: {android_output_dir}")
-        print("- strings.xml (default/base language)")
-        for lang in self.target_language_code_list:
-            print(f"- values-{lang}/strings.xml")
+        opened = catalogs is None
+        if opened:
+            catalogs = self._open_catalogs(file_suffix, stats)
+        try:
+            android_output_dir = f"{self.output_dir}/android"
+            os.makedirs(android_output_dir, exist_ok=True)
+
+            output_languages = self._android_output_languages(language_codes)
+            output_inputs = {path: self._source_paths([lang_code], file_suffix) for path, lang_code in output_languages.items()}
+            options = {"platform": "android", "fallback": self.fallback}
+            stale_outputs = self._select_stale_outputs(output_inputs, options)
+
+            languages = [output_languages[path] for path in stale_outputs]
+            self._prefetch(catalogs, languages)
+            if self.jobs > 1 and len(languages) > 1:
+                xml_contents = self._map_languages(self.render_android_language, languages, catalogs, stats)
+                for output_path, lang_code, xml_content in zip(stale_outputs, languages, xml_contents):
+                    self._write_output(output_path, xml_content, 'android', lang_code, stats)
+            else:
+                # Stream every <string> element straight to the output file
+                for output_path, lang_code in zip(stale_outputs, languages):
+                    data = catalogs[lang_code]
+                    with stats.measure('android', lang_code, "convert"):
+                        converted_data = self._convert_android_language(data)
+                    with self._stream_output(output_path, 'android', lang_code, stats) as g:
+                        with stats.measure('android', lang_code, "serialize"):
+                            write_android_xml(g, converted_data)
+                    stats.count('android', lang_code, strings=len(data))
+            self._record_outputs({path: output_inputs[path] for path in stale_outputs}, options)
 
-    def create_xcode(self, use_unified=True):
+            self._log("Android XML localization files with unified parameters generated successfully!")
+            self._log(f"Files created in: {android_output_dir}")
+            self._log("- strings.xml (default/base language)")
+            for lang in self.target_language_code_list:
+                self._log(f"- values-{lang}/strings.xml")
+        finally:
+            if opened:
+                self._close_catalogs(catalogs)
+        return self._finish_stats(stats) if standalone else stats
+
+    def create_xcode(self, use_unified=True, catalogs=None, stats=None):
         """
         Create Xcode .xcstrings localization files with unified parameter handling
         
         Args:
             use_unified (bool): If True, use the unified JSON files with Android-style parameters
+            catalogs (Catalog): Already parsed catalogs keyed by language code. Loaded from disk when omitted.
+            stats (BuildStats): Stats of an enclosing build to record into. A new one is created when omitted.
+
+        Returns:
+            BuildStats: Per-stage times and counters
         """
-        print(f"Target language code list: {self.target_language_code_list}")
-        print(f"Base language code: {self.base_language_code}")
-        print(f"SDK: {self.sdk}")
+        self._log(f"Target language code list: {self.target_language_code_list}")
+        self._log(f"Base language code: {self.base_language_code}")
+        self._log(f"SDK: {self.sdk}")
 
+        standalone = stats is None
+        if standalone:
+            stats = BuildStats()
         file_suffix = "_unified" if use_unified else ""
-        xcode_output_dir = "./sample_output/xcode"
-        os.makedirs(xcode_output_dir, exist_ok=True)
+        opened = catalogs is None
+        if opened:
+            catalogs = self._open_catalogs(file_suffix, stats)
+        try:
+            xcode_output_dir = f"{self.output_dir}/xcode"
+            os.makedirs(xcode_output_dir, exist_ok=True)
 
-        # Create the main .xcstrings structure
-        xcstrings_data = {
-            "sourceLanguage": self.base_language_code,
-            "strings": {},
-            "version": "1.0"
-        }
+            all_languages = [self.base_language_code] + self.target_language_code_list
+            output_file = f"{xcode_output_dir}/Localizable.xcstrings"
+            output_inputs = {output_file: self._source_paths(all_languages, file_suffix)}
+            # The language order decides the source language and the localization order
+            options = {"platform": "xcode", "languages": all_languages, "fallback": self.fallback}
+            if not self._select_stale_outputs(output_inputs, options):
+                return self._finish_stats(stats) if standalone else stats
 
-        # Process all target languages
-        all_languages = [self.base_language_code] + self.target_language_code_list
-        
-        for lang_code in all_languages:
-            with open(f"./sample_data/sample_{lang_code}{file_suffix}.json", "r") as f:
-                lang_data = orjson.loads(f.read())
-                
-            # Add each string to the xcstrings structure
-            for key, value in lang_data.items():
-                if key not in xcstrings_data["strings"]:
-                    xcstrings_data["strings"][key] = {
-                        "localizations": {}
-                    }
-                
-                # Convert parameters for Xcode platform
-                converted_value = self.convert_parameters_for_platform(value, 'xcode')
-                
-                # Add localization for this language
-                xcstrings_data["strings"][key]["localizations"][lang_code] = {
-                    "stringUnit": {
-                        "state": "translated",
-                        "value": converted_value
-                    }
-                }
+            # Make sure loading is measured on its own, not as part of serializing
+            self._prefetch(catalogs, all_languages)
+            for lang_code in all_languages:
+                catalogs[lang_code]
+
+            with self._stream_output(output_file, 'xcode', ALL_LANGUAGES, stats) as f:
+                self.render_xcode(catalogs, f, stats)
+            self._record_outputs(output_inputs, options)
 
-        # Write the .xcstrings file
-        output_file = f"{xcode_output_dir}/Localizable.xcstrings"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(orjson.dumps(xcstrings_data, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            self._log("Xcode .xcstrings localization file with unified parameters generated successfully!")
+            self._log(f"File created: {output_file}")
+            self._log(f"Languages included: {', '.join(all_languages)}")
+        finally:
+            if opened:
+                self._close_catalogs(catalogs)
+        return self._finish_stats(stats) if standalone else stats
 
-        print("Xcode .xcstrings localization file with unified parameters generated successfully!")
-        print(f"File created: {output_file}")
-        print(f"Languages included: {', '.join(all_languages)}")
+    def render_xcode(self, catalogs, stream, stats=None):
+        """
+        Stream the Xcode .xcstrings content of all languages, one key at a time
+
+        Args:
+            catalogs (Catalog): Parsed catalogs keyed by language code
+            stream (io.BufferedIOBase): Writable binary stream
+            stats (BuildStats): Receives the serialize time and string count when given
+        """
+        if stats is None:
+            stats = BuildStats()
+        all_languages = [self.base_language_code] + self.target_language_code_list
+        convert = get_converter('xcode').convert
+        entries = iter_xcstrings_entries(all_languages, catalogs, convert)
+        with stats.measure('xcode', ALL_LANGUAGES, "serialize"):
+            write_xcstrings(stream, self.base_language_code, entries)
+        stats.count('xcode', ALL_LANGUAGES, strings=sum(len(catalogs[lang_code]) for lang_code in all_languages))
 
-    def create_react(self):
+    def create_react(self, catalogs=None, stats=None):
         """
         Create React Native localization JavaScript files
+
+        Args:
+            catalogs (Catalog): Already parsed catalogs keyed by language code. Loaded from disk when omitted.
+            stats (BuildStats): Stats of an enclosing build to record into. A new one is created when omitted.
+
+        Returns:
+            BuildStats: Per-stage times and counters
         """
-        print(f"Target language code list: {self.target_language_code_list}")
-        print(f"Base language code: {self.base_language_code}")
-        print(f"SDK: {self.sdk}")
+        self._log(f"Target language code list: {self.target_language_code_list}")
+        self._log(f"Base language code: {self.base_language_code}")
+        self._log(f"SDK: {self.sdk}")
+
+        standalone = stats is None
+        if standalone:
+            stats = BuildStats()
+        opened = catalogs is None
+        if opened:
+            catalogs = self._open_catalogs("", stats)
+        try:
+            react_output_dir = f"{self.output_dir}/javascript"
+            os.makedirs(react_output_dir, exist_ok=True)
 
-        react_output_dir = "./sample_output/javascript"
-        os.makedirs(react_output_dir, exist_ok=True)
+            all_languages = [self.base_language_code] + self.target_language_code_list
+            output_file = f"{react_output_dir}/LocalizedStrings.js"
+            output_inputs = {output_file: self._source_paths(all_languages)}
+            options = {"platform": "react", "languages": all_languages, "fallback": self.fallback}
+            if not self._select_stale_outputs(output_inputs, options):
+                return self._finish_stats(stats) if standalone else stats
 
+            self._prefetch(catalogs, all_languages)
+
+            with self._stream_output(output_file, 'react', ALL_LANGUAGES, stats) as f:
+                self.render_react(catalogs, f, stats)
+            self._record_outputs(output_inputs, options)
+
+            self._log("React Native localization JavaScript file generated successfully!")
+            self._log(f"File created: {output_file}")
+            self._log(f"Languages included: {', '.join(all_languages)}")
+        finally:
+            if opened:
+                self._close_catalogs(catalogs)
+        return self._finish_stats(stats) if standalone else stats
+
+    def render_react(self, catalogs, stream, stats=None):
+        """
+        Stream the React Native localization JavaScript content of all languages
+
+        Args:
+            catalogs (Catalog): Parsed catalogs keyed by language code
+            stream (io.BufferedIOBase): Writable binary stream
+            stats (BuildStats): Receives the convert/serialize times and string counts when given
+        """
+        if stats is None:
+            stats = BuildStats()
         # Create the main localization object
         localization_data = {}
-        all_languages = [self.base_language_code] + self.target_language_code_list
-        
-        for lang_code in all_languages:
-            with open(f"./sample_data/sample_{lang_code}.json", "r") as f:
-                lang_data = orjson.loads(f.read())
-                
-            # Convert parameters for React Native platform
-            converted_data = {}
-            for key, value in lang_data.items():
-                converted_data[key] = self.convert_parameters_for_platform(value, 'react')
-            
-            localization_data[lang_code] = converted_data
+        for lang_code in [self.base_language_code] + self.target_language_code_list:
+            lang_data = catalogs[lang_code]
 
-        # Generate JavaScript file content
-        js_content = self._generate_react_js_content(localization_data)
+            # Convert parameters for React Native platform
+            with stats.measure('react', lang_code, "convert"):
+                converted_data = self.convert_catalog(lang_data, 'react')
+            stats.count('react', lang_code, strings=len(lang_data))
 
-        # Write the JavaScript file
-        output_file = f"{react_output_dir}/LocalizedStrings.js"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(js_content)
+            localization_data[lang_code] = converted_data
 
-        print("React Native localization JavaScript file generated successfully!")
-        print(f"File created: {output_file}")
-        print(f"Languages included: {', '.join(all_languages)}")
+        # Stream the JavaScript file one entry at a time
+        with stats.measure('react', ALL_LANGUAGES, "serialize"):
+            write_react_js(stream, localization_data)
 
     def _generate_react_js_content(self, localization_data):
         """
@@ -334,50 +1128,83 @@ class LocalizeCreater:
         Returns:
             str: JavaScript file content
         """
-        import json
-        
-        # Start building the JavaScript content
-        js_lines = [
-            "import LocalizedStrings from 'react-native-localization';",
-            "",
-            "// CommonJS syntax",
-            "// let LocalizedStrings = require('react-native-localization');",
-            "",
-            "let strings = new LocalizedStrings({"
-        ]
-        
-        # Add each language
-        for lang_code, lang_data in localization_data.items():
-            js_lines.append(f'  "{lang_code}": {{')
-            
-            # Add each key-value pair
-            for key, value in lang_data.items():
-                # Escape quotes in the value
-                escaped_value = value.replace('"', '\\"')
-                js_lines.append(f'    {key}: "{escaped_value}",')
-            
-            # Remove trailing comma from last item
-            if js_lines[-1].endswith(','):
-                js_lines[-1] = js_lines[-1][:-1]
-            
-            js_lines.append('  },')
-        
-        # Remove trailing comma from last language
-        if js_lines[-1].endswith(','):
-            js_lines[-1] = js_lines[-1][:-1]
-        
-        # Close the object and export
-        js_lines.extend([
-            "});",
-            "",
-            "export default strings;",
-            "",
-            "// Usage example:",
-            "// import strings from './LocalizedStrings';",
-            "// console.log(strings.greeting);",
-            "// console.log(strings.formatString(strings.welcome_message, ['John']));"
-        ])
-        
-        return '\n'.join(js_lines)
+        stream = io.BytesIO()
+        write_react_js(stream, localization_data)
+        return stream.getvalue().decode("utf-8")
+
+
+class LazyCatalogs(Catalog):
+    """
+    Catalog whose languages are parsed on first access
+
+    Lets several emitters share parsed catalogs while languages that no
+    emitter needs (e.g. up-to-date outputs in incremental mode) are never read.
+    """
+
+    __slots__ = ("_localize_creater", "_file_suffix", "_stats")
+
+    def __init__(self, localize_creater, file_suffix="", stats=None):
+        super().__init__()
+        self._localize_creater = localize_creater
+        self._file_suffix = file_suffix
+        self._stats = stats
+
+    def __getitem__(self, language_code):
+        language = self._languages.get(language_code)
+        if language is None:
+            language = self._load(language_code)
+        return language
+
+    def prefetch(self, language_codes):
+        """
+        Read the catalog files of several languages concurrently and parse them
+
+        Languages that are already loaded, or that have no catalog file,
+        are skipped; a missing file still raises when the language is accessed.
+
+        Args:
+            language_codes (list): Languages that are about to be accessed
+        """
+        missing = [lang_code for lang_code in language_codes if lang_code not in self._languages]
+        if len(missing) <= 1:
+            return
+        available = discover_catalog_files(self._localize_creater.input_dir, self._file_suffix)
+        paths = {lang_code: available[lang_code] for lang_code in missing if lang_code in available}
+        contents = read_catalog_files(paths, self._stats)
+        for lang_code, content in contents.items():
+            self._load(lang_code, content)
+
+    def _load(self, language_code, content=None, stats=None):
+        if stats is None:
+            stats = self._stats
+        catalog = self._localize_creater.load_catalog(language_code, self._file_suffix, stats, content)
+        return self._add_parsed(language_code, catalog, stats)
+
+    def _add_parsed(self, language_code, catalog, stats):
+        # Add a parsed catalog and record how much the string pool deduplicated it
+        duplicate_values, saved_bytes = self.pool.duplicate_values, self.pool.saved_bytes
+        language = self.add_language(language_code, catalog)
+        if stats is not None:
+            stats.count(
+                SOURCE_PLATFORM, language_code,
+                duplicate_values=self.pool.duplicate_values - duplicate_values,
+                saved_bytes=self.pool.saved_bytes - saved_bytes,
+            )
+        return language
+
+
+def _render_language_job(render_name, language_code, data):
+    """
+    Worker process entry point for LocalizeCreater._map_languages
 
+    Args:
+        render_name (str): Name of the render_*_language method to call
+        language_code (str): Language code for the localization
+        data (dict): Unified source strings of the language
 
+    Returns:
+        tuple: (rendered content, BuildStats of the render)
+    """
+    stats = BuildStats()
+    content = getattr(LocalizeCreater(), render_name)(language_code, data, stats)
+    return content, stats.finish()
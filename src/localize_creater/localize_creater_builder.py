@@ -1,4 +1,4 @@
-from src.locale_code.code_list import code_list
+from src.locale_code.code_map import canonicalize, filter_language_codes
 from src.sdk import sdk_list
 from src.localize_creater.localize_creater import LocalizeCreater
 
@@ -8,19 +8,17 @@ class LocalizeCreaterBuilder:
         self._localize_creater = LocalizeCreater()
 
     def set_base_language_code(self, language_code):
-        self._localize_creater.base_language_code = language_code
-        if language_code not in code_list:
+        canonical = canonicalize(language_code)
+        if canonical is None:
             raise ValueError(f"Invalid language code: {language_code}")
+        self._localize_creater.base_language_code = canonical
         return self
 
     def set_language_code_list(self, language_code_list):
-        new_language_code_list = []
-        self._localize_creater.target_language_code_list = language_code_list
-        for language_code in language_code_list:
-            if language_code not in code_list:
-                print(f"Invalid language code: {language_code}")
-            else:
-                new_language_code_list.append(language_code)
+        new_language_code_list, invalid_language_codes = filter_language_codes(language_code_list)
+        for language_code in invalid_language_codes:
+            print(f"Invalid language code: {language_code}")
+        self._localize_creater.target_language_code_list = new_language_code_list
         return self
 
     def set_sdk(self, sdk_code):
@@ -29,6 +27,44 @@ class LocalizeCreaterBuilder:
             raise ValueError(f"Invalid sdk code: {sdk_code}")
         return self
 
+    def set_input_dir(self, input_dir):
+        self._localize_creater.input_dir = input_dir
+        return self
+
+    def set_output_dir(self, output_dir):
+        self._localize_creater.output_dir = output_dir
+        return self
+
+    def set_jobs(self, jobs):
+        if jobs < 1:
+            raise ValueError(f"Invalid jobs: {jobs}")
+        self._localize_creater.jobs = jobs
+        return self
+
+    def set_incremental(self, incremental):
+        self._localize_creater.incremental = incremental
+        return self
+
+    def set_stats_path(self, stats_path):
+        self._localize_creater.stats_path = stats_path
+        return self
+
+    def set_compiled_catalog_path(self, compiled_catalog_path):
+        self._localize_creater.compiled_catalog_path = compiled_catalog_path
+        return self
+
+    def set_packed_catalog_path(self, packed_catalog_path):
+        self._localize_creater.packed_catalog_path = packed_catalog_path
+        return self
+
+    def set_fallback(self, fallback):
+        self._localize_creater.fallback = fallback
+        return self
+
+    def set_verbose(self, verbose):
+        self._localize_creater.verbose = verbose
+        return self
+
     def build(self):
         return self._localize_creater
 
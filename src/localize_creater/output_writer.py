@@ -0,0 +1,156 @@
+import filecmp
+import io
+import os
+import secrets
+
+READ_CHUNK_SIZE = 1 << 20
+
+
+def _same_content(path, content):
+    """
+    Check whether a file already holds exactly the given bytes
+
+    Args:
+        path (str): Existing file path
+        content (bytes): New content
+
+    Returns:
+        bool: True if the file exists with identical content
+    """
+    try:
+        if os.stat(path).st_size != len(content):
+            return False
+        with open(path, "rb") as f:
+            view = memoryview(content)
+            position = 0
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    return position == len(content)
+                if chunk != view[position:position + len(chunk)]:
+                    return False
+                position += len(chunk)
+    except FileNotFoundError:
+        return False
+
+
+def _create_temp_file(path):
+    # The temp file lives next to the target so os.replace stays an atomic rename.
+    # os.open with 0o666 lets the umask decide the permissions, like a plain open() would.
+    directory, name = os.path.split(path)
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return temp_path, os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(path, content):
+    """
+    Write a file atomically, leaving it untouched when the content is the same
+
+    Unchanged files keep their mtime, so Gradle and Xcode do not rebuild
+    resources. Changed files are written to a temp file and moved into
+    place with os.replace, so readers never see a partial file.
+
+    Args:
+        path (str): Output file path
+        content (bytes or str): New content. str is encoded as UTF-8.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if _same_content(path, content):
+        return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path, fd = _create_temp_file(path)
+    try:
+        with open(fd, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return True
+
+
+class AtomicOutput:
+    """
+    Stream an output file with write-if-changed semantics
+
+    The content is streamed into a temp file next to the target. commit()
+    replaces the target only if the bytes differ; otherwise the temp file
+    is removed and the target keeps its mtime. `changed` tells which
+    happened. Used as a context manager it commits on success and
+    discards on error.
+
+    Usage:
+        with AtomicOutput(path, text=True) as f:
+            f.write(...)
+    """
+
+    def __init__(self, path, text=False):
+        self.path = path
+        self.text = text
+        self.changed = False
+        self.size = 0
+        self._temp_path = None
+        self._file = None
+
+    def open(self):
+        """
+        Open the temp file
+
+        Returns:
+            file: Binary stream, or a UTF-8 text stream if text=True
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._temp_path, fd = _create_temp_file(self.path)
+        self._file = open(fd, "wb")
+        if self.text:
+            self._file = io.TextIOWrapper(self._file, encoding="utf-8")
+        return self._file
+
+    def commit(self):
+        """
+        Close the temp file and move it into place if the content changed
+
+        Returns:
+            bool: True if the target was replaced
+        """
+        try:
+            self._file.close()
+            self.size = os.path.getsize(self._temp_path)
+            try:
+                unchanged = (os.path.getsize(self.path) == self.size
+                             and filecmp.cmp(self.path, self._temp_path, shallow=False))
+            except FileNotFoundError:
+                unchanged = False
+            if not unchanged:
+                os.replace(self._temp_path, self.path)
+                self.changed = True
+        finally:
+            self.discard()
+        return self.changed
+
+    def discard(self):
+        """
+        Close and remove the temp file without touching the target
+        """
+        self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
@@ -0,0 +1,159 @@
+import os
+import orjson
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.catalog_loader import CATALOG_FILE_EXTENSION, CATALOG_FILE_PREFIX, load_catalog_files
+from src.localize_creater.output_writer import AtomicOutput, write_if_changed
+
+PACKED_CATALOG_FILE_NAME = "catalogs.jsonl"
+PACKED_CATALOG_FORMAT = "localize-kitchen-packed"
+PACKED_CATALOG_VERSION = 1
+
+
+def iter_packed_rows(stream):
+    """
+    Read the header of a packed catalog and iterate its rows
+
+    A packed catalog is a JSON Lines file. The first line is the header
+    {"format": "localize-kitchen-packed", "version": 1, "languages": [...]},
+    every further line one string: [key, value per language], with null
+    where a language lacks the key. A language whose keys are not in row
+    order has its own order in the optional "orders" field of the header,
+    as a list of row numbers counted from 0.
+
+    Args:
+        stream (io.BufferedIOBase): Readable binary stream
+
+    Returns:
+        tuple: (language codes, key orders keyed by language code, iterator of rows)
+    """
+    header = orjson.loads(stream.readline() or b"null")
+    if (not isinstance(header, dict) or header.get("format") != PACKED_CATALOG_FORMAT
+            or header.get("version") != PACKED_CATALOG_VERSION):
+        raise ValueError(f"Not a packed catalog (version {PACKED_CATALOG_VERSION})")
+    language_codes = header["languages"]
+    orders = header.get("orders") or {}
+    if not isinstance(orders, dict) or not set(orders) <= set(language_codes):
+        raise ValueError("Key orders must be keyed by the languages of the packed catalog")
+
+    def rows():
+        for line_number, line in enumerate(stream, start=2):
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            if not isinstance(row, list) or len(row) != len(language_codes) + 1:
+                raise ValueError(f"Line {line_number}: expected a key and {len(language_codes)} values")
+            yield row
+
+    return language_codes, orders, rows()
+
+
+def load_packed_catalog(path, catalogs=None):
+    """
+    Stream a packed catalog into the catalog model, one row at a time
+
+    Every language keeps the key order it was packed with.
+
+    Args:
+        path (str): Packed catalog path
+        catalogs (Catalog): Catalog to add the languages to. A new one is created when omitted.
+
+    Returns:
+        Catalog: Catalogs keyed by language code, in the language order of the file
+    """
+    if catalogs is None:
+        catalogs = Catalog()
+    with open(path, "rb") as f:
+        language_codes, orders, rows = iter_packed_rows(f)
+        catalogs.add_rows(language_codes, rows, orders)
+    return catalogs
+
+
+def write_packed_catalog(path, catalogs, language_codes=None):
+    """
+    Write catalogs as a packed catalog
+
+    Keys are written in order of first appearance, base language first.
+    Languages whose keys come in a different order get their own order in
+    the header, so loading gives back the same order for every language.
+
+    Args:
+        path (str): Output file path
+        catalogs (Catalog): Catalogs keyed by language code
+        language_codes (list): Languages to write, base language first. Defaults to every language.
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+    """
+    if language_codes is None:
+        language_codes = list(catalogs)
+    languages = [catalogs[lang_code] for lang_code in language_codes]
+    row_numbers = {}
+    for language in languages:
+        for key in language:
+            row_numbers.setdefault(key, len(row_numbers))
+    orders = {}
+    for lang_code, language in zip(language_codes, languages):
+        row_order = [row_numbers[key] for key in language]
+        if any(previous > row for previous, row in zip(row_order, row_order[1:])):
+            orders[lang_code] = row_order
+    header = {
+        "format": PACKED_CATALOG_FORMAT,
+        "version": PACKED_CATALOG_VERSION,
+        "languages": language_codes,
+    }
+    if orders:
+        header["orders"] = orders
+    dumps = orjson.dumps
+    output = AtomicOutput(path)
+    with output as f:
+        f.write(dumps(header) + b"\n")
+        for key in row_numbers:
+            f.write(dumps([key] + [language.get(key) for language in languages]) + b"\n")
+    return output.changed
+
+
+def pack_catalog_files(input_dir, output_path, language_codes=None, file_suffix=""):
+    """
+    Convert per-language sample_{lang}.json files into one packed catalog
+
+    Args:
+        input_dir (str): Directory with the catalog files
+        output_path (str): Packed catalog path
+        language_codes (list): Languages to pack, base language first. Packs every discovered catalog when omitted.
+        file_suffix (str): Suffix of the file names (e.g. "_unified")
+
+    Returns:
+        list: Packed language codes
+    """
+    catalogs = Catalog()
+    for lang_code, catalog in load_catalog_files(input_dir, language_codes, file_suffix).items():
+        catalogs.add_language(lang_code, catalog)
+    if language_codes is not None:
+        missing = [lang_code for lang_code in language_codes if lang_code not in catalogs]
+        if missing:
+            raise FileNotFoundError(f"No catalog file for: {', '.join(missing)}")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    write_packed_catalog(output_path, catalogs)
+    return list(catalogs)
+
+
+def unpack_catalog_file(path, output_dir, file_suffix=""):
+    """
+    Convert a packed catalog back into per-language sample_{lang}.json files
+
+    Args:
+        path (str): Packed catalog path
+        output_dir (str): Directory to write the catalog files to
+        file_suffix (str): Suffix of the file names (e.g. "_unified")
+
+    Returns:
+        list: Paths of the catalog files
+    """
+    catalogs = load_packed_catalog(path)
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for lang_code, language in catalogs.items():
+        output_path = f"{output_dir}/{CATALOG_FILE_PREFIX}{lang_code}{file_suffix}{CATALOG_FILE_EXTENSION}"
+        write_if_changed(output_path, orjson.dumps(dict(language.items()), option=orjson.OPT_INDENT_2))
+        paths.append(output_path)
+    return paths
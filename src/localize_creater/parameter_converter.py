@@ -0,0 +1,182 @@
+from functools import lru_cache
+from src.localize_creater.parameter_tokenizer import Placeholder, tokenize
+
+# Bump whenever converted output changes, so incremental builds regenerate everything
+CONVERTER_VERSION = "1"
+
+# Converted strings kept per process, keyed on (text, platform)
+CONVERSION_CACHE_SIZE = 65536
+
+
+class ParameterConverter:
+    """
+    Render unified Android-style strings in a platform-specific format
+
+    Strings are tokenized once (see parameter_tokenizer.tokenize) and each
+    converter only renders the placeholder segments. The base converter
+    renders parameters as written, which is what Android (and any unknown
+    platform) expects, so it returns text unchanged without tokenizing it
+    or filling the conversion cache.
+    """
+    platform = 'android'
+    # True if rendering gives back the text as written
+    identity = True
+
+    def convert(self, text):
+        """
+        Convert all parameters in the text
+
+        Args:
+            text (str): Text with Android-style parameters (%1$s, %2$d, etc.)
+
+        Returns:
+            str: Text with platform-specific parameters
+        """
+        if self.identity or '%' not in text:
+            # Fast path: plain literals and identity platforms have nothing to convert
+            return text
+        return _convert_cached(text, self.platform)
+
+    def convert_catalog(self, mapping):
+        """
+        Convert every value of a catalog in one call
+
+        Placeholder-free values are passed through inside the comprehension
+        and only values with parameters look up the conversion cache, so
+        there is no per-value method dispatch.
+
+        Args:
+            mapping (dict): Key-value pairs with Android-style parameters
+
+        Returns:
+            dict: Key-value pairs with platform-specific parameters, in the same key order
+        """
+        if self.identity:
+            return dict(mapping.items())
+        platform = self.platform
+        convert_cached = _convert_cached
+        return {
+            key: value if '%' not in value else convert_cached(value, platform)
+            for key, value in mapping.items()
+        }
+
+    def render(self, segments):
+        """
+        Render tokenized segments
+
+        Args:
+            segments (tuple): Segments returned by tokenize()
+
+        Returns:
+            str: Text with platform-specific parameters
+        """
+        render_placeholder = self.render_placeholder
+        return ''.join(
+            render_placeholder(segment) if segment.__class__ is Placeholder else segment
+            for segment in segments
+        )
+
+    def render_placeholder(self, placeholder):
+        """
+        Render a single parameter
+
+        Args:
+            placeholder (Placeholder): Parameter segment
+
+        Returns:
+            str: Platform-specific parameter
+        """
+        return placeholder.source
+
+
+class FlutterParameterConverter(ParameterConverter):
+    # %1$s, %2$d, %1$.2f -> {param1}, {param2}, {param1}
+    platform = 'flutter'
+    identity = False
+
+    def render_placeholder(self, placeholder):
+        return f"{{param{placeholder.index}}}"
+
+
+class XcodeParameterConverter(ParameterConverter):
+    # %1$s, %2$d, %1$.2f -> %@, %@, %@
+    platform = 'xcode'
+    identity = False
+
+    def render_placeholder(self, placeholder):
+        return '%@'
+
+
+class ReactParameterConverter(ParameterConverter):
+    # %1$s, %2$d, %1$.2f -> {0}, {1}, {0} (0-based index)
+    platform = 'react'
+    identity = False
+
+    def render_placeholder(self, placeholder):
+        return f"{{{placeholder.index - 1}}}"
+
+
+class UnknownPlatformConverter(ParameterConverter):
+    # Keeps parameters as written, like the Android converter
+    platform = None
+
+
+converter_map = {
+    'android': ParameterConverter(),
+    'flutter': FlutterParameterConverter(),
+    'xcode': XcodeParameterConverter(),
+    'react': ReactParameterConverter(),
+}
+
+_default_converter = UnknownPlatformConverter()
+
+
+def convert_catalog(mapping, platform):
+    """
+    Convert a whole {key: value} catalog to a platform-specific format
+
+    Args:
+        mapping (dict): Key-value pairs with Android-style parameters
+        platform (str): Target platform ('android', 'flutter', 'xcode', 'react')
+
+    Returns:
+        dict: Key-value pairs with platform-specific parameters
+    """
+    return get_converter(platform).convert_catalog(mapping)
+
+
+def get_converter(platform):
+    """
+    Get the shared converter for a platform
+
+    Args:
+        platform (str): Target platform ('android', 'flutter', 'xcode', 'react')
+
+    Returns:
+        ParameterConverter: Converter for the platform. Unknown platforms keep the text unchanged.
+    """
+    return converter_map.get(platform, _default_converter)
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _convert_cached(text, platform):
+    # Values repeat across keys and languages (brand names, untranslated copies),
+    # so each distinct (text, platform) pair is rendered only once
+    return converter_map.get(platform, _default_converter).render(tokenize(text))
+
+
+def conversion_cache_info():
+    """
+    Get the hit/miss counters of the conversion cache of this process
+
+    Returns:
+        functools._CacheInfo: (hits, misses, maxsize, currsize)
+    """
+    return _convert_cached.cache_info()
+
+
+def clear_conversion_cache():
+    """
+    Empty the conversion cache and reset its counters
+    """
+    _convert_cached.cache_clear()
@@ -0,0 +1,58 @@
+from collections import namedtuple
+from functools import lru_cache
+import re
+
+# Matches every Android-style parameter in one scan: %1$s, %2$d and %1$.2f
+ANDROID_PARAMETER_PATTERN = re.compile(r'%(\d+)\$(?:([sd])|\.(\d+)f)')
+
+TOKEN_CACHE_SIZE = 65536
+
+# One parameter of a unified string.
+#   index (int): 1-based parameter position (%2$s -> 2)
+#   type (str): 's', 'd' or 'f'
+#   precision (int): Decimal places for 'f' parameters, None otherwise
+#   source (str): The parameter as written in the unified string
+Placeholder = namedtuple('Placeholder', ['index', 'type', 'precision', 'source'])
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def tokenize(text):
+    """
+    Split a unified Android-style string into literal and placeholder segments
+
+    Args:
+        text (str): Text with Android-style parameters (%1$s, %2$d, etc.)
+
+    Returns:
+        tuple: Segments in order. Literal text is a str, parameters are Placeholder.
+    """
+    segments = []
+    position = 0
+    for match in ANDROID_PARAMETER_PATTERN.finditer(text):
+        start = match.start()
+        if start > position:
+            segments.append(text[position:start])
+        param_num, param_type, precision = match.groups()
+        if param_type is None:
+            segments.append(Placeholder(int(param_num), 'f', int(precision), match.group(0)))
+        else:
+            segments.append(Placeholder(int(param_num), param_type, None, match.group(0)))
+        position = match.end()
+    if position < len(text):
+        segments.append(text[position:])
+    return tuple(segments)
+
+
+def placeholders(text):
+    """
+    Get the parameters of a unified string in order of appearance
+
+    Args:
+        text (str): Text with Android-style parameters
+
+    Returns:
+        list: Placeholder segments of the text
+    """
+    if '%' not in text:
+        return []
+    return [segment for segment in tokenize(text) if segment.__class__ is Placeholder]
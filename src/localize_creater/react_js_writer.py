@@ -0,0 +1,49 @@
+REACT_JS_HEADER = (
+    b"import LocalizedStrings from 'react-native-localization';\n"
+    b"\n"
+    b"// CommonJS syntax\n"
+    b"// let LocalizedStrings = require('react-native-localization');\n"
+    b"\n"
+    b"let strings = new LocalizedStrings({"
+)
+REACT_JS_FOOTER = (
+    b"\n});\n"
+    b"\n"
+    b"export default strings;\n"
+    b"\n"
+    b"// Usage example:\n"
+    b"// import strings from './LocalizedStrings';\n"
+    b"// console.log(strings.greeting);\n"
+    b"// console.log(strings.formatString(strings.welcome_message, ['John']));"
+)
+
+
+def _iter_language_entries(localization_data):
+    language_separator = b"\n"
+    for lang_code, lang_data in localization_data.items():
+        yield language_separator + f'  "{lang_code}": {{'.encode("utf-8")
+        separator = "\n"
+        for key, value in lang_data.items():
+            # Escape quotes in the value
+            escaped_value = value.replace('"', '\\"')
+            yield f'{separator}    {key}: "{escaped_value}"'.encode("utf-8")
+            separator = ",\n"
+        yield b"\n  }"
+        language_separator = b",\n"
+
+
+def write_react_js(stream, localization_data):
+    """
+    Stream a React Native localization JavaScript file to a binary stream
+
+    Every entry is encoded once and handed to writelines(); separators are
+    written before entries, so no trailing commas have to be removed
+    afterwards. The output is identical to the line-joining implementation.
+
+    Args:
+        stream (io.BufferedIOBase): Writable binary stream
+        localization_data (dict): Converted key-value pairs keyed by language code
+    """
+    stream.write(REACT_JS_HEADER)
+    stream.writelines(_iter_language_entries(localization_data))
+    stream.write(REACT_JS_FOOTER)
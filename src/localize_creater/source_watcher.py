@@ -0,0 +1,46 @@
+import os
+from src.localize_creater.catalog_loader import discover_catalog_files
+
+
+class SourceWatcher:
+    """
+    Poll catalog files for changes
+
+    The standard library has no portable file notification API, so the
+    input directory is scanned with os.scandir() and every catalog file
+    is compared by size and modification time. A scan of a few dozen
+    files takes well under a millisecond.
+    """
+
+    def __init__(self, input_dir, language_codes, file_suffix=""):
+        self.input_dir = input_dir
+        self.language_codes = language_codes
+        self.file_suffix = file_suffix
+        self._signatures = {}
+
+    def _scan(self):
+        paths = discover_catalog_files(self.input_dir, self.file_suffix)
+        signatures = {}
+        for lang_code in self.language_codes:
+            path = paths.get(lang_code)
+            if path is None:
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signatures[lang_code] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def poll(self):
+        """
+        Scan the catalog files and report which changed since the previous poll
+
+        Returns:
+            list: Language codes whose file was added, modified or removed, in language order
+        """
+        signatures = self._scan()
+        changed = [lang_code for lang_code in self.language_codes
+                   if signatures.get(lang_code) != self._signatures.get(lang_code)]
+        self._signatures = signatures
+        return changed
@@ -0,0 +1,68 @@
+import orjson
+
+XCSTRINGS_VERSION = "1.0"
+
+
+def iter_xcstrings_entries(language_codes, catalogs, convert):
+    """
+    Walk all catalogs in lockstep and yield one string entry at a time
+
+    Keys are yielded in order of first appearance (base language first),
+    with localizations in language order, which is the order the old
+    nested-dict implementation produced. Only the current key's
+    localizations are held in memory.
+
+    Args:
+        language_codes (list): Languages in output order, base language first
+        catalogs (Catalog): Parsed catalogs keyed by language code
+        convert (function): Parameter converter applied to every value
+
+    Yields:
+        tuple: (key, localizations) for each string
+    """
+    lang_catalogs = [(lang_code, catalogs[lang_code]) for lang_code in language_codes]
+    for position, (_, lang_data) in enumerate(lang_catalogs):
+        previous_catalogs = [data for _, data in lang_catalogs[:position]]
+        for key in lang_data:
+            if any(key in data for data in previous_catalogs):
+                # Already emitted together with an earlier language
+                continue
+            localizations = {}
+            for lang_code, data in lang_catalogs[position:]:
+                if key in data:
+                    localizations[lang_code] = {
+                        "stringUnit": {
+                            "state": "translated",
+                            "value": convert(data[key])
+                        }
+                    }
+            yield key, {"localizations": localizations}
+
+
+def write_xcstrings(stream, source_language, entries):
+    """
+    Stream an .xcstrings document to a binary stream
+
+    The output is identical to orjson.dumps(..., option=OPT_INDENT_2) of the
+    full document, but each string entry is serialized and written on its own.
+
+    Args:
+        stream (io.BufferedIOBase): Writable binary stream
+        source_language (str): Source language code
+        entries (iterable): (key, entry) pairs, e.g. from iter_xcstrings_entries()
+    """
+    write = stream.write
+    dumps = orjson.dumps
+    write(b'{\n  "sourceLanguage": ' + dumps(source_language) + b',\n  "strings": {')
+    separator = b"\n    "
+    for key, entry in entries:
+        # Entries are nested two levels deep, so shift every line of the entry by four spaces
+        body = dumps(entry, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n    ")
+        write(separator + dumps(key) + b": " + body)
+        separator = b",\n    "
+    if separator == b"\n    ":
+        # No strings at all
+        write(b'},\n')
+    else:
+        write(b'\n  },\n')
+    write(b'  "version": ' + dumps(XCSTRINGS_VERSION) + b'\n}')
@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.android_xml_writer import android_xml_string
+
+
+def minidom_android_xml(data):
+    # The ElementTree + minidom round-trip the streaming writer replaces
+    root = ET.Element("resources")
+    for key, value in data.items():
+        string_elem = ET.SubElement(root, "string")
+        string_elem.set("name", key)
+        string_elem.text = value
+    return minidom.parseString(ET.tostring(root, encoding='unicode')).toprettyxml(indent="    ")
+
+
+class TestAndroidXmlWriter(unittest.TestCase):
+
+    def assertSameAsMinidom(self, data):
+        self.assertEqual(android_xml_string(data), minidom_android_xml(data))
+
+    def test_plain_strings(self):
+        self.assertSameAsMinidom({"greeting": "Hello", "welcome_message": "Welcome, %1$s!"})
+
+    def test_escaping(self):
+        self.assertSameAsMinidom({
+            "markup": "<b>Tom & \"Jerry\"</b>",
+            "quote": "it's > 3",
+            'odd"name<&>': "value",
+        })
+
+    def test_line_breaks(self):
+        self.assertSameAsMinidom({"lines": "one\r\ntwo\rthree\nfour\tfive", "key\nwith\rbreaks": "x"})
+
+    def test_empty(self):
+        self.assertSameAsMinidom({})
+        self.assertSameAsMinidom({"empty": ""})
+
+    def test_unicode(self):
+        self.assertSameAsMinidom({"greeting": "こんにちは", "arabic": "مرحبا", "emoji": "\U0001F600"})
+
+    def test_invalid_xml_character(self):
+        with self.assertRaises(ValueError):
+            android_xml_string({"bell": "\x07"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import contextlib
+import http.client
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.artifact_server import ArtifactServer, ArtifactStore, etag_matches
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestArtifactServer(unittest.TestCase):
+
+    def setUp(self):
+        self.input_dir = tempfile.TemporaryDirectory()
+        self.output_dir = tempfile.TemporaryDirectory()
+        for lang_code in ["en", "ja", "ar", "de"]:
+            shutil.copy(f"{SAMPLE_DATA_DIR}/sample_{lang_code}.json", self.input_dir.name)
+        self.localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["ja", "ar", "de"])
+            .set_base_language_code("en")
+            .set_input_dir(self.input_dir.name)
+            .set_output_dir(self.output_dir.name)
+            .set_verbose(False)
+            .build()
+        )
+        self.store = ArtifactStore(self.localize_creater)
+        self.store.refresh()
+        self.server = ArtifactServer(("127.0.0.1", 0), self.store, verbose=False)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.input_dir.cleanup()
+        self.output_dir.cleanup()
+
+    def _get(self, path, headers=None):
+        connection = http.client.HTTPConnection(*self.server.server_address)
+        try:
+            connection.request("GET", path, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, response.getheader("ETag"), response.read()
+        finally:
+            connection.close()
+
+    def test_artifacts_match_generated_files(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.localize_creater.create_all()
+        for path in ["android/values-ja/strings.xml", "dart/app_de.arb",
+                     "xcode/Localizable.xcstrings", "javascript/LocalizedStrings.js"]:
+            status, _, body = self._get(f"/{path}")
+            self.assertEqual(status, 200)
+            with open(f"{self.output_dir.name}/{path}", "rb") as f:
+                self.assertEqual(body, f.read())
+
+    def test_conditional_get(self):
+        status, etag, _ = self._get("/dart/app_ja.arb")
+        self.assertEqual(status, 200)
+        status, _, body = self._get("/dart/app_ja.arb", {"If-None-Match": etag})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+        status, _, _ = self._get("/dart/app_ja.arb", {"If-None-Match": '"stale"'})
+        self.assertEqual(status, 200)
+        self.assertEqual(self._get("/dart/app_xx.arb")[0], 404)
+
+    def test_refresh_rerenders_changed_language(self):
+        etags = self.store.etags()
+        with open(f"{self.input_dir.name}/sample_ja.json", "wb") as f:
+            f.write(b'{"greeting": "Konnichiwa"}')
+        self.assertEqual(self.store.refresh(), ["ja"])
+
+        new_etags = self.store.etags()
+        changed = sorted(path for path in etags if new_etags[path] != etags[path])
+        self.assertEqual(changed, ["android/values-ja/strings.xml", "dart/app_ja.arb",
+                                   "javascript/LocalizedStrings.js", "xcode/Localizable.xcstrings"])
+        status, _, body = self._get("/dart/app_ja.arb", {"If-None-Match": etags["dart/app_ja.arb"]})
+        self.assertEqual(status, 200)
+        self.assertIn(b"Konnichiwa", body)
+
+    def test_etag_matches(self):
+        self.assertTrue(etag_matches('"a", W/"b"', '"b"'))
+        self.assertTrue(etag_matches("*", '"b"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+        self.assertFalse(etag_matches(None, '"b"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
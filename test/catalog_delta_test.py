@@ -0,0 +1,113 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import orjson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.catalog_delta import build_key_index, diff_key_indexes, load_key_index, write_key_index
+from src.localize_creater.compiled_catalog import compile_catalog
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+from src.localize_creater.packed_catalog import write_packed_catalog
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestCatalogDelta(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.old_catalogs = Catalog()
+        self.old_catalogs.add_language("en", {"title": "Hello", "body": "Text", "gone": "Bye"})
+        self.old_catalogs.add_language("ja", {"title": "こんにちは"})
+        self.new_catalogs = Catalog()
+        self.new_catalogs.add_language("en", {"title": "Hello", "body": "New text", "extra": "%1$s more"})
+        self.new_catalogs.add_language("ja", {"title": "こんにちは"})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_diff_key_indexes(self):
+        deltas = diff_key_indexes(build_key_index(self.old_catalogs), build_key_index(self.new_catalogs))
+        self.assertEqual(deltas["en"].added, ["extra"])
+        self.assertEqual(deltas["en"].removed, ["gone"])
+        self.assertEqual(deltas["en"].changed, ["body"])
+        self.assertEqual(deltas["ja"], ([], [], []))
+
+    def test_load_key_index_from_every_snapshot_format(self):
+        expected = build_key_index(self.old_catalogs)
+        index_path = f"{self.temp_dir.name}/key_index.json"
+        write_key_index(index_path, expected)
+        compiled_path = f"{self.temp_dir.name}/catalog.lkc"
+        compile_catalog(compiled_path, self.old_catalogs)
+        packed_path = f"{self.temp_dir.name}/catalogs.jsonl"
+        write_packed_catalog(packed_path, self.old_catalogs)
+        for path in [index_path, compiled_path, packed_path]:
+            self.assertEqual(load_key_index(path), expected)
+        self.assertEqual(load_key_index(index_path, ["ja"]), {"ja": expected["ja"]})
+
+    def test_create_delta_writes_only_changed_strings(self):
+        old_dir = f"{self.temp_dir.name}/old"
+        os.makedirs(old_dir)
+        for lang_code in ["en", "ja"]:
+            shutil.copy(f"{SAMPLE_DATA_DIR}/sample_{lang_code}.json", old_dir)
+        with open(f"{old_dir}/sample_ja.json", "rb") as f:
+            old_ja = orjson.loads(f.read())
+        old_ja["greeting"] = "Konnichiwa"
+        with open(f"{old_dir}/sample_ja.json", "wb") as f:
+            f.write(orjson.dumps(old_ja))
+
+        localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["ja"])
+            .set_base_language_code("en")
+            .set_input_dir(SAMPLE_DATA_DIR)
+            .set_output_dir(self.temp_dir.name)
+            .set_verbose(False)
+            .build()
+        )
+        report = localize_creater.create_delta(old_dir)
+        self.assertEqual(report["totals"], {"added": 0, "removed": 0, "changed": 1})
+        with open(f"{self.temp_dir.name}/delta/patch.json", "rb") as f:
+            patch = orjson.loads(f.read())
+        self.assertEqual(list(patch["languages"]), ["ja"])
+        self.assertEqual(list(patch["languages"]["ja"]["set"]), ["greeting"])
+
+        report = localize_creater.create_delta(f"{self.temp_dir.name}/delta/key_index.json")
+        self.assertEqual(report["totals"], {"added": 0, "removed": 0, "changed": 0})
+
+    def test_fallback_delta_against_unchanged_snapshots(self):
+        input_dir = f"{self.temp_dir.name}/input"
+        os.makedirs(input_dir)
+        sources = Catalog()
+        for lang_code, catalog in [("en", {"a": "A", "b": "B"}), ("de", {"b": "Be"}), ("de-AT", {"a": "Ah"})]:
+            sources.add_language(lang_code, catalog)
+            with open(f"{input_dir}/sample_{lang_code}.json", "wb") as f:
+                f.write(orjson.dumps(catalog))
+        compiled_path = f"{self.temp_dir.name}/catalog.lkc"
+        compile_catalog(compiled_path, sources)
+        packed_path = f"{self.temp_dir.name}/catalogs.jsonl"
+        write_packed_catalog(packed_path, sources)
+
+        localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["de-AT", "en-NZ"])
+            .set_base_language_code("en")
+            .set_input_dir(input_dir)
+            .set_output_dir(self.temp_dir.name)
+            .set_fallback(True)
+            .set_verbose(False)
+            .build()
+        )
+        for previous in [input_dir, compiled_path, packed_path]:
+            report = localize_creater.create_delta(previous)
+            self.assertEqual(report["totals"], {"added": 0, "removed": 0, "changed": 0})
+        with open(f"{self.temp_dir.name}/delta/key_index.json", "rb") as f:
+            index = orjson.loads(f.read())["languages"]
+        self.assertEqual(list(index), ["en", "de-AT", "en-NZ"])
+        self.assertEqual(list(index["de-AT"]), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmark.catalog_generator import generate_catalog, generate_catalogs
+from src.localize_creater.parameter_tokenizer import placeholders
+
+
+class TestCatalogGenerator(unittest.TestCase):
+
+    def test_placeholder_density(self):
+        literal_catalog = generate_catalog(200, placeholder_density=0.0)
+        self.assertFalse(any(placeholders(value) for value in literal_catalog.values()))
+        parameter_catalog = generate_catalog(200, placeholder_density=1.0)
+        self.assertTrue(all(placeholders(value) for value in parameter_catalog.values()))
+
+    def test_generate_catalogs(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            language_codes = generate_catalogs(output_dir, keys=10, languages=3)
+            self.assertEqual(language_codes[0], "en")
+            self.assertEqual(len(language_codes), 3)
+            self.assertEqual(sorted(os.listdir(output_dir)),
+                             sorted(f"sample_{lang_code}.json" for lang_code in language_codes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.build_stats import BuildStats
+from src.localize_creater.catalog_loader import discover_catalog_files, load_catalog_files, read_catalog_files
+
+
+class TestCatalogLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.input_dir = tempfile.TemporaryDirectory()
+        files = {
+            "sample_en.json": '{"title": "Hello"}',
+            "sample_ja.json": '{"title": "こんにちは"}',
+            "sample_en_unified.json": '{"title": "Hello %1$s"}',
+            "notes.json": '{}',
+        }
+        for name, content in files.items():
+            with open(f"{self.input_dir.name}/{name}", "w", encoding="utf-8") as f:
+                f.write(content)
+
+    def tearDown(self):
+        self.input_dir.cleanup()
+
+    def test_discover_catalog_files(self):
+        paths = discover_catalog_files(self.input_dir.name, "_unified")
+        self.assertEqual(paths, {"en": os.path.join(self.input_dir.name, "sample_en_unified.json")})
+        self.assertIn("ja", discover_catalog_files(self.input_dir.name))
+        self.assertNotIn("notes", discover_catalog_files(self.input_dir.name))
+
+    def test_read_catalog_files(self):
+        stats = BuildStats()
+        paths = discover_catalog_files(self.input_dir.name)
+        contents = read_catalog_files({"ja": paths["ja"], "en": paths["en"]}, stats)
+        self.assertEqual(list(contents), ["ja", "en"])
+        self.assertEqual(contents["ja"], '{"title": "こんにちは"}'.encode("utf-8"))
+        self.assertGreater(stats.get("source", "ja")["load"], 0)
+
+    def test_load_catalog_files(self):
+        catalogs = load_catalog_files(self.input_dir.name, ["ja", "de", "en"])
+        self.assertEqual(catalogs, {"ja": {"title": "こんにちは"}, "en": {"title": "Hello"}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import pickle
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.catalog import Catalog
+
+
+class TestCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.en = {"title": "Hello", "greeting": "Hi %1$s", "farewell": "Bye"}
+        self.ja = {"farewell": "さようなら", "title": "こんにちは"}
+        self.catalog = Catalog()
+        self.catalog.add_language("en", self.en)
+        self.catalog.add_language("ja", self.ja)
+
+    def test_languages_keep_their_key_order(self):
+        self.assertEqual(list(self.catalog), ["en", "ja"])
+        self.assertEqual(list(self.catalog["en"].items()), list(self.en.items()))
+        self.assertEqual(list(self.catalog["ja"].items()), list(self.ja.items()))
+        self.assertEqual(list(self.catalog["ja"].values()), list(self.ja.values()))
+
+    def test_lookup(self):
+        ja = self.catalog["ja"]
+        self.assertEqual(len(ja), 2)
+        self.assertEqual(ja["title"], "こんにちは")
+        self.assertNotIn("greeting", ja)
+        self.assertIsNone(ja.get("greeting"))
+        with self.assertRaises(KeyError):
+            ja["missing"]
+        self.assertNotIn("de", self.catalog)
+
+    def test_keys_are_shared(self):
+        self.catalog.add_language("de", {"title": "Hallo", "extra": "Mehr"})
+        self.assertEqual(self.catalog.key_count, 4)
+        # "farewell" is stored once for all languages
+        self.assertIs(list(self.catalog["ja"])[0], list(self.catalog["en"])[2])
+        # Languages added before the index grew are unaffected
+        self.assertEqual(dict(self.catalog["en"]), self.en)
+
+    def test_values_are_deduplicated(self):
+        de = {"title": " ".join(["Hallo", "Welt"]), "farewell": "Tschüss"}
+        de_at = {"title": " ".join(["Hallo", "Welt"]), "farewell": "Baba"}
+        self.assertIsNot(de["title"], de_at["title"])
+        self.catalog.add_language("de", de)
+        self.catalog.add_language("de-AT", de_at)
+        self.assertIs(self.catalog["de"]["title"], self.catalog["de-AT"]["title"])
+        self.assertEqual(self.catalog.pool.duplicate_values, 1)
+        self.assertGreater(self.catalog.pool.saved_bytes, 0)
+
+    def test_pickles_as_dict(self):
+        restored = pickle.loads(pickle.dumps(self.catalog["ja"]))
+        self.assertIs(type(restored), dict)
+        self.assertEqual(list(restored.items()), list(self.ja.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.cli.cli import main
+from src.localize_creater.localize_creater import PLATFORM_LIST, LocalizeCreater
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestCli(unittest.TestCase):
+
+    def test_build_is_the_default_command(self):
+        builds = []
+
+        def create_all(localize_creater, platforms):
+            builds.append((localize_creater.sdk, platforms))
+
+        with mock.patch.object(LocalizeCreater, "create_all", autospec=True, side_effect=create_all):
+            self.assertEqual(main([]), 0)
+            self.assertEqual(main(["--platform", "android", "--sdk", "flutter"]), 0)
+        self.assertEqual(builds, [("xcode", PLATFORM_LIST), ("flutter", ["android"])])
+
+    def test_build_writes_android_output(self):
+        with tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["--input-dir", SAMPLE_DATA_DIR, "--output-dir", output_dir,
+                                   "--platform", "android"]), 0)
+            self.assertTrue(os.path.exists(f"{output_dir}/android/values-ja/strings.xml"))
+
+    def test_invalid_sdk(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["build", "--sdk", "ios"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.locale_code.code_list import code_list
+from src.locale_code.code_map import canonicalize, code_map, code_set, filter_language_codes
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+
+
+class TestCodeMap(unittest.TestCase):
+
+    def test_every_code_is_its_own_canonical_form(self):
+        self.assertEqual(len(code_map), len(code_list))
+        for code in code_list:
+            self.assertIn(code, code_set)
+            self.assertEqual(canonicalize(code), code)
+
+    def test_canonicalize_ignores_case_and_separator(self):
+        self.assertEqual(canonicalize("EN-us"), "en-US")
+        self.assertEqual(canonicalize("zh_hant_tw"), "zh-Hant-TW")
+        self.assertEqual(canonicalize("es_419"), "es-419")
+        self.assertIsNone(canonicalize("xx-YY"))
+
+    def test_filter_language_codes(self):
+        valid, invalid = filter_language_codes(["ja", "EN_us", "en-US", "klingon", "de"])
+        self.assertEqual(valid, ["ja", "en-US", "de"])
+        self.assertEqual(invalid, ["klingon"])
+
+    def test_builder_keeps_only_valid_codes(self):
+        builder = LocalizeCreaterBuilder().set_base_language_code("EN")
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            localize_creater = builder.set_language_code_list(["JA", "pt_br", "klingon"]).build()
+        self.assertEqual(localize_creater.base_language_code, "en")
+        self.assertEqual(localize_creater.target_language_code_list, ["ja", "pt-BR"])
+        self.assertIn("Invalid language code: klingon", output.getvalue())
+        with self.assertRaises(ValueError):
+            builder.set_base_language_code("klingon")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.compiled_catalog import CompiledCatalog, compile_catalog
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestCompiledCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.path = f"{self.work_dir.name}/catalog.lkc"
+        self.catalogs = Catalog()
+        self.catalogs.add_language("en", {"title": "Hello", "greeting": "Hi %1$s", "farewell": "Bye"})
+        self.catalogs.add_language("ja", {"farewell": "さようなら", "title": "こんにちは"})
+        compile_catalog(self.path, self.catalogs)
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def test_round_trip(self):
+        with CompiledCatalog(self.path) as compiled:
+            self.assertEqual(list(compiled), ["en", "ja"])
+            self.assertEqual(compiled.key_count, 3)
+            for lang_code in ["en", "ja"]:
+                self.assertEqual(list(compiled[lang_code].items()), list(self.catalogs[lang_code].items()))
+
+    def test_lookup(self):
+        with CompiledCatalog(self.path) as compiled:
+            ja = compiled["ja"]
+            self.assertEqual(ja["title"], "こんにちは")
+            self.assertEqual(bytes(ja.lookup_bytes("farewell")), "さようなら".encode("utf-8"))
+            self.assertNotIn("greeting", ja)
+            self.assertIsNone(ja.get("missing"))
+            compiled.decode_keys()
+            self.assertEqual(compiled["en"]["greeting"], "Hi %1$s")
+            self.assertNotIn("missing", compiled["en"])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b'{"title": "Hello"}')
+        with self.assertRaises(ValueError):
+            CompiledCatalog(self.path)
+
+    def test_build_from_compiled_catalog(self):
+        localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["ja", "ar", "de"])
+            .set_base_language_code("en")
+            .set_input_dir(SAMPLE_DATA_DIR)
+            .set_output_dir(f"{self.work_dir.name}/json")
+            .build()
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            localize_creater.create_all()
+            localize_creater.compiled_catalog_path = localize_creater.compile_catalogs()
+            localize_creater.output_dir = f"{self.work_dir.name}/compiled"
+            localize_creater.create_all()
+        for path in ["android/values-ar/strings.xml", "dart/app_de.arb", "xcode/Localizable.xcstrings",
+                     "javascript/LocalizedStrings.js"]:
+            with open(f"{self.work_dir.name}/json/{path}", "rb") as f, \
+                    open(f"{self.work_dir.name}/compiled/{path}", "rb") as g:
+                self.assertEqual(f.read(), g.read())
+
+    def test_builds_close_the_compiled_catalog(self):
+        localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["ja"])
+            .set_base_language_code("en")
+            .set_output_dir(self.work_dir.name)
+            .set_compiled_catalog_path(self.path)
+            .set_verbose(False)
+            .build()
+        )
+        builds = [
+            localize_creater.create_all,
+            lambda: asyncio.run(localize_creater.create_all_async()),
+            localize_creater.create_android,
+            localize_creater.create_flutter,
+            localize_creater.create_xcode,
+            localize_creater.create_react,
+        ]
+        for build in builds:
+            with mock.patch.object(CompiledCatalog, "close", autospec=True,
+                                   side_effect=CompiledCatalog.close) as close:
+                build()
+            self.assertEqual(close.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
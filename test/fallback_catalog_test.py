@@ -0,0 +1,138 @@
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import orjson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.locale_code.fallback import fallback_chain, parent_map
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.fallback_catalog import FallbackCatalogs
+from src.localize_creater.localize_creater import LocalizeCreater
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+
+
+class TestFallbackChain(unittest.TestCase):
+
+    def test_parents(self):
+        self.assertEqual(parent_map["az-Latn-AZ"], "az-Latn")
+        self.assertEqual(parent_map["en-AU"], "en-001")
+        self.assertEqual(parent_map["en-150"], "en-001")
+        self.assertEqual(parent_map["es-MX"], "es-419")
+        self.assertEqual(parent_map["pt-AO"], "pt-PT")
+        self.assertEqual(parent_map["en-US"], "en")
+        self.assertIsNone(parent_map["de"])
+
+    def test_chain_ends_with_base_language(self):
+        self.assertEqual(fallback_chain("en-AT", "en"), ("en-AT", "en-150", "en-001", "en"))
+        self.assertEqual(fallback_chain("de-AT", "en"), ("de-AT", "de", "en"))
+        self.assertEqual(fallback_chain("de-AT"), ("de-AT", "de"))
+
+
+class TestFallbackCatalogs(unittest.TestCase):
+
+    def setUp(self):
+        self.sources = Catalog()
+        self.sources.add_language("en", {"title": "Hello", "color": "color", "size": "size"})
+        self.sources.add_language("en-001", {"color": "colour"})
+        self.sources.add_language("en-AU", {"title": "G'day", "slang": "arvo"})
+        self.sources.add_language("de", {"title": "Hallo"})
+
+    def test_merges_up_the_chain(self):
+        catalogs = FallbackCatalogs(self.sources, "en")
+        self.assertEqual(dict(catalogs["en-AU"].items()),
+                         {"title": "G'day", "color": "colour", "size": "size", "slang": "arvo"})
+        self.assertEqual(dict(catalogs["de"].items()), {"title": "Hallo", "color": "color", "size": "size"})
+        self.assertEqual(dict(catalogs["de-CH"].items()), dict(catalogs["de"].items()))
+        self.assertIs(catalogs["en"], self.sources["en"])
+
+    def test_siblings_reuse_the_merged_parent(self):
+        catalogs = FallbackCatalogs(self.sources, "en")
+        with mock.patch.object(Catalog, "add_language", autospec=True,
+                               side_effect=Catalog.add_language) as add_language:
+            for lang_code in ["en-AU", "en-NZ", "en-GB", "en-IE"]:
+                catalogs[lang_code]
+        merged = [call.args[1] for call in add_language.call_args_list]
+        self.assertEqual(merged, ["en-001", "en-AU"])
+        self.assertIs(catalogs["en-NZ"], catalogs["en-001"])
+        self.assertEqual(catalogs.chain_sources("en-NZ"), ["en-001", "en"])
+
+
+class TestFallbackBuild(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        input_dir = f"{self.temp_dir.name}/input"
+        os.makedirs(input_dir)
+        for lang_code, catalog in [("en", {"greeting": "Hello", "farewell": "Bye"}),
+                                   ("en-001", {"farewell": "Cheerio"}),
+                                   ("en-AU", {"greeting": "G'day"})]:
+            with open(f"{input_dir}/sample_{lang_code}.json", "wb") as f:
+                f.write(orjson.dumps(catalog))
+        self.localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["en-AU", "en-NZ"])
+            .set_base_language_code("en")
+            .set_input_dir(input_dir)
+            .set_output_dir(self.temp_dir.name)
+            .set_fallback(True)
+            .set_verbose(False)
+            .build()
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _read_arb(self, output_dir, lang_code):
+        with open(f"{output_dir}/dart/app_{lang_code}.arb", "rb") as f:
+            return orjson.loads(f.read())
+
+    def test_regional_overrides_are_materialized(self):
+        self.localize_creater.create_all(["flutter"])
+        arb = self._read_arb(self.temp_dir.name, "en-AU")
+        self.assertEqual((arb["greeting"], arb["farewell"]), ("G'day", "Cheerio"))
+        arb = self._read_arb(self.temp_dir.name, "en-NZ")
+        self.assertEqual((arb["greeting"], arb["farewell"]), ("Hello", "Cheerio"))
+
+    def test_incremental_build_rewrites_outputs_when_fallback_is_toggled(self):
+        self.localize_creater.target_language_code_list = ["en-001", "en-AU"]
+        self.localize_creater.incremental = True
+        combined_paths = [f"{self.temp_dir.name}/xcode/Localizable.xcstrings",
+                          f"{self.temp_dir.name}/javascript/LocalizedStrings.js"]
+        contents = {}
+        for fallback in [False, True, False]:
+            self.localize_creater.fallback = fallback
+            self.localize_creater.create_all()
+            for path in combined_paths:
+                with open(path, "rb") as f:
+                    contents.setdefault(path, []).append(f.read())
+        for path in combined_paths:
+            without_fallback, with_fallback, without_fallback_again = contents[path]
+            self.assertNotEqual(without_fallback, with_fallback)
+            self.assertEqual(without_fallback, without_fallback_again)
+
+    def test_async_build_loads_chains_off_the_event_loop(self):
+        self.localize_creater.create_all(["flutter"])
+        loop_thread = threading.current_thread()
+        load_threads = []
+        original_load_catalog = LocalizeCreater.load_catalog
+
+        def load_catalog(localize_creater, language_code, *args, **kwargs):
+            load_threads.append((language_code, threading.current_thread()))
+            return original_load_catalog(localize_creater, language_code, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as async_output_dir:
+            self.localize_creater.output_dir = async_output_dir
+            with mock.patch.object(LocalizeCreater, "load_catalog", autospec=True, side_effect=load_catalog):
+                asyncio.run(self.localize_creater.create_all_async(["flutter"], max_in_flight=2))
+            self.assertEqual(sorted(lang_code for lang_code, _ in load_threads), ["en", "en-001", "en-AU"])
+            self.assertNotIn(loop_thread, [thread for _, thread in load_threads])
+            for lang_code in ["en", "en-AU", "en-NZ"]:
+                self.assertEqual(self._read_arb(async_output_dir, lang_code),
+                                 self._read_arb(self.temp_dir.name, lang_code))
+
+
+if __name__ == "__main__":
+    unittest.main()
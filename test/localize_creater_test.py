@@ -0,0 +1,209 @@
+import asyncio
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+import orjson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.localize_creater import LocalizeCreater
+from src.localize_creater.localize_creater_builder import LocalizeCreaterBuilder
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestLocalizeCreater(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.localize_creater = (
+            LocalizeCreaterBuilder()
+            .set_language_code_list(["ja", "ar", "de"])
+            .set_base_language_code("en")
+            .set_sdk("xcode")
+            .set_input_dir(SAMPLE_DATA_DIR)
+            .set_output_dir(self.output_dir.name)
+            .build()
+        )
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+
+    def _run_quietly(self, func, *args, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func(*args, **kwargs)
+
+    def test_create_all_parses_each_catalog_once(self):
+        with mock.patch.object(LocalizeCreater, "load_catalog", autospec=True,
+                               side_effect=LocalizeCreater.load_catalog) as load_catalog:
+            self._run_quietly(self.localize_creater.create_all)
+        loaded = [call.args[1] for call in load_catalog.call_args_list]
+        self.assertEqual(loaded, ["en", "ja", "ar", "de"])
+
+        output_dir = self.output_dir.name
+        self.assertTrue(os.path.exists(f"{output_dir}/android/strings.xml"))
+        self.assertTrue(os.path.exists(f"{output_dir}/android/values-ja/strings.xml"))
+        self.assertTrue(os.path.exists(f"{output_dir}/dart/app_de.arb"))
+        self.assertTrue(os.path.exists(f"{output_dir}/xcode/Localizable.xcstrings"))
+        self.assertTrue(os.path.exists(f"{output_dir}/javascript/LocalizedStrings.js"))
+
+    def test_create_all_selected_platforms(self):
+        self._run_quietly(self.localize_creater.create_all, ["flutter"])
+        self.assertEqual(os.listdir(self.output_dir.name), ["dart"])
+
+    def test_jobs_output_matches_serial(self):
+        self._run_quietly(self.localize_creater.create_all, ["android", "flutter"])
+        with tempfile.TemporaryDirectory() as parallel_output_dir:
+            self.localize_creater.output_dir = parallel_output_dir
+            self.localize_creater.jobs = 2
+            self._run_quietly(self.localize_creater.create_all, ["android", "flutter"])
+            for path in ["android/strings.xml", "android/values-ar/strings.xml", "dart/app_ja.arb"]:
+                with open(f"{self.output_dir.name}/{path}", "rb") as f, open(f"{parallel_output_dir}/{path}", "rb") as g:
+                    self.assertEqual(f.read(), g.read())
+
+    def test_create_all_async_matches_create_all(self):
+        self._run_quietly(self.localize_creater.create_all)
+        with tempfile.TemporaryDirectory() as async_output_dir:
+            self.localize_creater.output_dir = async_output_dir
+            self.localize_creater.verbose = False
+            with mock.patch("builtins.print") as print_mock:
+                stats = asyncio.run(self.localize_creater.create_all_async(max_in_flight=2))
+            print_mock.assert_not_called()
+            self.assertEqual(stats.totals("source")["strings"], 134)
+            for path in ["android/values-ar/strings.xml", "dart/app_ja.arb", "xcode/Localizable.xcstrings",
+                         "javascript/LocalizedStrings.js"]:
+                with open(f"{self.output_dir.name}/{path}", "rb") as f, open(f"{async_output_dir}/{path}", "rb") as g:
+                    self.assertEqual(f.read(), g.read())
+
+    def test_create_all_async_waits_for_every_language_before_closing(self):
+        self.localize_creater.verbose = False
+        events = []
+        original_render = LocalizeCreater.render_flutter_language
+
+        def render_flutter_language(localize_creater, language_code, data, stats=None):
+            if language_code == "ja":
+                raise ValueError("Cannot render ja")
+            if language_code == "de":
+                time.sleep(0.2)
+                events.append("rendered de")
+            return original_render(localize_creater, language_code, data, stats)
+
+        with mock.patch.object(LocalizeCreater, "render_flutter_language", autospec=True,
+                               side_effect=render_flutter_language), \
+                mock.patch.object(LocalizeCreater, "_close_catalogs", autospec=True,
+                                  side_effect=lambda localize_creater, catalogs: events.append("closed")):
+            with self.assertRaises(ValueError):
+                asyncio.run(self.localize_creater.create_all_async(["flutter"], max_in_flight=4))
+        self.assertEqual(events, ["rendered de", "closed"])
+
+    def test_incremental_build_skips_unchanged_outputs(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            for lang_code in ["en", "ja", "ar", "de"]:
+                shutil.copy(f"{SAMPLE_DATA_DIR}/sample_{lang_code}.json", input_dir)
+            self.localize_creater.input_dir = input_dir
+            self.localize_creater.incremental = True
+            self._run_quietly(self.localize_creater.create_all)
+
+            with mock.patch.object(LocalizeCreater, "load_catalog", autospec=True,
+                                   side_effect=LocalizeCreater.load_catalog) as load_catalog:
+                self._run_quietly(self.localize_creater.create_all)
+            self.assertEqual(load_catalog.call_count, 0)
+
+            with open(f"{input_dir}/sample_ja.json", "wb") as f:
+                f.write(b'{"greeting": "Konnichiwa"}')
+            with mock.patch.object(LocalizeCreater, "load_catalog", autospec=True,
+                                   side_effect=LocalizeCreater.load_catalog) as load_catalog:
+                self._run_quietly(self.localize_creater.create_all, ["android", "flutter"])
+            self.assertEqual([call.args[1] for call in load_catalog.call_args_list], ["ja"])
+            with open(f"{self.output_dir.name}/android/values-ja/strings.xml") as f:
+                self.assertIn("Konnichiwa", f.read())
+
+    def test_watch_rebuilds_changed_language(self):
+        with tempfile.TemporaryDirectory() as input_dir:
+            for lang_code in ["en", "ja", "ar", "de"]:
+                shutil.copy(f"{SAMPLE_DATA_DIR}/sample_{lang_code}.json", input_dir)
+            self.localize_creater.input_dir = input_dir
+            self.localize_creater.verbose = False
+            builds = []
+            build_stats = []
+            stop_event = threading.Event()
+
+            def on_build(changed, stats):
+                builds.append(changed)
+                build_stats.append(stats)
+                if len(builds) == 1:
+                    os.utime(f"{self.output_dir.name}/android/strings.xml", ns=(1_000_000_000, 1_000_000_000))
+                    with open(f"{input_dir}/sample_ja.json", "wb") as f:
+                        f.write(b'{"greeting": "Konnichiwa"}')
+                else:
+                    stop_event.set()
+
+            watcher = threading.Thread(target=self.localize_creater.watch,
+                                       kwargs={"interval": 0.01, "stop_event": stop_event, "on_build": on_build})
+            watcher.start()
+            watcher.join(timeout=10)
+            self.assertFalse(watcher.is_alive())
+            self.assertEqual(builds, [["en", "ja", "ar", "de"], ["ja"]])
+            self.assertEqual(build_stats[0].get("source", "en")["strings"], 36)
+            self.assertEqual(build_stats[1].get("source", "ja")["strings"], 1)
+            self.assertGreater(build_stats[1].get("source", "ja")["parse"], 0)
+            self.assertEqual(build_stats[1].get("source", "en")["strings"], 0)
+            self.assertEqual(os.stat(f"{self.output_dir.name}/android/strings.xml").st_mtime_ns, 1_000_000_000)
+            with open(f"{self.output_dir.name}/android/values-ja/strings.xml") as f:
+                self.assertIn("Konnichiwa", f.read())
+            with open(f"{self.output_dir.name}/javascript/LocalizedStrings.js") as f:
+                self.assertIn("Konnichiwa", f.read())
+
+    def test_create_all_returns_build_stats(self):
+        stats_path = f"{self.output_dir.name}/stats.json"
+        self.localize_creater.stats_path = stats_path
+        stats = self._run_quietly(self.localize_creater.create_all)
+
+        source = stats.get("source", "en")
+        self.assertEqual(source["strings"], 36)
+        self.assertEqual(source["placeholders"], 9)
+        self.assertGreater(source["parse"], 0)
+        android = stats.get("android", "ja")
+        self.assertEqual(android["bytes_written"],
+                         os.path.getsize(f"{self.output_dir.name}/android/values-ja/strings.xml"))
+        self.assertGreater(stats.get("xcode", "*")["serialize"], 0)
+        self.assertGreater(stats.wall_time, 0)
+        self.assertGreater(stats.cache_hits + stats.cache_misses, 0)
+        with open(stats_path, "rb") as f:
+            self.assertEqual(orjson.loads(f.read())["totals"]["android"]["strings"],
+                             stats.totals("source")["strings"])
+
+    def test_source_stats_match_for_every_source_type(self):
+        json_stats = self._run_quietly(self.localize_creater.create_all)
+        compiled_path = self._run_quietly(self.localize_creater.compile_catalogs)
+        packed_path = f"{self.output_dir.name}/catalogs.jsonl"
+        self._run_quietly(self.localize_creater.pack_catalogs, packed_path)
+        for attribute, path in [("compiled_catalog_path", compiled_path), ("packed_catalog_path", packed_path)]:
+            with mock.patch.object(self.localize_creater, attribute, path):
+                stats = self._run_quietly(self.localize_creater.create_all)
+            for lang_code in ["en", "ja", "ar", "de"]:
+                for counter in ["strings", "placeholders"]:
+                    self.assertEqual(stats.get("source", lang_code)[counter],
+                                     json_stats.get("source", lang_code)[counter])
+
+    def test_unchanged_outputs_are_not_rewritten(self):
+        self._run_quietly(self.localize_creater.create_all)
+        output_path = f"{self.output_dir.name}/xcode/Localizable.xcstrings"
+        os.utime(output_path, ns=(1_000_000_000, 1_000_000_000))
+        stats = self._run_quietly(self.localize_creater.create_all)
+        self.assertEqual(os.stat(output_path).st_mtime_ns, 1_000_000_000)
+        self.assertEqual(stats.totals()["bytes_written"], 0)
+        self.assertEqual(stats.totals()["unchanged_outputs"], 4 + 4 + 1 + 1)
+
+    def test_create_all_invalid_platform(self):
+        with self.assertRaises(ValueError):
+            self.localize_creater.create_all(["web"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.output_writer import AtomicOutput, write_if_changed
+
+
+class TestOutputWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.path = f"{self.output_dir.name}/values-ja/strings.xml"
+
+    def tearDown(self):
+        self.output_dir.cleanup()
+
+    def _set_old_mtime(self):
+        os.utime(self.path, ns=(1_000_000_000, 1_000_000_000))
+
+    def test_write_if_changed(self):
+        self.assertTrue(write_if_changed(self.path, "こんにちは"))
+        self._set_old_mtime()
+        self.assertFalse(write_if_changed(self.path, "こんにちは".encode("utf-8")))
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 1_000_000_000)
+
+        self.assertTrue(write_if_changed(self.path, b"changed"))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"changed")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["strings.xml"])
+
+    def test_atomic_output(self):
+        with AtomicOutput(self.path, text=True) as f:
+            f.write("<resources/>\n")
+        self._set_old_mtime()
+
+        output = AtomicOutput(self.path, text=True)
+        with output as f:
+            f.write("<resources/>\n")
+        self.assertFalse(output.changed)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, 1_000_000_000)
+
+        output = AtomicOutput(self.path)
+        with output as f:
+            f.write(b"<resources></resources>\n")
+        self.assertTrue(output.changed)
+        self.assertEqual(output.size, 24)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["strings.xml"])
+
+    def test_atomic_output_error_keeps_target(self):
+        write_if_changed(self.path, b"old")
+        with self.assertRaises(RuntimeError):
+            with AtomicOutput(self.path) as f:
+                f.write(b"partial")
+                raise RuntimeError("serializer failed")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["strings.xml"])
+
+
+if __name__ == '__main__':
+    unittest.main()
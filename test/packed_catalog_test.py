@@ -0,0 +1,69 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+import orjson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.catalog import Catalog
+from src.localize_creater.packed_catalog import (
+    iter_packed_rows, load_packed_catalog, pack_catalog_files, unpack_catalog_file, write_packed_catalog,
+)
+
+SAMPLE_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+class TestPackedCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.path = f"{self.work_dir.name}/catalogs.jsonl"
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def test_write_and_load(self):
+        catalogs = Catalog()
+        catalogs.add_language("en", {"title": "Hello", "farewell": "Bye"})
+        catalogs.add_language("ja", {"farewell": "さようなら", "extra": "もっと"})
+        catalogs.add_language("de", {"extra": "mehr", "title": "Hallo"})
+        write_packed_catalog(self.path, catalogs)
+        with open(self.path, "rb") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(orjson.loads(lines[0])["orders"], {"de": [2, 0]})
+        self.assertEqual(orjson.loads(lines[1]), ["title", "Hello", None, "Hallo"])
+        self.assertEqual(orjson.loads(lines[3]), ["extra", None, "もっと", "mehr"])
+
+        loaded = load_packed_catalog(self.path)
+        self.assertEqual(list(loaded), ["en", "ja", "de"])
+        for lang_code in ["en", "ja", "de"]:
+            self.assertEqual(list(loaded[lang_code].items()), list(catalogs[lang_code].items()))
+
+    def test_pack_and_unpack_sample_data(self):
+        language_codes = pack_catalog_files(SAMPLE_DATA_DIR, self.path, ["en", "ja", "ar", "de"])
+        self.assertEqual(language_codes, ["en", "ja", "ar", "de"])
+        paths = unpack_catalog_file(self.path, f"{self.work_dir.name}/unpacked")
+        self.assertEqual(len(paths), 4)
+        for lang_code in language_codes:
+            with open(f"{SAMPLE_DATA_DIR}/sample_{lang_code}.json", "rb") as f, \
+                    open(f"{self.work_dir.name}/unpacked/sample_{lang_code}.json", "rb") as g:
+                self.assertEqual(list(orjson.loads(f.read()).items()), list(orjson.loads(g.read()).items()))
+
+    def test_invalid_files(self):
+        with self.assertRaises(ValueError):
+            iter_packed_rows(io.BytesIO(b'{"title": "Hello"}\n'))
+        header = b'{"format":"localize-kitchen-packed","version":1,"languages":["en","ja"]}\n'
+        _, _, rows = iter_packed_rows(io.BytesIO(header + b'["title","Hello"]\n'))
+        with self.assertRaises(ValueError):
+            list(rows)
+        _, _, rows = iter_packed_rows(io.BytesIO(header + b'["title","Hello",null]\n["title","Hi",null]\n'))
+        with self.assertRaises(ValueError):
+            Catalog().add_rows(["en", "ja"], rows)
+        rows = [["title", "Hello", None], ["farewell", "Bye", "さようなら"]]
+        for row_order in [[0], [1, 1], [1, 2], [1, -1], [0, 1]]:
+            with self.assertRaises(ValueError):
+                Catalog().add_rows(["en", "ja"], rows, {"en": [1, 0], "ja": row_order})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.parameter_converter import (
+    clear_conversion_cache, conversion_cache_info, convert_catalog, get_converter,
+)
+from src.localize_creater.parameter_tokenizer import Placeholder, placeholders, tokenize
+
+
+class TestParameterConverter(unittest.TestCase):
+
+    def test_android(self):
+        text = "Hello %1$s, you have %2$d messages"
+        self.assertEqual(get_converter('android').convert(text), text)
+
+    def test_flutter(self):
+        self.assertEqual(
+            get_converter('flutter').convert("Today is %1$s, %2$s %3$d"),
+            "Today is {param1}, {param2} {param3}",
+        )
+        self.assertEqual(get_converter('flutter').convert("Price: $%1$.2f"), "Price: ${param1}")
+
+    def test_xcode(self):
+        self.assertEqual(
+            get_converter('xcode').convert("Hello %1$s, %2$d items for %3$.2f"),
+            "Hello %@, %@ items for %@",
+        )
+
+    def test_react(self):
+        self.assertEqual(
+            get_converter('react').convert("Hello %1$s, you have %2$d messages from %3$s"),
+            "Hello {0}, you have {1} messages from {2}",
+        )
+        self.assertEqual(get_converter('react').convert("Price: %1$.2f"), "Price: {0}")
+
+    def test_unknown_platform_keeps_text(self):
+        self.assertEqual(get_converter('web').convert("Welcome, %1$s!"), "Welcome, %1$s!")
+
+    def test_conversion_cache(self):
+        clear_conversion_cache()
+        get_converter('flutter').convert("Welcome, %1$s!")
+        get_converter('flutter').convert("Welcome, %1$s!")
+        self.assertEqual(get_converter('react').convert("Welcome, %1$s!"), "Welcome, {0}!")
+        get_converter('react').convert("frog")
+        cache_info = conversion_cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 2))
+
+    def test_identity_platforms_skip_the_cache(self):
+        clear_conversion_cache()
+        catalog = {"greeting": "Hi %1$s, %2$d new"}
+        for platform in ['android', 'web']:
+            self.assertEqual(get_converter(platform).convert(catalog["greeting"]), catalog["greeting"])
+            self.assertEqual(convert_catalog(catalog, platform), catalog)
+        cache_info = conversion_cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.currsize), (0, 0, 0))
+
+    def test_text_without_parameters(self):
+        for platform in ['android', 'flutter', 'xcode', 'react']:
+            self.assertEqual(get_converter(platform).convert("100% sure"), "100% sure")
+
+    def test_convert_catalog(self):
+        catalog = {"title": "Hello", "greeting": "Hi %1$s, %2$d new", "price": "Price: %1$.2f"}
+        for platform in ['android', 'flutter', 'xcode', 'react', 'unknown']:
+            converted = convert_catalog(catalog, platform)
+            self.assertEqual(list(converted), list(catalog))
+            for key, value in catalog.items():
+                self.assertEqual(converted[key], get_converter(platform).convert(value))
+
+
+class TestParameterTokenizer(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(
+            tokenize("Price: $%1$.2f for %2$d"),
+            ("Price: $", Placeholder(1, 'f', 2, '%1$.2f'), " for ", Placeholder(2, 'd', None, '%2$d')),
+        )
+
+    def test_tokenize_literal(self):
+        self.assertEqual(tokenize("frog"), ("frog",))
+        self.assertEqual(tokenize(""), ())
+
+    def test_placeholders(self):
+        params = placeholders("Hello %1$s, you have %2$d messages from %3$s")
+        self.assertEqual([param.index for param in params], [1, 2, 3])
+        self.assertEqual([param.type for param in params], ['s', 'd', 's'])
+
+    def test_literal_braces_are_not_placeholders(self):
+        self.assertEqual(placeholders("Use {name} here"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
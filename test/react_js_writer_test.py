@@ -0,0 +1,61 @@
+import io
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.react_js_writer import write_react_js
+
+
+def joined_react_js(localization_data):
+    # The line-joining implementation the streaming writer replaces
+    js_lines = [
+        "import LocalizedStrings from 'react-native-localization';",
+        "",
+        "// CommonJS syntax",
+        "// let LocalizedStrings = require('react-native-localization');",
+        "",
+        "let strings = new LocalizedStrings({"
+    ]
+    for lang_code, lang_data in localization_data.items():
+        js_lines.append(f'  "{lang_code}": {{')
+        for key, value in lang_data.items():
+            escaped_value = value.replace('"', '\\"')
+            js_lines.append(f'    {key}: "{escaped_value}",')
+        if js_lines[-1].endswith(','):
+            js_lines[-1] = js_lines[-1][:-1]
+        js_lines.append('  },')
+    if js_lines[-1].endswith(','):
+        js_lines[-1] = js_lines[-1][:-1]
+    js_lines.extend([
+        "});",
+        "",
+        "export default strings;",
+        "",
+        "// Usage example:",
+        "// import strings from './LocalizedStrings';",
+        "// console.log(strings.greeting);",
+        "// console.log(strings.formatString(strings.welcome_message, ['John']));"
+    ])
+    return '\n'.join(js_lines).encode("utf-8")
+
+
+class TestReactJsWriter(unittest.TestCase):
+
+    def assertSameAsJoined(self, localization_data):
+        stream = io.BytesIO()
+        write_react_js(stream, localization_data)
+        self.assertEqual(stream.getvalue(), joined_react_js(localization_data))
+
+    def test_languages(self):
+        self.assertSameAsJoined({
+            "en": {"greeting": "Hello", "quote": 'Say "hi" to {0}'},
+            "ja": {"greeting": "こんにちは"},
+        })
+
+    def test_empty(self):
+        self.assertSameAsJoined({})
+        self.assertSameAsJoined({"en": {}, "ja": {"greeting": "こんにちは"}, "ar": {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import io
+import os
+import sys
+import unittest
+import orjson
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.localize_creater.xcstrings_writer import iter_xcstrings_entries, write_xcstrings
+
+
+def nested_xcstrings(language_codes, catalogs):
+    # The whole-document dict the streaming writer replaces
+    xcstrings_data = {"sourceLanguage": language_codes[0], "strings": {}, "version": "1.0"}
+    for lang_code in language_codes:
+        for key, value in catalogs[lang_code].items():
+            localizations = xcstrings_data["strings"].setdefault(key, {"localizations": {}})["localizations"]
+            localizations[lang_code] = {"stringUnit": {"state": "translated", "value": value}}
+    return orjson.dumps(xcstrings_data, option=orjson.OPT_INDENT_2)
+
+
+class TestXcstringsWriter(unittest.TestCase):
+
+    def assertSameAsNested(self, language_codes, catalogs):
+        stream = io.BytesIO()
+        entries = iter_xcstrings_entries(language_codes, catalogs, lambda value: value)
+        write_xcstrings(stream, language_codes[0], entries)
+        self.assertEqual(stream.getvalue(), nested_xcstrings(language_codes, catalogs))
+
+    def test_shared_keys(self):
+        self.assertSameAsNested(["en", "ja"], {
+            "en": {"greeting": "Hello", "frog": "frog"},
+            "ja": {"greeting": "こんにちは", "frog": "カエル"},
+        })
+
+    def test_keys_missing_from_base(self):
+        self.assertSameAsNested(["en", "ja", "de"], {
+            "en": {"greeting": "Hello"},
+            "ja": {"only_ja": "日本", "greeting": "こんにちは"},
+            "de": {"only_de": "Deutsch", "only_ja": "Japan"},
+        })
+
+    def test_escaping(self):
+        self.assertSameAsNested(["en"], {"en": {"quote\n\"key\"": "line\nbreak \"quoted\""}})
+
+    def test_empty(self):
+        self.assertSameAsNested(["en"], {"en": {}})
+
+    def test_convert_is_applied(self):
+        stream = io.BytesIO()
+        entries = iter_xcstrings_entries(["en"], {"en": {"greeting": "Hello"}}, str.upper)
+        write_xcstrings(stream, "en", entries)
+        self.assertIn(b'"value": "HELLO"', stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,24 +2,37 @@
 """
 Demo script showing how to use the translated JSON files
 """
-import orjson
 import os
+from src.localize_creater.catalog_loader import load_catalog_files
+from src.localize_creater.compiled_catalog import CompiledCatalog
+
+COMPILED_CATALOG_PATH = "sample_output/catalog.lkc"
 
 def load_translations():
-    """Load all translation files"""
-    translations = {}
-    
+    """Load all translation files, memory-mapping the compiled catalog when there is one"""
     # List of available languages
     languages = ['en', 'de', 'ar', 'ja']
+
+    if os.path.exists(COMPILED_CATALOG_PATH):
+        # Created by `python main.py compile`; opening it does not parse any JSON
+        compiled = CompiledCatalog(COMPILED_CATALOG_PATH)
+        translations = {}
+        for lang in languages:
+            if lang in compiled:
+                translations[lang] = compiled[lang]
+                print(f"✅ Loaded {lang.upper()} translations from {COMPILED_CATALOG_PATH}")
+        return translations
+
+    # Read all files concurrently and parse them straight from bytes
+    loaded = load_catalog_files("sample_data", languages)
+    translations = {}
     
     for lang in languages:
-        file_path = f"sample_data/sample_{lang}.json"
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                translations[lang] = orjson.loads(f.read())
-                print(f"✅ Loaded {lang.upper()} translations")
+        if lang in loaded:
+            translations[lang] = loaded[lang]
+            print(f"✅ Loaded {lang.upper()} translations")
         else:
-            print(f"❌ File not found: {file_path}")
+            print(f"❌ File not found: sample_data/sample_{lang}.json")
     
     return translations
 